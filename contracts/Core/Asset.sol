@@ -3,14 +3,29 @@
 pragma solidity ^0.8.17;
 
 import "@openzeppelin/contracts/token/ERC20/ERC20.sol";
+import "@openzeppelin/contracts/token/ERC20/extensions/ERC20Snapshot.sol";
 import "@openzeppelin/contracts/access/Ownable.sol";
 import {IIdentityRegistry} from "@T-REX/contracts/registry/interface/IIdentityRegistry.sol";
 import "./FORM.sol";
+import "./IPAYOUT.sol";
 
-contract Asset is ERC20, Ownable {
+contract Asset is ERC20, ERC20Snapshot, Ownable {
     IIdentityRegistry internal _tokenIdentityRegistry;
     // mapping(address => mapping(address => uint256)) internal _allowances;
-    address[] private tokenHolders;
+    address[] public tokenHolders;
+    // Maps a token holder to its 1-based position in tokenHolders (0 means absent)
+    mapping(address => uint256) private tokenHolderIndex;
+    // Set to the contract that settles claimable payouts whenever a token holder's balance changes
+    address public payoutLedger;
+    // Start of the first payment period that balance checkpoints are keyed by
+    uint256 public checkpointStartTime;
+    // Length of a payment period in seconds. Balance checkpoints are only recorded once this is set
+    uint256 public checkpointPeriod;
+    // Set once the asset is set up, by the constructor or by initialize() on a minimal proxy clone
+    bool public initialized;
+    // Name and symbol are kept here rather than in ERC20 so that clones can set their own
+    string private assetName;
+    string private assetSymbol;
 
     constructor(
         uint256 _initialSupply,
@@ -18,27 +33,143 @@ contract Asset is ERC20, Ownable {
         string memory _symbol,
         address _identityRegistry
     ) ERC20(_name, _symbol) {
+        setUp(_initialSupply, _name, _symbol, _identityRegistry, msg.sender);
+    }
+
+    // Initializer of minimal proxy clones, which never run the constructor
+    function initialize(
+        uint256 _initialSupply,
+        string memory _name,
+        string memory _symbol,
+        address _identityRegistry,
+        address _owner
+    ) external {
+        _transferOwnership(_owner);
+        setUp(_initialSupply, _name, _symbol, _identityRegistry, _owner);
+    }
+
+    function setUp(
+        uint256 _initialSupply,
+        string memory _name,
+        string memory _symbol,
+        address _identityRegistry,
+        address _owner
+    ) private {
+        require(!initialized, "Asset already initialized");
+        initialized = true;
+        assetName = _name;
+        assetSymbol = _symbol;
         _tokenIdentityRegistry = IIdentityRegistry(_identityRegistry);
-        _mint(msg.sender, _initialSupply);
+        _mint(_owner, _initialSupply);
+    }
+
+    function name() public view override returns (string memory) {
+        return assetName;
+    }
+
+    function symbol() public view override returns (string memory) {
+        return assetSymbol;
     }
 
     function tokenHolderExists(
         address _tokenHolder
     ) public view returns (bool, uint256) {
         require(_tokenHolder != address(0), "Null address");
-        for (uint256 i = 0; i < tokenHolders.length; i++) {
-            if (tokenHolders[i] == _tokenHolder) {
-                return (true, i);
-            }
+        uint256 position = tokenHolderIndex[_tokenHolder];
+        if (position == 0) {
+            return (false, 0);
+        }
+        return (true, position - 1);
+    }
+
+    function addTokenHolder(address _tokenHolder) internal {
+        if (tokenHolderIndex[_tokenHolder] == 0) {
+            tokenHolders.push(_tokenHolder);
+            tokenHolderIndex[_tokenHolder] = tokenHolders.length;
         }
-        return (false, 0);
     }
 
     function deleteTokenHolder(address _tokenHolder) internal {
-        (bool exists, uint256 index) = tokenHolderExists(_tokenHolder);
-        if (exists) {
-            tokenHolders[index] = tokenHolders[tokenHolders.length - 1];
+        uint256 position = tokenHolderIndex[_tokenHolder];
+        if (position != 0) {
+            uint256 lastPosition = tokenHolders.length;
+            if (position != lastPosition) {
+                address lastTokenHolder = tokenHolders[lastPosition - 1];
+                tokenHolders[position - 1] = lastTokenHolder;
+                tokenHolderIndex[lastTokenHolder] = position;
+            }
             tokenHolders.pop();
+            delete tokenHolderIndex[_tokenHolder];
+        }
+    }
+
+    function setPayoutLedger(address _payoutLedger) external onlyOwner {
+        payoutLedger = _payoutLedger;
+    }
+
+    function setCheckpointSchedule(
+        uint256 _startTime,
+        uint256 _period
+    ) external onlyOwner {
+        require(checkpointPeriod == 0, "Checkpoint schedule already set");
+        require(
+            _period > 0 && _startTime <= block.timestamp,
+            "Invalid checkpoint schedule"
+        );
+        checkpointStartTime = _startTime;
+        checkpointPeriod = _period;
+    }
+
+    function currentPaymentPeriod() public view returns (uint256) {
+        require(checkpointPeriod > 0, "Checkpoint schedule not set");
+        return (block.timestamp - checkpointStartTime) / checkpointPeriod;
+    }
+
+    // Returns the balance of the account at the start of the payment period. Falls back to the
+    // current balance while no checkpoint schedule is set
+    function balanceOfAt(
+        address _account,
+        uint256 _paymentPeriod
+    ) public view override returns (uint256) {
+        if (checkpointPeriod == 0) {
+            return balanceOf(_account);
+        }
+        return super.balanceOfAt(_account, _paymentPeriod + 1);
+    }
+
+    // Returns the total supply at the start of the payment period. Falls back to the current
+    // total supply while no checkpoint schedule is set
+    function totalSupplyAt(
+        uint256 _paymentPeriod
+    ) public view override returns (uint256) {
+        if (checkpointPeriod == 0) {
+            return totalSupply();
+        }
+        return super.totalSupplyAt(_paymentPeriod + 1);
+    }
+
+    // Snapshot ids are payment periods shifted by one, since ERC20Snapshot reserves id 0. The value recorded
+    // for an id is the balance before its first change in that period, i.e. the balance at the period's start
+    function _getCurrentSnapshotId() internal view override returns (uint256) {
+        if (checkpointPeriod == 0) {
+            return 0;
+        }
+        return (block.timestamp - checkpointStartTime) / checkpointPeriod + 1;
+    }
+
+    function _beforeTokenTransfer(
+        address _from,
+        address _to,
+        uint256 _amount
+    ) internal override(ERC20, ERC20Snapshot) {
+        super._beforeTokenTransfer(_from, _to, _amount);
+        if (payoutLedger != address(0)) {
+            if (_from != address(0)) {
+                IPAYOUT(payoutLedger).updatePayoutCheckpoint(_from);
+            }
+            if (_to != address(0)) {
+                IPAYOUT(payoutLedger).updatePayoutCheckpoint(_to);
+            }
         }
     }
 
@@ -59,9 +190,8 @@ contract Asset is ERC20, Ownable {
             if (balanceOf(msg.sender) == 0 && owner() != msg.sender) {
                 deleteTokenHolder(msg.sender);
             }
-            (bool exists, ) = tokenHolderExists(_to);
-            if (!exists && _to != owner()) {
-                tokenHolders.push(_to);
+            if (_to != owner()) {
+                addTokenHolder(_to);
             }
             return true;
         }
@@ -80,10 +210,7 @@ contract Asset is ERC20, Ownable {
             if (balanceOf(_from) == 0 && owner() != _from) {
                 deleteTokenHolder(_from);
             }
-            (bool exists, ) = tokenHolderExists(_to);
-            if (!exists) {
-                tokenHolders.push(_to);
-            }
+            addTokenHolder(_to);
             return true;
         }
         revert("Transfer not possible");
@@ -99,4 +226,26 @@ contract Asset is ERC20, Ownable {
     {
         return tokenHolders;
     }
+
+    function getTokenHolderCount() external view returns (uint256) {
+        return tokenHolders.length;
+    }
+
+    function getTokenHoldersInRange(
+        uint256 _start,
+        uint256 _count
+    ) external view returns (address[] memory) {
+        uint256 holderCount = tokenHolders.length;
+        if (_start >= holderCount) {
+            return new address[](0);
+        }
+        uint256 end = holderCount - _start > _count
+            ? _start + _count
+            : holderCount;
+        address[] memory range = new address[](end - _start);
+        for (uint256 i = _start; i < end; i++) {
+            range[i - _start] = tokenHolders[i];
+        }
+        return range;
+    }
 }
@@ -6,8 +6,10 @@ import "@openzeppelin/contracts/access/Ownable.sol";
 import {IERC20} from "@openzeppelin/contracts/token/ERC20/IERC20.sol";
 import {IIdentityRegistry} from "@T-REX/contracts/registry/interface/IIdentityRegistry.sol";
 import {Asset} from "./Asset.sol";
+import "./PAYOUT.sol";
+import {PaymentPeriods} from "./PaymentPeriods.sol";
 
-contract Equities is Ownable {
+contract Equities is Ownable, PAYOUT {
     ///////////////////
     // Errors /////////
     ///////////////////
@@ -64,6 +66,19 @@ contract Equities is Ownable {
     ///////////////////
     // Struct /////////
     ///////////////////
+    struct EquityOptions {
+        Redemption _redemptionState;
+        Income _incomeState;
+        PaymentFrequency _paymentFrequency;
+    }
+
+    struct EquityTerms {
+        uint256 _maturityDate;
+        address _paymentToken;
+        address _identityRegistry;
+        uint256 _price;
+        uint256 _incomeRate;
+    }
 
     ////////////////////
     // State Variables /
@@ -89,31 +104,31 @@ contract Equities is Ownable {
     uint256 public price;
     // Refers to the underlying token created during contract deployment
     Asset private asset;
+    // Set once the token is set up, by the constructor or by initialize() on a minimal proxy clone
+    bool public initialized;
     // Refers to the income rate of the token set during contract deployment. Can optionally be modified if income rate type is variable
     uint256 public incomeRate;
 
     ////////////////////
     // Constants ///////
     ///////////////////
-    uint256 private constant AVERAGE_SECONDS_IN_A_DAY = 86400;
-    uint256 private constant AVERAGE_SECONDS_IN_A_WEEK = 604800;
-    uint256 private constant AVERAGE_SECONDS_IN_SEMI_MONTH = 1209600;
-    uint256 private constant AVERAGE_SECONDS_IN_A_MONTH = 2629800; //2628288;
-    uint256 private constant AVERAGE_SECONDS_IN_A_YEAR = 31556952;
     uint256 private constant INTEREST_RATE_PRECISION = 1000;
-    uint256 private constant DAYS_IN_A_YEAR = 365;
-    uint256 private constant WEEKS_IN_A_YEAR = 52;
-    uint256 private constant SEMI_MONTHS_IN_A_YEAR = 24;
-    uint256 private constant MONTHS_IN_A_YEAR = 12;
-    uint256 private constant YEAR_IN_A_YEAR = 1;
     uint256 private constant PRECISION = 8;
     ///////////////////
     // Mappings ///////
     ///////////////////
     mapping(address => uint256) public conversionRate;
-    mapping(PaymentFrequency => uint256) private paymentFrequencyToSeconds;
-    mapping(address => mapping(uint256 => bool))
-        public investorToPaymentPeriodToStatus;
+    // Paid payment periods per investor, bit (period & 0xff) of word (period >> 8)
+    mapping(address => mapping(uint256 => uint256)) public paidPaymentPeriods;
+    ///////////////////
+    // Events /////////
+    ///////////////////
+    event IncomePaid(
+        address indexed investor,
+        uint256 indexed paymentPeriod,
+        uint256 amount,
+        address indexed paymentToken
+    );
     ///////////////////
     // Modifiers //////
     ///////////////////
@@ -248,39 +263,64 @@ contract Equities is Ownable {
         uint256 _incomeRate
     ) {
         asset = new Asset(_initialSupply, _name, _symbol, _identityRegistry);
-        redemptionState = _redemptionState;
-        incomeState = _incomeState;
-        paymentFrequency = _paymentFrequency;
-        paymentToken = _paymentToken;
-        identityRegistry = _identityRegistry;
-        price = _price;
-        incomeRate = _incomeRate;
+        setUp(
+            EquityOptions(_redemptionState, _incomeState, _paymentFrequency),
+            EquityTerms(
+                _maturityDate,
+                _paymentToken,
+                _identityRegistry,
+                _price,
+                _incomeRate
+            )
+        );
+    }
+
+    // Initializer of minimal proxy clones, which never run the constructor. The asset clone must already be
+    // initialized with this contract as its owner
+    function initialize(
+        address _asset,
+        address _owner,
+        EquityOptions memory options,
+        EquityTerms memory terms
+    ) external {
+        asset = Asset(_asset);
+        _transferOwnership(_owner);
+        setUp(options, terms);
+    }
+
+    function setUp(
+        EquityOptions memory options,
+        EquityTerms memory terms
+    ) private {
+        require(!initialized, "Token already initialized");
+        initialized = true;
+        redemptionState = options._redemptionState;
+        incomeState = options._incomeState;
+        paymentFrequency = options._paymentFrequency;
+        paymentToken = terms._paymentToken;
+        identityRegistry = terms._identityRegistry;
+        price = terms._price;
+        incomeRate = terms._incomeRate;
+        contractDeploymentTime = block.timestamp;
         if (
-            (_redemptionState != Redemption.EXCHANGEABLE &&
-                _redemptionState != Redemption.PERPETUAL) &&
-            (_paymentFrequency != PaymentFrequency.NONE)
+            (options._redemptionState != Redemption.EXCHANGEABLE &&
+                options._redemptionState != Redemption.PERPETUAL) &&
+            (options._paymentFrequency != PaymentFrequency.NONE)
         ) {
             require(
-                _maturityDate > block.timestamp,
+                terms._maturityDate > block.timestamp,
                 "Maturity/Buyback date should be greater than current time"
             );
-            maturityDate = _maturityDate;
+            maturityDate = terms._maturityDate;
+        }
+        if (options._paymentFrequency != PaymentFrequency.NONE) {
+            asset.setCheckpointSchedule(
+                contractDeploymentTime,
+                PaymentPeriods.secondsPerPeriod(
+                    uint8(options._paymentFrequency)
+                )
+            );
         }
-        paymentFrequencyToSeconds[
-            PaymentFrequency.DAILY
-        ] = AVERAGE_SECONDS_IN_A_DAY;
-        paymentFrequencyToSeconds[
-            PaymentFrequency.SEMIMONTHLY
-        ] = AVERAGE_SECONDS_IN_SEMI_MONTH;
-        paymentFrequencyToSeconds[
-            PaymentFrequency.WEEKLY
-        ] = AVERAGE_SECONDS_IN_A_WEEK;
-        paymentFrequencyToSeconds[
-            PaymentFrequency.MONTHLY
-        ] = AVERAGE_SECONDS_IN_A_MONTH;
-        paymentFrequencyToSeconds[
-            PaymentFrequency.ANNUALY
-        ] = AVERAGE_SECONDS_IN_A_YEAR;
     }
 
     function addExchangeableToken(
@@ -371,6 +411,7 @@ contract Equities is Ownable {
         public
         onlyOwner
         isPayable
+        isNotInClaimMode
         investorExists(_investor)
         isParticipating(_dividend)
     {
@@ -392,17 +433,21 @@ contract Equities is Ownable {
             IERC20(paymentToken).balanceOf(address(this)) >= payment,
             "You do not have sufficient balance to pay this investor!"
         );
-        uint256 duration = (block.timestamp - contractDeploymentTime) /
-            paymentFrequencyToSeconds[paymentFrequency];
+        uint256 duration = PaymentPeriods.periodAt(
+            contractDeploymentTime,
+            block.timestamp,
+            uint8(paymentFrequency)
+        );
         require(
-            !investorToPaymentPeriodToStatus[_investor][duration],
+            !investorToPaymentPeriodToStatus(_investor, duration),
             "The investor has already been paid for this payment period"
         );
         bool success = IERC20(paymentToken).transfer(_investor, payment);
         if (!success) {
             revert Token__ExchangeFailed();
         }
-        investorToPaymentPeriodToStatus[_investor][duration] = true;
+        markPaymentPeriodPaid(_investor, duration);
+        emit IncomePaid(_investor, duration, payment, paymentToken);
     }
 
     function payCumulativeIncome(
@@ -414,6 +459,7 @@ contract Equities is Ownable {
         onlyOwner
         isCumulative
         isPayable
+        isNotInClaimMode
         investorExists(_investor)
         isParticipating(_dividend)
     {
@@ -436,26 +482,30 @@ contract Equities is Ownable {
             "You do not have sufficient balance to pay this investor!"
         );
         require(
-            !investorToPaymentPeriodToStatus[_investor][_paymentPeriod],
+            !investorToPaymentPeriodToStatus(_investor, _paymentPeriod),
             "The investor has already been paid for this payment period"
         );
         bool success = IERC20(paymentToken).transfer(_investor, payment);
         if (!success) {
             revert Token__ExchangeFailed();
         }
-        investorToPaymentPeriodToStatus[_investor][_paymentPeriod] = true;
+        markPaymentPeriodPaid(_investor, _paymentPeriod);
+        emit IncomePaid(_investor, _paymentPeriod, payment, paymentToken);
     }
 
     function payIncomeToAll(
         uint256 _dividend
-    ) public onlyOwner isPayable isParticipating(_dividend) {
+    ) public onlyOwner isPayable isNotInClaimMode isParticipating(_dividend) {
         require(
             block.timestamp < maturityDate ||
                 redemptionState == Redemption.PERPETUAL,
             "Token has reached maturity"
         );
-        uint256 duration = (block.timestamp - contractDeploymentTime) /
-            paymentFrequencyToSeconds[paymentFrequency];
+        uint256 duration = PaymentPeriods.periodAt(
+            contractDeploymentTime,
+            block.timestamp,
+            uint8(paymentFrequency)
+        );
         address[] memory tokenHolders = asset.getTokenHolders();
         if (
             incomeState != Income.PARTICIPATING &&
@@ -472,7 +522,7 @@ contract Equities is Ownable {
         );
         uint256 payment;
         for (uint256 i = 0; i < tokenHolders.length; i++) {
-            if (!investorToPaymentPeriodToStatus[tokenHolders[i]][duration]) {
+            if (!investorToPaymentPeriodToStatus(tokenHolders[i], duration)) {
                 payment =
                     ((incomeRate *
                         INTEREST_RATE_PRECISION *
@@ -480,13 +530,45 @@ contract Equities is Ownable {
                         INTEREST_RATE_PRECISION) +
                     _dividend;
                 IERC20(paymentToken).transfer(tokenHolders[i], payment);
-                investorToPaymentPeriodToStatus[tokenHolders[i]][
-                    duration
-                ] = true;
+                markPaymentPeriodPaid(tokenHolders[i], duration);
+                emit IncomePaid(
+                    tokenHolders[i],
+                    duration,
+                    payment,
+                    paymentToken
+                );
             }
         }
     }
 
+    function enableClaimMode() public onlyOwner isPayable {
+        asset.setPayoutLedger(address(this));
+        startClaimMode();
+    }
+
+    // In claim mode the dividend of participating income is distributed per token rather than per token holder
+    function fundIncomePayment(
+        uint256 _dividend
+    ) public onlyOwner isPayable isParticipating(_dividend) {
+        require(
+            block.timestamp < maturityDate ||
+                redemptionState == Redemption.PERPETUAL,
+            "Token has reached maturity"
+        );
+        if (
+            incomeState != Income.PARTICIPATING &&
+            incomeState != Income.CUMULATIVE_PARTICIPATING
+        ) {
+            _dividend = 0;
+        }
+        uint256 duration = PaymentPeriods.periodAt(
+            contractDeploymentTime,
+            block.timestamp,
+            uint8(paymentFrequency)
+        );
+        fundPaymentPeriod(duration, incomeRate + _dividend);
+    }
+
     function updatePrice(uint256 _price) public onlyOwner isNonZero(_price) {
         price = _price;
     }
@@ -505,6 +587,19 @@ contract Equities is Ownable {
         return asset.totalSupply();
     }
 
+    function getBalanceAt(
+        address _user,
+        uint256 _paymentPeriod
+    ) public view returns (uint256) {
+        return asset.balanceOfAt(_user, _paymentPeriod);
+    }
+
+    function getTotalSupplyAt(
+        uint256 _paymentPeriod
+    ) public view returns (uint256) {
+        return asset.totalSupplyAt(_paymentPeriod);
+    }
+
     function getTokenHolders() public view returns (address[] memory) {
         return asset.getTokenHolders();
     }
@@ -520,4 +615,30 @@ contract Equities is Ownable {
     function getMaturity() public view returns (uint256) {
         return maturityDate;
     }
+
+    function investorToPaymentPeriodToStatus(
+        address _investor,
+        uint256 _paymentPeriod
+    ) public view returns (bool) {
+        return
+            (paidPaymentPeriods[_investor][_paymentPeriod >> 8] &
+                (1 << (_paymentPeriod & 0xff))) != 0;
+    }
+
+    // Sets the bit of a payment period, consecutive periods of an investor update the same word
+    function markPaymentPeriodPaid(
+        address _investor,
+        uint256 _paymentPeriod
+    ) private {
+        paidPaymentPeriods[_investor][_paymentPeriod >> 8] |=
+            1 << (_paymentPeriod & 0xff);
+    }
+
+    function getPayoutAsset() internal view override returns (IAsset) {
+        return IAsset(address(asset));
+    }
+
+    function getPayoutToken() internal view override returns (address) {
+        return paymentToken;
+    }
 }
@@ -93,8 +93,8 @@ contract FUTURES is FuturesAssets, DELIVERY, STANDARD, Ownable {
     }
 
     function call(address _receiver) internal {
-        IAsset asset = IAsset(IParameters(parameters).getAssetAddress());
-        address paymentToken = IParameters(parameters).getPaymentTokenAddress();
+        IAsset asset = deliveryAsset;
+        address paymentToken = deliveryPaymentToken;
         (bool status, ) = asset.tokenHolderExists(_receiver);
         require(
             status &&
@@ -127,7 +127,7 @@ contract FUTURES is FuturesAssets, DELIVERY, STANDARD, Ownable {
         address _receiver,
         bytes memory _delivererSignature
     ) external onlyOwner {
-        IAsset asset = IAsset(IParameters(parameters).getAssetAddress());
+        IAsset asset = deliveryAsset;
         call(_receiver);
         physicallyDeliver(
             _receiptNumber,
@@ -139,7 +139,7 @@ contract FUTURES is FuturesAssets, DELIVERY, STANDARD, Ownable {
     }
 
     function deliver(address _token, address _receiver) external onlyOwner {
-        IAsset asset = IAsset(IParameters(parameters).getAssetAddress());
+        IAsset asset = deliveryAsset;
         call(_receiver);
         physicallyDeliver(
             _token,
@@ -149,7 +149,7 @@ contract FUTURES is FuturesAssets, DELIVERY, STANDARD, Ownable {
     }
 
     function deliver(address _receiver) external onlyOwner {
-        IAsset asset = IAsset(IParameters(parameters).getAssetAddress());
+        IAsset asset = deliveryAsset;
         uint256 amount;
         (bool status, ) = asset.tokenHolderExists(_receiver);
         require(
@@ -160,8 +160,7 @@ contract FUTURES is FuturesAssets, DELIVERY, STANDARD, Ownable {
         );
         if (spotPrice <= strikePrice) {
             amount = (strikePrice - spotPrice) * asset.balanceOf(_receiver);
-            address paymentToken = IParameters(parameters)
-                .getPaymentTokenAddress();
+            address paymentToken = deliveryPaymentToken;
             require(
                 IERC20(paymentToken).balanceOf(_receiver) >= amount &&
                     IERC20(paymentToken).allowance(_receiver, address(this)) >=
@@ -2,7 +2,9 @@
 pragma solidity 0.8.17;
 
 import "../IParameters.sol";
+import "../IAsset.sol";
 import {IERC20} from "@openzeppelin/contracts/token/ERC20/IERC20.sol";
+import {ECDSA} from "@openzeppelin/contracts/utils/cryptography/ECDSA.sol";
 
 contract DELIVERY {
     ///////////////////
@@ -47,6 +49,9 @@ contract DELIVERY {
     Delivery public deliveryState;
     // Set to the address of the parameters contract
     address public parameters;
+    // Asset and payment token read from the parameters contract at deployment, it has no setters
+    IAsset internal immutable deliveryAsset;
+    address internal immutable deliveryPaymentToken;
 
     ///////////////////
     // Mappings ///////
@@ -120,36 +125,9 @@ contract DELIVERY {
     constructor(Delivery _deliveryState, address _parameters) {
         deliveryState = _deliveryState;
         parameters = _parameters;
-    }
-
-    function getRecoveredAddress(
-        bytes memory sig,
-        bytes32 dataHash
-    ) internal pure returns (address addr) {
-        bytes32 ra;
-        bytes32 sa;
-        uint8 va;
-
-        // Check the signature length
-        if (sig.length != 65) {
-            return address(0);
-        }
-
-        // Divide the signature in r, s and v variables
-        // solhint-disable-next-line no-inline-assembly
-        assembly {
-            ra := mload(add(sig, 32))
-            sa := mload(add(sig, 64))
-            va := byte(0, mload(add(sig, 96)))
-        }
-
-        if (va < 27) {
-            va += 27;
-        }
-
-        address recoveredAddress = ecrecover(dataHash, va, ra, sa);
-
-        return (recoveredAddress);
+        deliveryAsset = IAsset(IParameters(_parameters).getAssetAddress());
+        deliveryPaymentToken = IParameters(_parameters)
+            .getPaymentTokenAddress();
     }
 
     function physicallyDeliver(
@@ -168,12 +146,9 @@ contract DELIVERY {
                 _amountDelivered
             )
         );
-        bytes32 prefixedHash = keccak256(
-            abi.encodePacked("\x19Ethereum Signed Message:\n32", dataHash)
-        );
-        address recovered = getRecoveredAddress(
-            _delivererSignature,
-            prefixedHash
+        (address recovered, ) = ECDSA.tryRecover(
+            ECDSA.toEthSignedMessageHash(dataHash),
+            _delivererSignature
         );
         require(
             recovered == msg.sender,
@@ -230,21 +205,14 @@ contract DELIVERY {
         isCashDeliverable
         isNonZero(_amount)
         addressIsNonZero(_receiver)
-        hasSufficientBalance(
-            _amount,
-            IParameters(parameters).getPaymentTokenAddress()
-        )
-        hasSufficientAllowance(
-            _amount,
-            IParameters(parameters).getPaymentTokenAddress()
-        )
+        hasSufficientBalance(_amount, deliveryPaymentToken)
+        hasSufficientAllowance(_amount, deliveryPaymentToken)
     {
         require(
             !senderToReceiverToDeliveryStatus[msg.sender][_receiver],
             "Underlying asset already delivered"
         );
-        address paymentToken = IParameters(parameters).getPaymentTokenAddress();
-        bool success = IERC20(paymentToken).transferFrom(
+        bool success = IERC20(deliveryPaymentToken).transferFrom(
             msg.sender,
             _receiver,
             _amount
@@ -3,6 +3,7 @@ pragma solidity 0.8.17;
 
 import "../IParameters.sol";
 import "../IAsset.sol";
+import {PaymentPeriods} from "../PaymentPeriods.sol";
 
 contract EXERCISE {
     ///////////////////
@@ -46,29 +47,24 @@ contract EXERCISE {
     Periodicity public periodicity;
     // Set to the address of the parameters contract
     address public exerciseParameters;
+    // Asset read from the parameters contract at deployment, it has no setters
+    IAsset internal immutable exerciseAsset;
 
     ////////////////////
     // Constants ///////
     ///////////////////
     uint256 internal constant AVERAGE_SECONDS_IN_A_DAY = 86400;
-    uint256 internal constant AVERAGE_SECONDS_IN_A_WEEK = 604800;
-    uint256 internal constant AVERAGE_SECONDS_IN_SEMI_MONTH = 1209600;
-    uint256 internal constant AVERAGE_SECONDS_IN_A_MONTH = 2629800;
-    uint256 internal constant AVERAGE_SECONDS_IN_A_YEAR = 31556952;
 
     ///////////////////
     // Mappings ///////
     ///////////////////
     mapping(address => bool) public investorToExerciseStatus;
-    mapping(Periodicity => uint256) internal periodicityToSeconds;
 
     ///////////////////
     // Modifiers //////
     ///////////////////
     modifier investorExists() {
-        address assetAddress = IParameters(exerciseParameters)
-            .getAssetAddress();
-        (bool status, ) = IAsset(assetAddress).tokenHolderExists(msg.sender);
+        (bool status, ) = exerciseAsset.tokenHolderExists(msg.sender);
         if (!status) {
             revert Token__InvestorDoesNotExist();
         }
@@ -103,11 +99,12 @@ contract EXERCISE {
                 revert Token__BermudanExerciseOptionExpired();
             }
             if (block.timestamp < expirationDate - AVERAGE_SECONDS_IN_A_DAY) {
-                uint256 duration = (
-                    ((block.timestamp - startDate) /
-                        periodicityToSeconds[periodicity])
-                ) *
-                    periodicityToSeconds[periodicity] +
+                // Periodicity has no NONE value, so it is one behind the PaymentFrequency fields
+                uint256 period = PaymentPeriods.secondsPerPeriod(
+                    uint8(periodicity) + 1
+                );
+                uint256 duration = ((block.timestamp - startDate) / period) *
+                    period +
                     startDate;
                 if (
                     duration - AVERAGE_SECONDS_IN_A_DAY > block.timestamp ||
@@ -134,6 +131,7 @@ contract EXERCISE {
         );
         expirationDate = _expirationDate;
         exerciseParameters = _parameters;
+        exerciseAsset = IAsset(IParameters(_parameters).getAssetAddress());
         if (_exerciseOptionStyle == Exercise_Option_Style.BERMUDAN) {
             require(
                 _startDate >= block.timestamp && _startDate < _expirationDate,
@@ -141,19 +139,6 @@ contract EXERCISE {
             );
             startDate = _startDate;
             periodicity = _periodicity;
-            periodicityToSeconds[Periodicity.DAILY] = AVERAGE_SECONDS_IN_A_DAY;
-            periodicityToSeconds[
-                Periodicity.SEMIMONTHLY
-            ] = AVERAGE_SECONDS_IN_SEMI_MONTH;
-            periodicityToSeconds[
-                Periodicity.WEEKLY
-            ] = AVERAGE_SECONDS_IN_A_WEEK;
-            periodicityToSeconds[
-                Periodicity.MONTHLY
-            ] = AVERAGE_SECONDS_IN_A_MONTH;
-            periodicityToSeconds[
-                Periodicity.ANNUALY
-            ] = AVERAGE_SECONDS_IN_A_YEAR;
         }
     }
 
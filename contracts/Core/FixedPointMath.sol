@@ -0,0 +1,35 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity ^0.8.17;
+
+// Fixed-point helpers for amortization schedules. Values are scaled by `scale` (10 ** PRECISION of the
+// instrument) and every product is floored, the same rounding as scripts/amortization.py, so schedules
+// computed on-chain and off-chain agree to the last unit.
+library FixedPointMath {
+    // Computes (x / scale) ** n, scaled by `scale`, with exponentiation by squaring in O(log n) multiplications
+    function rpow(
+        uint256 x,
+        uint256 n,
+        uint256 scale
+    ) internal pure returns (uint256 z) {
+        z = n % 2 == 1 ? x : scale;
+        for (n /= 2; n != 0; n /= 2) {
+            x = (x * x) / scale;
+            if (n % 2 == 1) {
+                z = (z * x) / scale;
+            }
+        }
+    }
+
+    // Returns r * (1 + r) ** n and (1 + r) ** n - 1, the numerator and denominator of the annuity paying off
+    // one unit over n periods at the periodic rate r
+    function annuity(
+        uint256 rate,
+        uint256 periods,
+        uint256 scale
+    ) internal pure returns (uint256 numerator, uint256 denominator) {
+        uint256 growth = rpow(scale + rate, periods, scale);
+        numerator = (rate * growth) / scale;
+        denominator = growth - scale;
+    }
+}
@@ -5,6 +5,10 @@ pragma solidity ^0.8.17;
 import {IERC20} from "@openzeppelin/contracts/token/ERC20/IERC20.sol";
 
 interface IAsset is IERC20 {
+    function owner() external view returns (address);
+
+    function payoutLedger() external view returns (address);
+
     function tokenHolderExists(
         address _tokenHolder
     ) external view returns (bool, uint256);
@@ -12,4 +16,22 @@ interface IAsset is IERC20 {
     function burn(address _account, uint256 _amount) external;
 
     function getTokenHolders() external view returns (address[] memory);
+
+    function balanceOfAt(
+        address _account,
+        uint256 _paymentPeriod
+    ) external view returns (uint256);
+
+    function currentPaymentPeriod() external view returns (uint256);
+
+    function totalSupplyAt(
+        uint256 _paymentPeriod
+    ) external view returns (uint256);
+
+    function getTokenHolderCount() external view returns (uint256);
+
+    function getTokenHoldersInRange(
+        uint256 _start,
+        uint256 _count
+    ) external view returns (address[] memory);
 }
@@ -7,8 +7,10 @@ import {IERC20} from "@openzeppelin/contracts/token/ERC20/IERC20.sol";
 import "./IParameters.sol";
 import "./IAsset.sol";
 import "./IREDEMPTION.sol";
+import "./PAYOUT.sol";
+import {PaymentPeriods} from "./PaymentPeriods.sol";
 
-contract INCOME is Ownable {
+contract INCOME is Ownable, PAYOUT {
     ///////////////////
     // Errors /////////
     ///////////////////
@@ -60,18 +62,20 @@ contract INCOME is Ownable {
     // Refers to the income rate of the token set during contract deployment. Can optionally be modified if income rate type is variable
     uint256 public incomeRate;
 
-    uint256 private constant AVERAGE_SECONDS_IN_A_DAY = 86400;
-    uint256 private constant AVERAGE_SECONDS_IN_A_WEEK = 604800;
-    uint256 private constant AVERAGE_SECONDS_IN_SEMI_MONTH = 1209600;
-    uint256 private constant AVERAGE_SECONDS_IN_A_MONTH = 2629800; //2628288;
-    uint256 private constant AVERAGE_SECONDS_IN_A_YEAR = 31556952;
-
     ///////////////////
     // Mappings ///////
     ///////////////////
-    mapping(address => mapping(uint256 => bool))
-        public investorToPaymentPeriodToStatus;
-    mapping(PaymentFrequency => uint256) private paymentFrequencyToSeconds;
+    // Paid payment periods per investor, bit (period & 0xff) of word (period >> 8)
+    mapping(address => mapping(uint256 => uint256)) public paidPaymentPeriods;
+    ///////////////////
+    // Events /////////
+    ///////////////////
+    event IncomePaid(
+        address indexed investor,
+        uint256 indexed paymentPeriod,
+        uint256 amount,
+        address indexed paymentToken
+    );
     ///////////////////
     // Modifiers //////
     ///////////////////
@@ -144,22 +148,6 @@ contract INCOME is Ownable {
         incomeRate = _incomeRate;
         parameters = _parameters;
 
-        paymentFrequencyToSeconds[
-            PaymentFrequency.DAILY
-        ] = AVERAGE_SECONDS_IN_A_DAY;
-        paymentFrequencyToSeconds[
-            PaymentFrequency.SEMIMONTHLY
-        ] = AVERAGE_SECONDS_IN_SEMI_MONTH;
-        paymentFrequencyToSeconds[
-            PaymentFrequency.WEEKLY
-        ] = AVERAGE_SECONDS_IN_A_WEEK;
-        paymentFrequencyToSeconds[
-            PaymentFrequency.MONTHLY
-        ] = AVERAGE_SECONDS_IN_A_MONTH;
-        paymentFrequencyToSeconds[
-            PaymentFrequency.ANNUALY
-        ] = AVERAGE_SECONDS_IN_A_YEAR;
-
         // if (_redemption != address(0)) {
         //     maturityDate = IREDEMPTION(_redemption).getMaturityDate();
         // }
@@ -174,6 +162,7 @@ contract INCOME is Ownable {
         public
         onlyOwner
         isPayable
+        isNotInClaimMode
         investorExists(_investor)
         isParticipating(_dividend)
     {
@@ -197,17 +186,21 @@ contract INCOME is Ownable {
             IERC20(paymentToken).balanceOf(address(this)) >= payment,
             "You do not have sufficient balance to pay this investor!"
         );
-        uint256 duration = (block.timestamp - contractDeploymentTime) /
-            paymentFrequencyToSeconds[paymentFrequency];
+        uint256 duration = PaymentPeriods.periodAt(
+            contractDeploymentTime,
+            block.timestamp,
+            uint8(paymentFrequency)
+        );
         require(
-            !investorToPaymentPeriodToStatus[_investor][duration],
+            !investorToPaymentPeriodToStatus(_investor, duration),
             "The investor has already been paid for this payment period"
         );
         bool success = IERC20(paymentToken).transfer(_investor, payment);
         if (!success) {
             revert Token__ExchangeFailed();
         }
-        investorToPaymentPeriodToStatus[_investor][duration] = true;
+        markPaymentPeriodPaid(_investor, duration);
+        emit IncomePaid(_investor, duration, payment, paymentToken);
     }
 
     function payCumulativeIncome(
@@ -219,6 +212,7 @@ contract INCOME is Ownable {
         onlyOwner
         isCumulative
         isPayable
+        isNotInClaimMode
         investorExists(_investor)
         isParticipating(_dividend)
     {
@@ -239,19 +233,20 @@ contract INCOME is Ownable {
             "You do not have sufficient balance to pay this investor!"
         );
         require(
-            !investorToPaymentPeriodToStatus[_investor][_paymentPeriod],
+            !investorToPaymentPeriodToStatus(_investor, _paymentPeriod),
             "The investor has already been paid for this payment period"
         );
         bool success = IERC20(paymentToken).transfer(_investor, payment);
         if (!success) {
             revert Token__ExchangeFailed();
         }
-        investorToPaymentPeriodToStatus[_investor][_paymentPeriod] = true;
+        markPaymentPeriodPaid(_investor, _paymentPeriod);
+        emit IncomePaid(_investor, _paymentPeriod, payment, paymentToken);
     }
 
     function payIncomeToAll(
         uint256 _dividend
-    ) public onlyOwner isPayable isParticipating(_dividend) {
+    ) public onlyOwner isPayable isNotInClaimMode isParticipating(_dividend) {
         require(
             block.timestamp < maturityDate || maturityDate == 0,
             "Token has reached maturity"
@@ -265,8 +260,11 @@ contract INCOME is Ownable {
         uint256 precision = IParameters(parameters).getPrecision();
         IAsset asset = IAsset(IParameters(parameters).getAssetAddress());
         address paymentToken = IParameters(parameters).getPaymentTokenAddress();
-        uint256 duration = (block.timestamp - contractDeploymentTime) /
-            paymentFrequencyToSeconds[paymentFrequency];
+        uint256 duration = PaymentPeriods.periodAt(
+            contractDeploymentTime,
+            block.timestamp,
+            uint8(paymentFrequency)
+        );
         address[] memory tokenHolders = asset.getTokenHolders();
         if (
             incomeState != Income.PARTICIPATING &&
@@ -282,17 +280,73 @@ contract INCOME is Ownable {
         );
         uint256 payment;
         for (uint256 i = 0; i < tokenHolders.length; i++) {
-            if (!investorToPaymentPeriodToStatus[tokenHolders[i]][duration]) {
+            if (!investorToPaymentPeriodToStatus(tokenHolders[i], duration)) {
                 payment =
                     ((incomeRate *
                         precision *
                         asset.balanceOf(tokenHolders[i])) / precision) +
                     _dividend;
                 IERC20(paymentToken).transfer(tokenHolders[i], payment);
-                investorToPaymentPeriodToStatus[tokenHolders[i]][
-                    duration
-                ] = true;
+                markPaymentPeriodPaid(tokenHolders[i], duration);
+                emit IncomePaid(
+                    tokenHolders[i],
+                    duration,
+                    payment,
+                    paymentToken
+                );
             }
         }
     }
+
+    function enableClaimMode() public onlyOwner isPayable {
+        startClaimMode();
+    }
+
+    // In claim mode the dividend of participating income is distributed per token rather than per token holder
+    function fundIncomePayment(
+        uint256 _dividend
+    ) public onlyOwner isPayable isParticipating(_dividend) {
+        require(
+            block.timestamp < maturityDate || maturityDate == 0,
+            "Token has reached maturity"
+        );
+        if (
+            incomeState != Income.PARTICIPATING &&
+            incomeState != Income.CUMULATIVE_PARTICIPATING
+        ) {
+            _dividend = 0;
+        }
+        uint256 duration = PaymentPeriods.periodAt(
+            contractDeploymentTime,
+            block.timestamp,
+            uint8(paymentFrequency)
+        );
+        fundPaymentPeriod(duration, incomeRate + _dividend);
+    }
+
+    function investorToPaymentPeriodToStatus(
+        address _investor,
+        uint256 _paymentPeriod
+    ) public view returns (bool) {
+        return
+            (paidPaymentPeriods[_investor][_paymentPeriod >> 8] &
+                (1 << (_paymentPeriod & 0xff))) != 0;
+    }
+
+    // Sets the bit of a payment period, consecutive periods of an investor update the same word
+    function markPaymentPeriodPaid(
+        address _investor,
+        uint256 _paymentPeriod
+    ) private {
+        paidPaymentPeriods[_investor][_paymentPeriod >> 8] |=
+            1 << (_paymentPeriod & 0xff);
+    }
+
+    function getPayoutAsset() internal view override returns (IAsset) {
+        return IAsset(IParameters(parameters).getAssetAddress());
+    }
+
+    function getPayoutToken() internal view override returns (address) {
+        return IParameters(parameters).getPaymentTokenAddress();
+    }
 }
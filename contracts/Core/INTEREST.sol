@@ -6,8 +6,12 @@ import "@openzeppelin/contracts/access/Ownable.sol";
 import {IERC20} from "@openzeppelin/contracts/token/ERC20/IERC20.sol";
 import "./IParameters.sol";
 import "./IAsset.sol";
+import "./PAYOUT.sol";
+import {ECDSA} from "@openzeppelin/contracts/utils/cryptography/ECDSA.sol";
+import {EIP712} from "@openzeppelin/contracts/utils/cryptography/EIP712.sol";
+import {PaymentPeriods} from "./PaymentPeriods.sol";
 
-contract INTEREST is Ownable {
+contract INTEREST is Ownable, PAYOUT, EIP712 {
     ///////////////////
     // Errors /////////
     ///////////////////
@@ -74,20 +78,40 @@ contract INTEREST is Ownable {
     ////////////////////
     // Constants ///////
     ///////////////////
-    uint256 private constant AVERAGE_SECONDS_IN_A_DAY = 86400;
-    uint256 private constant AVERAGE_SECONDS_IN_A_WEEK = 604800;
-    uint256 private constant AVERAGE_SECONDS_IN_SEMI_MONTH = 1209600;
-    uint256 private constant AVERAGE_SECONDS_IN_A_MONTH = 2629800; //2628288;
-    uint256 private constant AVERAGE_SECONDS_IN_A_YEAR = 31556952;
+    // EIP-712 type of the receipts of payInterestInCashBatch, bound to the payment period they are paid in
+    bytes32 private constant CASH_RECEIPT_TYPEHASH =
+        keccak256(
+            "CashReceipt(uint256 receiptNumber,uint256 date,address tokenHolder,uint256 amount,uint256 paymentPeriod)"
+        );
 
     ///////////////////
     // Mappings ///////
     ///////////////////
-    mapping(PaymentFrequency => uint256) private paymentFrequencyToSeconds;
-    mapping(address => mapping(uint256 => bool))
-        public investorToPaymentPeriodToStatus;
-    mapping(address => mapping(uint256 => CashReceipt))
-        public investorToPaymentPeriodToReceipt;
+    // Paid payment periods per investor, bit (period & 0xff) of word (period >> 8)
+    mapping(address => mapping(uint256 => uint256)) public paidPaymentPeriods;
+    // Hash of the cash receipt recorded for each investor and payment period, the receipt itself is
+    // only emitted in CashReceiptRecorded
+    mapping(address => mapping(uint256 => bytes32))
+        public investorToPaymentPeriodToReceiptHash;
+
+    ///////////////////
+    // Events /////////
+    ///////////////////
+    // Cash payments are settled off-chain, so their InterestPaid events carry a zero payment token
+    event InterestPaid(
+        address indexed investor,
+        uint256 indexed paymentPeriod,
+        uint256 amount,
+        address indexed paymentToken
+    );
+    event CashReceiptRecorded(
+        address indexed tokenHolder,
+        uint256 indexed paymentPeriod,
+        uint256 receiptNumber,
+        uint256 date,
+        uint256 amount,
+        bytes signature
+    );
 
     ///////////////////
     // Modifiers //////
@@ -156,7 +180,7 @@ contract INTEREST is Ownable {
         uint256 _maturityDate,
         uint256 _faceValue,
         uint256 _interestRate
-    ) {
+    ) EIP712("GenericTokenization", "1") {
         paymentFrequency = _paymentFrequency;
         interestType = _interestType;
         faceValue = _faceValue;
@@ -170,21 +194,6 @@ contract INTEREST is Ownable {
             );
             maturityDate = _maturityDate;
         }
-        paymentFrequencyToSeconds[
-            PaymentFrequency.DAILY
-        ] = AVERAGE_SECONDS_IN_A_DAY;
-        paymentFrequencyToSeconds[
-            PaymentFrequency.SEMIMONTHLY
-        ] = AVERAGE_SECONDS_IN_SEMI_MONTH;
-        paymentFrequencyToSeconds[
-            PaymentFrequency.WEEKLY
-        ] = AVERAGE_SECONDS_IN_A_WEEK;
-        paymentFrequencyToSeconds[
-            PaymentFrequency.MONTHLY
-        ] = AVERAGE_SECONDS_IN_A_MONTH;
-        paymentFrequencyToSeconds[
-            PaymentFrequency.ANNUALY
-        ] = AVERAGE_SECONDS_IN_A_YEAR;
         contractDeploymentTime = block.timestamp;
     }
 
@@ -195,6 +204,7 @@ contract INTEREST is Ownable {
         onlyOwner
         isPayable
         isFixedOrVariableRate
+        isNotInClaimMode
         investorExists(_investor)
     {
         require(block.timestamp < maturityDate, "Token has reached maturity");
@@ -209,17 +219,21 @@ contract INTEREST is Ownable {
             IERC20(paymentToken).balanceOf(address(this)) >= payment,
             "You do not have sufficient balance to pay this investor!"
         );
-        uint256 duration = (block.timestamp - contractDeploymentTime) /
-            paymentFrequencyToSeconds[paymentFrequency];
+        uint256 duration = PaymentPeriods.periodAt(
+            contractDeploymentTime,
+            block.timestamp,
+            uint8(paymentFrequency)
+        );
         require(
-            !investorToPaymentPeriodToStatus[_investor][duration],
+            !investorToPaymentPeriodToStatus(_investor, duration),
             "The investor has already been paid for this payment period"
         );
         bool success = IERC20(paymentToken).transfer(_investor, payment);
         if (!success) {
             revert Token__ExchangeFailed();
         }
-        investorToPaymentPeriodToStatus[_investor][duration] = true;
+        markPaymentPeriodPaid(_investor, duration);
+        emit InterestPaid(_investor, duration, payment, paymentToken);
     }
 
     function payInterestToAll()
@@ -227,10 +241,14 @@ contract INTEREST is Ownable {
         onlyOwner
         isPayable
         isFixedOrVariableRate
+        isNotInClaimMode
     {
         require(block.timestamp < maturityDate, "Token has reached maturity");
-        uint256 duration = (block.timestamp - contractDeploymentTime) /
-            paymentFrequencyToSeconds[paymentFrequency];
+        uint256 duration = PaymentPeriods.periodAt(
+            contractDeploymentTime,
+            block.timestamp,
+            uint8(paymentFrequency)
+        );
         uint256 precision = IParameters(parameters).getPrecision();
         IAsset asset = IAsset(IParameters(parameters).getAssetAddress());
         address paymentToken = IParameters(parameters).getPaymentTokenAddress();
@@ -244,7 +262,7 @@ contract INTEREST is Ownable {
             "You do not have sufficient balance to pay all token holders!"
         );
         for (uint256 i = 0; i < tokenHolders.length; i++) {
-            if (!investorToPaymentPeriodToStatus[tokenHolders[i]][duration]) {
+            if (!investorToPaymentPeriodToStatus(tokenHolders[i], duration)) {
                 payment =
                     (interestRate *
                         precision *
@@ -252,23 +270,49 @@ contract INTEREST is Ownable {
                         asset.balanceOf(tokenHolders[i])) /
                     precision;
                 IERC20(paymentToken).transfer(tokenHolders[i], payment);
-                investorToPaymentPeriodToStatus[tokenHolders[i]][
-                    duration
-                ] = true;
+                markPaymentPeriodPaid(tokenHolders[i], duration);
+                emit InterestPaid(
+                    tokenHolders[i],
+                    duration,
+                    payment,
+                    paymentToken
+                );
             }
         }
     }
 
+    function enableClaimMode() public onlyOwner isPayable isFixedOrVariableRate {
+        startClaimMode();
+    }
+
+    function fundInterestPayment()
+        public
+        onlyOwner
+        isPayable
+        isFixedOrVariableRate
+    {
+        require(block.timestamp < maturityDate, "Token has reached maturity");
+        uint256 duration = PaymentPeriods.periodAt(
+            contractDeploymentTime,
+            block.timestamp,
+            uint8(paymentFrequency)
+        );
+        fundPaymentPeriod(duration, interestRate * faceValue);
+    }
+
     function payInterestInPaymentInKind(
         address _investor,
         address _tokenAddress,
         uint256 _tokenAmount
     ) public onlyOwner isPaymentInKind isPayable investorExists(_investor) {
         require(block.timestamp < maturityDate, "Token has reached maturity");
-        uint256 duration = (block.timestamp - contractDeploymentTime) /
-            paymentFrequencyToSeconds[paymentFrequency];
+        uint256 duration = PaymentPeriods.periodAt(
+            contractDeploymentTime,
+            block.timestamp,
+            uint8(paymentFrequency)
+        );
         require(
-            !investorToPaymentPeriodToStatus[_investor][duration],
+            !investorToPaymentPeriodToStatus(_investor, duration),
             "The investor has already been paid for this payment period"
         );
         require(
@@ -279,7 +323,8 @@ contract INTEREST is Ownable {
         if (!success) {
             revert Token__ExchangeFailed();
         }
-        investorToPaymentPeriodToStatus[_investor][duration] = true;
+        markPaymentPeriodPaid(_investor, duration);
+        emit InterestPaid(_investor, duration, _tokenAmount, _tokenAddress);
     }
 
     function payInterestInPaymentInKindToAll(
@@ -287,8 +332,11 @@ contract INTEREST is Ownable {
         uint256 _tokenAmount
     ) public onlyOwner isPaymentInKind isPayable {
         require(block.timestamp < maturityDate, "Token has reached maturity");
-        uint256 duration = (block.timestamp - contractDeploymentTime) /
-            paymentFrequencyToSeconds[paymentFrequency];
+        uint256 duration = PaymentPeriods.periodAt(
+            contractDeploymentTime,
+            block.timestamp,
+            uint8(paymentFrequency)
+        );
         IAsset asset = IAsset(IParameters(parameters).getAssetAddress());
         address[] memory tokenHolders = asset.getTokenHolders();
         require(
@@ -296,45 +344,19 @@ contract INTEREST is Ownable {
             "You do not have sufficient balance to pay all token holders!"
         );
         for (uint256 i = 0; i < tokenHolders.length; i++) {
-            if (!investorToPaymentPeriodToStatus[tokenHolders[i]][duration]) {
+            if (!investorToPaymentPeriodToStatus(tokenHolders[i], duration)) {
                 IERC20(_tokenAddress).transfer(tokenHolders[i], _tokenAmount);
-                investorToPaymentPeriodToStatus[tokenHolders[i]][
-                    duration
-                ] = true;
+                markPaymentPeriodPaid(tokenHolders[i], duration);
+                emit InterestPaid(
+                    tokenHolders[i],
+                    duration,
+                    _tokenAmount,
+                    _tokenAddress
+                );
             }
         }
     }
 
-    function getRecoveredAddress(
-        bytes memory sig,
-        bytes32 dataHash
-    ) internal pure returns (address addr) {
-        bytes32 ra;
-        bytes32 sa;
-        uint8 va;
-
-        // Check the signature length
-        if (sig.length != 65) {
-            return address(0);
-        }
-
-        // Divide the signature in r, s and v variables
-        // solhint-disable-next-line no-inline-assembly
-        assembly {
-            ra := mload(add(sig, 32))
-            sa := mload(add(sig, 64))
-            va := byte(0, mload(add(sig, 96)))
-        }
-
-        if (va < 27) {
-            va += 27;
-        }
-
-        address recoveredAddress = ecrecover(dataHash, va, ra, sa);
-
-        return (recoveredAddress);
-    }
-
     function payInterestInCash(
         uint256 _receiptNumber,
         uint256 _date,
@@ -346,25 +368,139 @@ contract INTEREST is Ownable {
         bytes32 dataHash = keccak256(
             abi.encode(_receiptNumber, _date, _tokenHolder, _amount)
         );
-        bytes32 prefixedHash = keccak256(
-            abi.encodePacked("\x19Ethereum Signed Message:\n32", dataHash)
+        (address recovered, ) = ECDSA.tryRecover(
+            ECDSA.toEthSignedMessageHash(dataHash),
+            _signature
         );
-        address recovered = getRecoveredAddress(_signature, prefixedHash);
         require(recovered == owner(), "The signer is not the owner");
-        uint256 duration = (block.timestamp - contractDeploymentTime) /
-            paymentFrequencyToSeconds[paymentFrequency];
+        uint256 duration = PaymentPeriods.periodAt(
+            contractDeploymentTime,
+            block.timestamp,
+            uint8(paymentFrequency)
+        );
         require(
-            !investorToPaymentPeriodToStatus[_tokenHolder][duration],
+            !investorToPaymentPeriodToStatus(_tokenHolder, duration),
             "Investor already paid for this payment period"
         );
-        investorToPaymentPeriodToReceipt[_tokenHolder][duration] = CashReceipt(
+        bytes32 receiptHash = hashCashReceipt(
+            CashReceipt(
+                _receiptNumber,
+                _date,
+                _tokenHolder,
+                _amount,
+                _signature
+            )
+        );
+        investorToPaymentPeriodToReceiptHash[_tokenHolder][
+            duration
+        ] = receiptHash;
+        markPaymentPeriodPaid(_tokenHolder, duration);
+        emit CashReceiptRecorded(
+            _tokenHolder,
+            duration,
             _receiptNumber,
             _date,
-            _tokenHolder,
             _amount,
             _signature
         );
-        investorToPaymentPeriodToStatus[_tokenHolder][duration] = true;
+        emit InterestPaid(_tokenHolder, duration, _amount, address(0));
+    }
+
+    // Records the cash coupons of a whole payment period in one transaction. Each receipt is signed by the
+    // owner as EIP-712 typed data that includes the payment period, so it cannot be replayed in a later one
+    function payInterestInCashBatch(
+        CashReceipt[] calldata _receipts
+    ) public onlyOwner isCashPayment isPayable {
+        require(block.timestamp < maturityDate, "Token has reached maturity");
+        uint256 duration = PaymentPeriods.periodAt(
+            contractDeploymentTime,
+            block.timestamp,
+            uint8(paymentFrequency)
+        );
+        IAsset asset = IAsset(IParameters(parameters).getAssetAddress());
+        address signer = owner();
+        for (uint256 i = 0; i < _receipts.length; i++) {
+            CashReceipt calldata receipt = _receipts[i];
+            (bool status, ) = asset.tokenHolderExists(receipt.tokenHolder);
+            if (!status) {
+                revert Token__InvestorDoesNotExist();
+            }
+            require(
+                recoverCashReceiptSigner(receipt, duration) == signer,
+                "The signer is not the owner"
+            );
+            require(
+                !investorToPaymentPeriodToStatus(
+                    receipt.tokenHolder,
+                    duration
+                ),
+                "Investor already paid for this payment period"
+            );
+            investorToPaymentPeriodToReceiptHash[receipt.tokenHolder][
+                duration
+            ] = keccak256(abi.encode(receipt));
+            markPaymentPeriodPaid(receipt.tokenHolder, duration);
+            emit CashReceiptRecorded(
+                receipt.tokenHolder,
+                duration,
+                receipt.receiptNumber,
+                receipt.date,
+                receipt.amount,
+                receipt.signature
+            );
+            emit InterestPaid(
+                receipt.tokenHolder,
+                duration,
+                receipt.amount,
+                address(0)
+            );
+        }
+    }
+
+    // Signer of the EIP-712 digest of a receipt, the signature is read from calldata without being copied
+    function recoverCashReceiptSigner(
+        CashReceipt calldata _receipt,
+        uint256 _paymentPeriod
+    ) private view returns (address signer) {
+        bytes calldata signature = _receipt.signature;
+        if (signature.length != 65) {
+            return address(0);
+        }
+        bytes32 digest = _hashTypedDataV4(
+            keccak256(
+                abi.encode(
+                    CASH_RECEIPT_TYPEHASH,
+                    _receipt.receiptNumber,
+                    _receipt.date,
+                    _receipt.tokenHolder,
+                    _receipt.amount,
+                    _paymentPeriod
+                )
+            )
+        );
+        (signer, ) = ECDSA.tryRecover(
+            digest,
+            uint8(signature[64]),
+            bytes32(signature[0:32]),
+            bytes32(signature[32:64])
+        );
+    }
+
+    // Checks a receipt taken from a CashReceiptRecorded event against the hash stored for its payment period
+    function verifyCashReceipt(
+        uint256 _paymentPeriod,
+        CashReceipt memory _receipt
+    ) public view returns (bool) {
+        bytes32 receiptHash = investorToPaymentPeriodToReceiptHash[
+            _receipt.tokenHolder
+        ][_paymentPeriod];
+        return receiptHash != 0 && receiptHash == hashCashReceipt(_receipt);
+    }
+
+    function hashCashReceipt(
+        CashReceipt memory _receipt
+    ) private pure returns (bytes32) {
+        return keccak256(abi.encode(_receipt));
     }
 
     function modifyInterestRate(
@@ -372,4 +508,30 @@ contract INTEREST is Ownable {
     ) public onlyOwner isVariable isNonZero(_rate) {
         interestRate = _rate;
     }
+
+    function investorToPaymentPeriodToStatus(
+        address _investor,
+        uint256 _paymentPeriod
+    ) public view returns (bool) {
+        return
+            (paidPaymentPeriods[_investor][_paymentPeriod >> 8] &
+                (1 << (_paymentPeriod & 0xff))) != 0;
+    }
+
+    // Sets the bit of a payment period, consecutive periods of an investor update the same word
+    function markPaymentPeriodPaid(
+        address _investor,
+        uint256 _paymentPeriod
+    ) private {
+        paidPaymentPeriods[_investor][_paymentPeriod >> 8] |=
+            1 << (_paymentPeriod & 0xff);
+    }
+
+    function getPayoutAsset() internal view override returns (IAsset) {
+        return IAsset(IParameters(parameters).getAssetAddress());
+    }
+
+    function getPayoutToken() internal view override returns (address) {
+        return IParameters(parameters).getPaymentTokenAddress();
+    }
 }
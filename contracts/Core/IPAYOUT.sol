@@ -0,0 +1,7 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity ^0.8.17;
+
+interface IPAYOUT {
+    function updatePayoutCheckpoint(address _investor) external;
+}
@@ -0,0 +1,138 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity ^0.8.17;
+
+import {Clones} from "@openzeppelin/contracts/proxy/Clones.sol";
+import {Asset} from "./Asset.sol";
+import {Token} from "./Token.sol";
+import {Debts} from "./Debts.sol";
+import {Equities} from "./Equities.sol";
+
+contract IssuanceFactory {
+    ///////////////////
+    // Errors /////////
+    ///////////////////
+    error IssuanceFactory__InputAddressIsZero();
+
+    ///////////////////
+    // Struct /////////
+    ///////////////////
+    struct AssetConfig {
+        string _name;
+        string _symbol;
+        uint256 _initialSupply;
+    }
+
+    ////////////////////
+    // State Variables /
+    ///////////////////
+
+    // Asset implementation shared by the asset clone of every issuance
+    address public immutable assetImplementation;
+    // Token implementation shared by every Token issuance
+    address public immutable tokenImplementation;
+    // Debts implementation shared by every Debts issuance
+    address public immutable debtsImplementation;
+    // Equities implementation shared by every Equities issuance
+    address public immutable equitiesImplementation;
+    // Keeps track of every instrument issued through the factory
+    address[] public issuances;
+
+    ///////////////////
+    // Events /////////
+    ///////////////////
+    event InstrumentIssued(
+        address indexed instrument,
+        address indexed asset,
+        address indexed owner
+    );
+
+    ///////////////////
+    // Functions //////
+    ///////////////////
+    constructor(
+        address _assetImplementation,
+        address _tokenImplementation,
+        address _debtsImplementation,
+        address _equitiesImplementation
+    ) {
+        if (
+            _assetImplementation == address(0) ||
+            _tokenImplementation == address(0) ||
+            _debtsImplementation == address(0) ||
+            _equitiesImplementation == address(0)
+        ) {
+            revert IssuanceFactory__InputAddressIsZero();
+        }
+        assetImplementation = _assetImplementation;
+        tokenImplementation = _tokenImplementation;
+        debtsImplementation = _debtsImplementation;
+        equitiesImplementation = _equitiesImplementation;
+    }
+
+    // The issuance parameters are validated once, by the initializer of the instrument clone
+    function issueToken(
+        AssetConfig calldata _config,
+        Token.TokenOptions calldata _options,
+        Token.TokenTerms calldata _terms
+    ) external returns (address) {
+        (address instrument, address asset) = cloneInstrument(
+            tokenImplementation,
+            _config,
+            _terms._identityRegistry
+        );
+        Token(instrument).initialize(asset, msg.sender, _options, _terms);
+        return instrument;
+    }
+
+    function issueDebts(
+        AssetConfig calldata _config,
+        Debts.TokenOptions calldata _options,
+        Debts.TokenTerms calldata _terms
+    ) external returns (address) {
+        (address instrument, address asset) = cloneInstrument(
+            debtsImplementation,
+            _config,
+            _terms._identityRegistry
+        );
+        Debts(instrument).initialize(asset, msg.sender, _options, _terms);
+        return instrument;
+    }
+
+    function issueEquities(
+        AssetConfig calldata _config,
+        Equities.EquityOptions calldata _options,
+        Equities.EquityTerms calldata _terms
+    ) external returns (address) {
+        (address instrument, address asset) = cloneInstrument(
+            equitiesImplementation,
+            _config,
+            _terms._identityRegistry
+        );
+        Equities(instrument).initialize(asset, msg.sender, _options, _terms);
+        return instrument;
+    }
+
+    function getIssuances() public view returns (address[] memory) {
+        return issuances;
+    }
+
+    // Clones the instrument and its asset. The whole supply is minted to the instrument, which owns the asset
+    function cloneInstrument(
+        address _implementation,
+        AssetConfig calldata _config,
+        address _identityRegistry
+    ) private returns (address instrument, address asset) {
+        instrument = Clones.clone(_implementation);
+        asset = Clones.clone(assetImplementation);
+        Asset(asset).initialize(
+            _config._initialSupply,
+            _config._name,
+            _config._symbol,
+            _identityRegistry,
+            instrument
+        );
+        issuances.push(instrument);
+        emit InstrumentIssued(instrument, asset, msg.sender);
+    }
+}
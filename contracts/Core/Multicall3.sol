@@ -0,0 +1,51 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity ^0.8.17;
+
+// Aggregates view calls so that off-chain reporting can read the state of many token holders in a single
+// eth_call. Follows the aggregate3 interface of the canonical Multicall3 deployment, so the read scripts
+// also work against it on networks where it is already deployed.
+contract Multicall3 {
+    ///////////////////
+    // Struct /////////
+    ///////////////////
+    struct Call3 {
+        address target;
+        bool allowFailure;
+        bytes callData;
+    }
+
+    struct Result {
+        bool success;
+        bytes returnData;
+    }
+
+    ///////////////////
+    // Functions //////
+    ///////////////////
+    function aggregate3(
+        Call3[] calldata calls
+    ) public payable returns (Result[] memory returnData) {
+        uint256 length = calls.length;
+        returnData = new Result[](length);
+        for (uint256 i = 0; i < length; i++) {
+            Call3 calldata call = calls[i];
+            Result memory result = returnData[i];
+            (result.success, result.returnData) = call.target.call(
+                call.callData
+            );
+            require(
+                call.allowFailure || result.success,
+                "Multicall3: call failed"
+            );
+        }
+    }
+
+    function getBlockNumber() public view returns (uint256) {
+        return block.number;
+    }
+
+    function getCurrentBlockTimestamp() public view returns (uint256) {
+        return block.timestamp;
+    }
+}
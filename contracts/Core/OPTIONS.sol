@@ -92,8 +92,8 @@ contract OPTIONS is EXERCISE, OptionAssets, DELIVERY, STANDARD, Ownable {
     }
 
     function call(address _receiver) internal {
-        IAsset asset = IAsset(IParameters(parameters).getAssetAddress());
-        address paymentToken = IParameters(parameters).getPaymentTokenAddress();
+        IAsset asset = deliveryAsset;
+        address paymentToken = deliveryPaymentToken;
         (bool status, ) = asset.tokenHolderExists(_receiver);
         require(
             status &&
@@ -121,8 +121,8 @@ contract OPTIONS is EXERCISE, OptionAssets, DELIVERY, STANDARD, Ownable {
     }
 
     function put() internal {
-        IAsset asset = IAsset(IParameters(parameters).getAssetAddress());
-        address paymentToken = IParameters(parameters).getPaymentTokenAddress();
+        IAsset asset = deliveryAsset;
+        address paymentToken = deliveryPaymentToken;
         (bool status, ) = asset.tokenHolderExists(msg.sender);
         require(
             status &&
@@ -158,7 +158,7 @@ contract OPTIONS is EXERCISE, OptionAssets, DELIVERY, STANDARD, Ownable {
         if (optionState == Options.CALL && msg.sender != owner()) {
             revert OPTIONS__CallerIsNotTheOwner();
         }
-        IAsset asset = IAsset(IParameters(parameters).getAssetAddress());
+        IAsset asset = deliveryAsset;
         if (optionState == Options.CALL) {
             call(_receiver);
             physicallyDeliver(
@@ -184,7 +184,7 @@ contract OPTIONS is EXERCISE, OptionAssets, DELIVERY, STANDARD, Ownable {
         if (optionState == Options.CALL && msg.sender != owner()) {
             revert OPTIONS__CallerIsNotTheOwner();
         }
-        IAsset asset = IAsset(IParameters(parameters).getAssetAddress());
+        IAsset asset = deliveryAsset;
         if (optionState == Options.CALL) {
             call(_receiver);
             physicallyDeliver(
@@ -206,7 +206,7 @@ contract OPTIONS is EXERCISE, OptionAssets, DELIVERY, STANDARD, Ownable {
         if (optionState == Options.CALL && msg.sender != owner()) {
             revert OPTIONS__CallerIsNotTheOwner();
         }
-        IAsset asset = IAsset(IParameters(parameters).getAssetAddress());
+        IAsset asset = deliveryAsset;
         uint256 amount;
         if (optionState == Options.CALL) {
             (bool status, ) = asset.tokenHolderExists(_receiver);
@@ -218,8 +218,7 @@ contract OPTIONS is EXERCISE, OptionAssets, DELIVERY, STANDARD, Ownable {
             );
             if (spotPrice <= strikePrice) {
                 amount = (strikePrice - spotPrice) * asset.balanceOf(_receiver);
-                address paymentToken = IParameters(parameters)
-                    .getPaymentTokenAddress();
+                address paymentToken = deliveryPaymentToken;
                 require(
                     IERC20(paymentToken).balanceOf(_receiver) >= amount &&
                         IERC20(paymentToken).allowance(
@@ -253,8 +252,7 @@ contract OPTIONS is EXERCISE, OptionAssets, DELIVERY, STANDARD, Ownable {
                 amount =
                     (spotPrice - strikePrice) *
                     asset.balanceOf(msg.sender);
-                address paymentToken = IParameters(parameters)
-                    .getPaymentTokenAddress();
+                address paymentToken = deliveryPaymentToken;
                 require(
                     IERC20(paymentToken).balanceOf(msg.sender) >= amount &&
                         IERC20(paymentToken).allowance(
@@ -0,0 +1,154 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity ^0.8.17;
+
+import {IERC20} from "@openzeppelin/contracts/token/ERC20/IERC20.sol";
+import "./IAsset.sol";
+import "./IPAYOUT.sol";
+
+// Accrue and claim distribution of periodic payments. Instead of pushing a payment to every token holder, the
+// owner funds a payment period once by adding its payout per token to a cumulative index. Each token holder's
+// entitlement is settled against the index whenever their balance changes (through the asset's transfer hook)
+// and paid out when they call claim(), so both funding and claiming cost O(1) regardless of the holder count.
+abstract contract PAYOUT is IPAYOUT {
+    ///////////////////
+    // Errors /////////
+    ///////////////////
+    error Payout__CallerIsNotTheAsset();
+    error Payout__ClaimModeIsEnabled();
+    error Payout__ClaimModeIsNotEnabled();
+    error Payout__PayoutLedgerIsNotSet();
+    error Payout__NothingToClaim();
+    error Payout__TransferFailed();
+
+    ////////////////////
+    // State Variables /
+    ///////////////////
+    // Indicates if payments are funded per payment period and claimed by the token holders instead of being pushed
+    bool public claimMode;
+    // Sum of the payouts per token of every funded payment period
+    uint256 public cumulativePayoutPerToken;
+    // Refers to the funded payouts that have not been claimed yet
+    uint256 public unclaimedPayouts;
+
+    ///////////////////
+    // Mappings ///////
+    ///////////////////
+    mapping(address => uint256) public investorToPayoutCheckpoint;
+    mapping(address => uint256) public investorToAccruedPayout;
+    mapping(uint256 => bool) public paymentPeriodToFundingStatus;
+
+    ///////////////////
+    // Events /////////
+    ///////////////////
+    event PaymentPeriodFunded(
+        uint256 indexed paymentPeriod,
+        uint256 payoutPerToken,
+        uint256 totalPayout
+    );
+    event PayoutClaimed(address indexed investor, uint256 amount);
+
+    ///////////////////
+    // Modifiers //////
+    ///////////////////
+    modifier isNotInClaimMode() {
+        if (claimMode) {
+            revert Payout__ClaimModeIsEnabled();
+        }
+        _;
+    }
+
+    modifier isInClaimMode() {
+        if (!claimMode) {
+            revert Payout__ClaimModeIsNotEnabled();
+        }
+        _;
+    }
+
+    ///////////////////
+    // Functions //////
+    ///////////////////
+    function getPayoutAsset() internal view virtual returns (IAsset);
+
+    function getPayoutToken() internal view virtual returns (address);
+
+    function updatePayoutCheckpoint(address _investor) external override {
+        IAsset asset = getPayoutAsset();
+        if (msg.sender != address(asset)) {
+            revert Payout__CallerIsNotTheAsset();
+        }
+        checkpointPayout(asset, _investor);
+    }
+
+    function claim() external isInClaimMode returns (uint256) {
+        checkpointPayout(getPayoutAsset(), msg.sender);
+        uint256 amount = investorToAccruedPayout[msg.sender];
+        if (amount == 0) {
+            revert Payout__NothingToClaim();
+        }
+        investorToAccruedPayout[msg.sender] = 0;
+        unclaimedPayouts -= amount;
+        bool success = IERC20(getPayoutToken()).transfer(msg.sender, amount);
+        if (!success) {
+            revert Payout__TransferFailed();
+        }
+        emit PayoutClaimed(msg.sender, amount);
+        return amount;
+    }
+
+    function claimablePayout(address _investor) external view returns (uint256) {
+        IAsset asset = getPayoutAsset();
+        if (_investor == asset.owner()) {
+            return 0;
+        }
+        return
+            investorToAccruedPayout[_investor] +
+            asset.balanceOf(_investor) *
+            (cumulativePayoutPerToken - investorToPayoutCheckpoint[_investor]);
+    }
+
+    // Switches the contract from pushed payments to funded and claimed payments. The asset has to report
+    // balance changes to this contract first, otherwise entitlements could not be settled on transfers
+    function startClaimMode() internal isNotInClaimMode {
+        if (getPayoutAsset().payoutLedger() != address(this)) {
+            revert Payout__PayoutLedgerIsNotSet();
+        }
+        claimMode = true;
+    }
+
+    // Tokens held by the owner of the asset (the unissued supply) neither receive nor accrue payouts
+    function fundPaymentPeriod(
+        uint256 _paymentPeriod,
+        uint256 _payoutPerToken
+    ) internal isInClaimMode {
+        require(
+            !paymentPeriodToFundingStatus[_paymentPeriod],
+            "The payment period has already been funded"
+        );
+        IAsset asset = getPayoutAsset();
+        uint256 totalPayout = _payoutPerToken *
+            (asset.totalSupply() - asset.balanceOf(asset.owner()));
+        require(
+            IERC20(getPayoutToken()).balanceOf(address(this)) >=
+                unclaimedPayouts + totalPayout,
+            "You do not have sufficient balance to fund this payment period!"
+        );
+        cumulativePayoutPerToken += _payoutPerToken;
+        unclaimedPayouts += totalPayout;
+        paymentPeriodToFundingStatus[_paymentPeriod] = true;
+        emit PaymentPeriodFunded(_paymentPeriod, _payoutPerToken, totalPayout);
+    }
+
+    function checkpointPayout(IAsset _asset, address _investor) internal {
+        if (_investor == _asset.owner()) {
+            return;
+        }
+        uint256 checkpoint = investorToPayoutCheckpoint[_investor];
+        if (checkpoint != cumulativePayoutPerToken) {
+            investorToAccruedPayout[_investor] +=
+                _asset.balanceOf(_investor) *
+                (cumulativePayoutPerToken - checkpoint);
+            investorToPayoutCheckpoint[_investor] = cumulativePayoutPerToken;
+        }
+    }
+}
@@ -52,4 +52,24 @@ contract PayingEquity is Voting, REDEMPTION, INCOME, FORM {
         )
         FORM(config._formState)
     {}
+
+    ///////////////////
+    // Functions //////
+    ///////////////////
+    // Opens a ballot weighted by the shares each holder had at the start of the current payment period. The
+    // asset of the equity needs a checkpoint schedule
+    function createShareholderBallot(
+        string memory _proposal,
+        string[] memory _options,
+        uint256 _startTime,
+        uint256 _duration
+    ) external onlyOwner {
+        createSnapshotBallot(
+            _proposal,
+            _options,
+            _startTime,
+            _duration,
+            address(getPayoutAsset())
+        );
+    }
 }
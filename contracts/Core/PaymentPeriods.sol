@@ -0,0 +1,35 @@
+// SPDX-License-Identifier: MIT
+
+pragma solidity ^0.8.17;
+
+// Payment period arithmetic shared by the instruments. The length and the number per year of the payment
+// periods of each frequency are packed into constants, one field per PaymentFrequency value (NONE, DAILY,
+// WEEKLY, SEMIMONTHLY, MONTHLY, ANNUALY), so a lookup is a shift instead of a storage read.
+library PaymentPeriods {
+    // 32 bits per frequency: 0, 86400, 604800, 1209600, 2629800 and 31556952 seconds
+    uint256 internal constant SECONDS_PER_PERIOD =
+        0x01e18558_002820a8_00127500_00093a80_00015180_00000000;
+    // 16 bits per frequency: 0, 365, 52, 24, 12 and 1 payment periods
+    uint256 internal constant PERIODS_PER_YEAR =
+        0x0001_000c_0018_0034_016d_0000;
+
+    function secondsPerPeriod(
+        uint256 frequency
+    ) internal pure returns (uint256) {
+        return (SECONDS_PER_PERIOD >> (frequency * 32)) & 0xffffffff;
+    }
+
+    function periodsPerYear(uint256 frequency) internal pure returns (uint256) {
+        return (PERIODS_PER_YEAR >> (frequency * 16)) & 0xffff;
+    }
+
+    // Index of the payment period `timestamp` falls in, counted from `start`. Reverts for the NONE
+    // frequency, which has no payment periods
+    function periodAt(
+        uint256 start,
+        uint256 timestamp,
+        uint256 frequency
+    ) internal pure returns (uint256) {
+        return (timestamp - start) / secondsPerPeriod(frequency);
+    }
+}
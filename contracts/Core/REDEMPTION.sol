@@ -51,6 +51,10 @@ contract REDEMPTION is Ownable {
     address[] public authorizedExchangeableTokens;
     // Set to the address of the parameters contract
     address public param;
+    // Addresses read from the parameters contract at deployment, it has no setters
+    IAsset private immutable redemptionAsset;
+    address private immutable redemptionPaymentToken;
+    IIdentityRegistry private immutable redemptionIdentityRegistry;
 
     ///////////////////
     // Mappings ///////
@@ -110,26 +114,21 @@ contract REDEMPTION is Ownable {
     }
 
     modifier hasSufficientBalance(uint256 _amount, address _sender) {
-        IAsset asset = IAsset(IParameters(param).getAssetAddress());
-        if (_amount > asset.balanceOf(_sender)) {
+        if (_amount > redemptionAsset.balanceOf(_sender)) {
             revert Token__InsufficientTokenBalance();
         }
         _;
     }
 
     modifier hasSufficientAllowance(uint256 _amount, address _sender) {
-        IAsset asset = IAsset(IParameters(param).getAssetAddress());
-        if (_amount > asset.allowance(msg.sender, address(this))) {
+        if (_amount > redemptionAsset.allowance(msg.sender, address(this))) {
             revert Token__InsufficientTokenAllowance();
         }
         _;
     }
 
     modifier isVerified() {
-        IIdentityRegistry identityRegistry = IIdentityRegistry(
-            IParameters(param).getIdentityRegistryAddress()
-        );
-        if (!IIdentityRegistry(identityRegistry).isVerified(msg.sender)) {
+        if (!redemptionIdentityRegistry.isVerified(msg.sender)) {
             revert Token__InvestorNotVerified();
         }
         _;
@@ -147,6 +146,12 @@ contract REDEMPTION is Ownable {
     ) {
         redemptionState = _redemptionState;
         param = _parameters;
+        redemptionAsset = IAsset(IParameters(_parameters).getAssetAddress());
+        redemptionPaymentToken = IParameters(_parameters)
+            .getPaymentTokenAddress();
+        redemptionIdentityRegistry = IIdentityRegistry(
+            IParameters(_parameters).getIdentityRegistryAddress()
+        );
         if ((_redemptionState != Redemption.PERPETUAL)) {
             require(
                 _maturityDate > block.timestamp,
@@ -197,8 +202,7 @@ contract REDEMPTION is Ownable {
         hasSufficientAllowance(_amount, msg.sender)
     {
         uint256 totalAmount = _amount * conversionRate[_exchangeToken];
-        IAsset asset = IAsset(IParameters(param).getAssetAddress());
-        asset.transferFrom(msg.sender, address(this), _amount);
+        redemptionAsset.transferFrom(msg.sender, address(this), _amount);
         bool success = IERC20(_exchangeToken).transfer(msg.sender, totalAmount);
         if (!success) {
             revert Equity__ExchangeFailed();
@@ -229,14 +233,13 @@ contract REDEMPTION is Ownable {
             block.timestamp >= buybackDate,
             "The token cannot be redeemed before the buyback date has passed!"
         );
-        address paymentToken = IParameters(param).getPaymentTokenAddress();
+        address paymentToken = redemptionPaymentToken;
         uint256 price = callPrice;
         require(
             price * _amount <= IERC20(paymentToken).balanceOf(address(this)),
             "The smart contract does not have sufficient funds"
         );
-        IAsset asset = IAsset(IParameters(param).getAssetAddress());
-        asset.transferFrom(msg.sender, address(this), _amount);
+        redemptionAsset.transferFrom(msg.sender, address(this), _amount);
         bool success = IERC20(paymentToken).transfer(
             msg.sender,
             price * _amount
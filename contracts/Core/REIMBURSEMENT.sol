@@ -6,6 +6,8 @@ import "@openzeppelin/contracts/access/Ownable.sol";
 import {IERC20} from "@openzeppelin/contracts/token/ERC20/IERC20.sol";
 import "./IParameters.sol";
 import "./IAsset.sol";
+import {FixedPointMath} from "./FixedPointMath.sol";
+import {PaymentPeriods} from "./PaymentPeriods.sol";
 
 contract REIMBURSEMENT is Ownable {
     ///////////////////
@@ -79,28 +81,41 @@ contract REIMBURSEMENT is Ownable {
     uint256 public startDate;
     // Refers to the ending date of the put period
     uint256 public endDate;
-    ////////////////////
-    // Constants ///////
-    ///////////////////
-    uint256 private constant AVERAGE_SECONDS_IN_A_DAY = 86400;
-    uint256 private constant AVERAGE_SECONDS_IN_A_WEEK = 604800;
-    uint256 private constant AVERAGE_SECONDS_IN_SEMI_MONTH = 1209600;
-    uint256 private constant AVERAGE_SECONDS_IN_A_MONTH = 2629800; //2628288;
-    uint256 private constant AVERAGE_SECONDS_IN_A_YEAR = 31556952;
-    uint256 private constant DAYS_IN_A_YEAR = 365;
-    uint256 private constant WEEKS_IN_A_YEAR = 52;
-    uint256 private constant SEMI_MONTHS_IN_A_YEAR = 24;
-    uint256 private constant MONTHS_IN_A_YEAR = 12;
-    uint256 private constant YEAR_IN_A_YEAR = 1;
     ///////////////////
     // Mappings ///////
     ///////////////////
-    mapping(PaymentFreq => uint256) private paymentFrequencyToSeconds;
-    mapping(PaymentFreq => uint256) private paymentFrequencyToLoanTerm;
-    mapping(address => mapping(uint256 => bool))
-        public rinvestorToPaymentPeriodToStatus;
+    // Paid payment periods per investor, bit (period & 0xff) of word (period >> 8)
+    mapping(address => mapping(uint256 => uint256)) public rpaidPaymentPeriods;
     mapping(address => bool) public investorToMaturityPaymentStatus;
 
+    ///////////////////
+    // Events /////////
+    ///////////////////
+    event MaturityPaymentPaid(
+        address indexed investor,
+        uint256 indexed paymentPeriod,
+        uint256 amount,
+        address indexed paymentToken
+    );
+    event AmortizedPaymentPaid(
+        address indexed investor,
+        uint256 indexed paymentPeriod,
+        uint256 amount,
+        address indexed paymentToken
+    );
+    event TokenCalled(
+        address indexed investor,
+        uint256 indexed paymentPeriod,
+        uint256 amount,
+        address indexed paymentToken
+    );
+    event TokenPut(
+        address indexed investor,
+        uint256 indexed paymentPeriod,
+        uint256 amount,
+        address indexed paymentToken
+    );
+
     ///////////////////
     // Modifiers //////
     ///////////////////
@@ -231,26 +246,6 @@ contract REIMBURSEMENT is Ownable {
             );
             rmaturityDate = _maturityDate;
         }
-        paymentFrequencyToSeconds[PaymentFreq.DAILY] = AVERAGE_SECONDS_IN_A_DAY;
-        paymentFrequencyToSeconds[
-            PaymentFreq.SEMIMONTHLY
-        ] = AVERAGE_SECONDS_IN_SEMI_MONTH;
-        paymentFrequencyToSeconds[
-            PaymentFreq.WEEKLY
-        ] = AVERAGE_SECONDS_IN_A_WEEK;
-        paymentFrequencyToSeconds[
-            PaymentFreq.MONTHLY
-        ] = AVERAGE_SECONDS_IN_A_MONTH;
-        paymentFrequencyToSeconds[
-            PaymentFreq.ANNUALY
-        ] = AVERAGE_SECONDS_IN_A_YEAR;
-        paymentFrequencyToLoanTerm[PaymentFreq.DAILY] = DAYS_IN_A_YEAR;
-        paymentFrequencyToLoanTerm[PaymentFreq.WEEKLY] = WEEKS_IN_A_YEAR;
-        paymentFrequencyToLoanTerm[
-            PaymentFreq.SEMIMONTHLY
-        ] = SEMI_MONTHS_IN_A_YEAR;
-        paymentFrequencyToLoanTerm[PaymentFreq.MONTHLY] = MONTHS_IN_A_YEAR;
-        paymentFrequencyToLoanTerm[PaymentFreq.ANNUALY] = YEAR_IN_A_YEAR;
         rcontractDeploymentTime = block.timestamp;
         if (
             reimbursementState == Reimbursement.AMORTIZATION ||
@@ -261,13 +256,13 @@ contract REIMBURSEMENT is Ownable {
             uint256 PRECISION = IParameters(rparameters).getPrecision();
             periodicInterestRate =
                 (rinterestRate * 10 ** PRECISION) /
-                (paymentFrequencyToLoanTerm[rpaymentFrequency] * 100);
+                (PaymentPeriods.periodsPerYear(uint8(rpaymentFrequency)) * 100);
             loanTerm =
                 (rmaturityDate *
                     10 ** PRECISION -
                     rcontractDeploymentTime *
                     10 ** PRECISION) /
-                paymentFrequencyToSeconds[rpaymentFrequency];
+                PaymentPeriods.secondsPerPeriod(uint8(rpaymentFrequency));
         }
         perpetualStatus =
             reimbursementState == Reimbursement.PERPETUAL ||
@@ -304,14 +299,18 @@ contract REIMBURSEMENT is Ownable {
                 rfaceValue * asset.balanceOf(_investor),
             "You do not have sufficient balance to pay this token holder"
         );
-        bool success = IERC20(paymentToken).transfer(
-            _investor,
-            rfaceValue * asset.balanceOf(_investor)
-        );
+        uint256 payment = rfaceValue * asset.balanceOf(_investor);
+        bool success = IERC20(paymentToken).transfer(_investor, payment);
         if (!success) {
             revert Debt__ExchangeFailed();
         }
         investorToMaturityPaymentStatus[_investor] = true;
+        emit MaturityPaymentPaid(
+            _investor,
+            getReimbursementPeriod(),
+            payment,
+            paymentToken
+        );
     }
 
     function payAtMaturityToAll() public onlyOwner hasMaturityPayment {
@@ -328,13 +327,19 @@ contract REIMBURSEMENT is Ownable {
                 rfaceValue * asset.totalSupply(),
             "You do not have sufficient balance to pay this token holder"
         );
+        uint256 period = getReimbursementPeriod();
         for (uint256 i = 0; i < tokenHolders.length; i++) {
             if (!investorToMaturityPaymentStatus[tokenHolders[i]]) {
-                IERC20(paymentToken).transfer(
+                uint256 payment = rfaceValue *
+                    asset.balanceOf(tokenHolders[i]);
+                IERC20(paymentToken).transfer(tokenHolders[i], payment);
+                investorToMaturityPaymentStatus[tokenHolders[i]] = true;
+                emit MaturityPaymentPaid(
                     tokenHolders[i],
-                    rfaceValue * asset.balanceOf(tokenHolders[i])
+                    period,
+                    payment,
+                    paymentToken
                 );
-                investorToMaturityPaymentStatus[tokenHolders[i]] = true;
             }
         }
     }
@@ -353,6 +358,23 @@ contract REIMBURSEMENT is Ownable {
             denominator;
     }
 
+    // Sets the periodic payment to the annuity of the periodic interest rate over the loan term, computed
+    // on-chain instead of passing a precomputed numerator and denominator to setAmortizationSchedule.
+    // A loan term shorter than one payment period leaves nothing to amortize over and reverts
+    function computeAmortizationSchedule() public onlyOwner isAmortizable {
+        uint256 PRECISION = IParameters(rparameters).getPrecision();
+        uint256 periods = loanTerm / 10 ** PRECISION;
+        if (periods == 0) {
+            revert Debt__InputParameterIsZero();
+        }
+        (uint256 numerator, uint256 denominator) = FixedPointMath.annuity(
+            periodicInterestRate,
+            periods,
+            10 ** PRECISION
+        );
+        setAmortizationSchedule(numerator, denominator);
+    }
+
     function payAmortizedPayments(
         address _tokenHolder
     )
@@ -376,19 +398,31 @@ contract REIMBURSEMENT is Ownable {
             IERC20(paymentToken).balanceOf(address(this)) >= payment,
             "You do not have sufficient balance to pay this investor!"
         );
-        uint256 duration = (block.timestamp - rcontractDeploymentTime) /
-            paymentFrequencyToSeconds[rpaymentFrequency];
+        uint256 duration = PaymentPeriods.periodAt(
+            rcontractDeploymentTime,
+            block.timestamp,
+            uint8(rpaymentFrequency)
+        );
         require(
-            !rinvestorToPaymentPeriodToStatus[_tokenHolder][duration],
+            !rinvestorToPaymentPeriodToStatus(_tokenHolder, duration),
             "The token holder has already been paid for this payment period"
         );
         bool success = IERC20(paymentToken).transfer(_tokenHolder, payment);
         if (!success) {
             revert Debt__ExchangeFailed();
         }
-        rinvestorToPaymentPeriodToStatus[_tokenHolder][duration] = true;
-        uint256 maxPeriod = (rmaturityDate - rcontractDeploymentTime) /
-            paymentFrequencyToSeconds[rpaymentFrequency];
+        rmarkPaymentPeriodPaid(_tokenHolder, duration);
+        emit AmortizedPaymentPaid(
+            _tokenHolder,
+            duration,
+            payment,
+            paymentToken
+        );
+        uint256 maxPeriod = PaymentPeriods.periodAt(
+            rcontractDeploymentTime,
+            rmaturityDate,
+            uint8(rpaymentFrequency)
+        );
         if (duration >= maxPeriod) {
             investorToMaturityPaymentStatus[_tokenHolder] = true;
         }
@@ -410,23 +444,31 @@ contract REIMBURSEMENT is Ownable {
                 (asset.totalSupply() * periodicPayment) / 10 ** PRECISION,
             "You do not have sufficient balance to pay all token holders!"
         );
-        uint256 duration = (block.timestamp - rcontractDeploymentTime) /
-            paymentFrequencyToSeconds[rpaymentFrequency];
-        uint256 maxPeriod = (rmaturityDate - rcontractDeploymentTime) /
-            paymentFrequencyToSeconds[rpaymentFrequency];
+        uint256 duration = PaymentPeriods.periodAt(
+            rcontractDeploymentTime,
+            block.timestamp,
+            uint8(rpaymentFrequency)
+        );
+        uint256 maxPeriod = PaymentPeriods.periodAt(
+            rcontractDeploymentTime,
+            rmaturityDate,
+            uint8(rpaymentFrequency)
+        );
         for (uint256 i = 0; i < tokenHolders.length; i++) {
             if (
-                !rinvestorToPaymentPeriodToStatus[tokenHolders[i]][duration] &&
+                !rinvestorToPaymentPeriodToStatus(tokenHolders[i], duration) &&
                 !investorToMaturityPaymentStatus[tokenHolders[i]]
             ) {
-                IERC20(paymentToken).transfer(
+                uint256 payment = (periodicPayment *
+                    asset.balanceOf(tokenHolders[i])) / 10 ** PRECISION;
+                IERC20(paymentToken).transfer(tokenHolders[i], payment);
+                rmarkPaymentPeriodPaid(tokenHolders[i], duration);
+                emit AmortizedPaymentPaid(
                     tokenHolders[i],
-                    ((periodicPayment * asset.balanceOf(tokenHolders[i])) /
-                        10 ** PRECISION)
+                    duration,
+                    payment,
+                    paymentToken
                 );
-                rinvestorToPaymentPeriodToStatus[tokenHolders[i]][
-                    duration
-                ] = true;
                 if (duration >= maxPeriod) {
                     investorToMaturityPaymentStatus[tokenHolders[i]] = true;
                 }
@@ -451,13 +493,22 @@ contract REIMBURSEMENT is Ownable {
         setAmortizationSchedule(numerator, denominator);
     }
 
+    // Rebalances the periodic payment to the new rate in the same transaction
+    function modifyAmortizedInterestRate(
+        uint256 _rate
+    ) public onlyOwner risNonZero(_rate) isAmortizable {
+        rinterestRate = _rate;
+        periodicInterestRate = calculatePeriodicInterestRate(_rate);
+        computeAmortizationSchedule();
+    }
+
     function calculatePeriodicInterestRate(
         uint256 _rate
     ) public view risNonZero(_rate) returns (uint256) {
         uint256 PRECISION = IParameters(rparameters).getPrecision();
         return
             (_rate * 10 ** PRECISION) /
-            (paymentFrequencyToLoanTerm[rpaymentFrequency] * 100);
+            (PaymentPeriods.periodsPerYear(uint8(rpaymentFrequency)) * 100);
     }
 
     function issueToken(
@@ -481,14 +532,18 @@ contract REIMBURSEMENT is Ownable {
             IERC20(paymentToken).balanceOf(address(this)) >= balance + _amount,
             "You do not have sufficient funds to reimburse this token holder!"
         );
-        bool success = IERC20(paymentToken).transfer(
-            _tokenHolder,
-            balance * rfaceValue + _amount
-        );
+        uint256 payment = balance * rfaceValue + _amount;
+        bool success = IERC20(paymentToken).transfer(_tokenHolder, payment);
         if (!success) {
             revert Debt__ExchangeFailed();
         }
         asset.burn(_tokenHolder, balance);
+        emit TokenCalled(
+            _tokenHolder,
+            getReimbursementPeriod(),
+            payment,
+            paymentToken
+        );
     }
 
     function callTokenFromAll(uint256 _amount) public onlyOwner isCallable {
@@ -503,12 +558,14 @@ contract REIMBURSEMENT is Ownable {
                 balance * rfaceValue + _amount * tokenHolders.length,
             "You do not have sufficient funds to reimburse all token holders!"
         );
+        uint256 period = getReimbursementPeriod();
         for (uint256 i = 0; i < tokenHolders.length; i++) {
-            IERC20(paymentToken).transfer(
-                tokenHolders[i],
-                asset.balanceOf(tokenHolders[i]) * rfaceValue + _amount
-            );
+            uint256 payment = asset.balanceOf(tokenHolders[i]) *
+                rfaceValue +
+                _amount;
+            IERC20(paymentToken).transfer(tokenHolders[i], payment);
             asset.burn(tokenHolders[i], asset.balanceOf(tokenHolders[i]));
+            emit TokenCalled(tokenHolders[i], period, payment, paymentToken);
         }
     }
 
@@ -559,6 +616,43 @@ contract REIMBURSEMENT is Ownable {
             revert Debt__ExchangeFailed();
         }
         asset.burn(msg.sender, _amount);
+        emit TokenPut(
+            msg.sender,
+            getReimbursementPeriod(),
+            _amount * rfaceValue,
+            paymentToken
+        );
+    }
+
+    function rinvestorToPaymentPeriodToStatus(
+        address _investor,
+        uint256 _paymentPeriod
+    ) public view returns (bool) {
+        return
+            (rpaidPaymentPeriods[_investor][_paymentPeriod >> 8] &
+                (1 << (_paymentPeriod & 0xff))) != 0;
+    }
+
+    // Sets the bit of a payment period, consecutive periods of an investor update the same word
+    function rmarkPaymentPeriodPaid(
+        address _investor,
+        uint256 _paymentPeriod
+    ) private {
+        rpaidPaymentPeriods[_investor][_paymentPeriod >> 8] |=
+            1 << (_paymentPeriod & 0xff);
+    }
+
+    // Payment period the current block falls in, used to tag the payout events. Tokens without periodic
+    // payments have a single payment period
+    function getReimbursementPeriod() private view returns (uint256) {
+        if (rpaymentFrequency == PaymentFreq.NONE) {
+            return 0;
+        }
+        return PaymentPeriods.periodAt(
+            rcontractDeploymentTime,
+            block.timestamp,
+            uint8(rpaymentFrequency)
+        );
     }
 
     function getPeriodicPayment() public view returns (uint256) {
@@ -6,9 +6,14 @@ import "@openzeppelin/contracts/access/Ownable.sol";
 import "@openzeppelin/contracts/token/ERC20/ERC20.sol";
 import {IERC20} from "@openzeppelin/contracts/token/ERC20/IERC20.sol";
 import {IIdentityRegistry} from "@T-REX/contracts/registry/interface/IIdentityRegistry.sol";
+import {SafeCast} from "@openzeppelin/contracts/utils/math/SafeCast.sol";
 import {Asset} from "./Asset.sol";
+import {ECDSA} from "@openzeppelin/contracts/utils/cryptography/ECDSA.sol";
+import {EIP712} from "@openzeppelin/contracts/utils/cryptography/EIP712.sol";
+import {FixedPointMath} from "./FixedPointMath.sol";
+import {PaymentPeriods} from "./PaymentPeriods.sol";
 
-contract Token is Ownable {
+contract Token is Ownable, EIP712 {
     ///////////////////
     // Errors /////////
     ///////////////////
@@ -84,6 +89,30 @@ contract Token is Ownable {
     ///////////////////
     // Struct /////////
     ///////////////////
+    // Every modifier and payout reads its flags from this slot, so a call loads it once and
+    // later reads are warm
+    struct TokenConfig {
+        // Used to specify remdemption state of the token
+        Redemption redemptionState;
+        // Used to specify payment frequency of the token
+        PaymentFrequency paymentFrequency;
+        // Used to specify type of interest rate of the token
+        InterestType interestType;
+        // Used to specify redemption/reimbursement (payout at maturity) state of the token
+        Reimbursement reimbursementState;
+        // Indicates if the reimbursement is of perpetual type
+        bool perpetualStatus;
+        // Used to specify maturity date of the token
+        uint64 maturityDate;
+        // Set to the current block timestamp when the contract is deployed
+        uint64 contractDeploymentTime;
+    }
+
+    struct PutPeriod {
+        uint64 startDate;
+        uint64 endDate;
+    }
+
     struct CashReceipt {
         uint256 receiptNumber;
         uint256 date;
@@ -99,22 +128,21 @@ contract Token is Ownable {
         InterestType _interestType;
     }
 
+    struct TokenTerms {
+        uint256 _maturityDate;
+        address _paymentToken;
+        address _identityRegistry;
+        uint256 _price;
+        uint256 _faceValue;
+        uint256 _interestRate;
+    }
+
     ////////////////////
     // State Variables /
     ///////////////////
 
-    // Used to specify remdemption state of the token
-    Redemption public redemptionState;
-    // Used to specify payment frequency of the token
-    PaymentFrequency public paymentFrequency;
-    // Used to specify type of interest rate of the token
-    InterestType public interestType;
-    // Used to specify redemption/reimbursement (payout at maturity) state of the token
-    Reimbursement public reimbursementState;
-    // Used to specify maturity date of the token
-    uint256 public maturityDate;
-    // Set to the current block timestamp when the contract is deployed
-    uint256 public contractDeploymentTime;
+    // Redemption, payment and reimbursement configuration of the token, packed into a single slot
+    TokenConfig private config;
     // Used to maintain an array of authorized tokens that can exchanged or redeemed for this token
     address[] public authorizedExchangeableTokens;
     // Set to the address of the underlying payment currency during contract deployment
@@ -127,6 +155,8 @@ contract Token is Ownable {
     uint256 public faceValue;
     // Refers to the underlying token created during contract deployment
     Asset private asset;
+    // Set once the token is set up, by the constructor or by initialize() on a minimal proxy clone
+    bool public initialized;
     // Keeps track of the current payment period if the token grants the investors the right to receive periodic payments
     uint256 private paymentPeriod;
     // Refers to the interest rate of the token set during contract deployment. Can optionally be modified if interest rate type is variable
@@ -137,48 +167,85 @@ contract Token is Ownable {
     uint256 public loanTerm;
     // Refers to the periodic payment amounts that the issuer has to pay to the token holders
     uint256 public periodicPayment;
-    // Indicates if the reimbursement is of perpetual type
-    bool public perpetualStatus;
-    // Refers to the starting date of the put period
-    uint256 public startDate;
-    // Refers to the ending date of the put period
-    uint256 public endDate;
+    // Refers to the starting and ending dates of the put period
+    PutPeriod private putPeriod;
+    // Index of the first token holder not yet covered by the batched maturity payouts
+    uint256 public maturityPaymentCursor;
     ////////////////////
     // Constants ///////
     ///////////////////
-    uint256 private constant AVERAGE_SECONDS_IN_A_DAY = 86400;
-    uint256 private constant AVERAGE_SECONDS_IN_A_WEEK = 604800;
-    uint256 private constant AVERAGE_SECONDS_IN_SEMI_MONTH = 1209600;
-    uint256 private constant AVERAGE_SECONDS_IN_A_MONTH = 2629800; //2628288;
-    uint256 private constant AVERAGE_SECONDS_IN_A_YEAR = 31556952;
     uint256 private constant INTEREST_RATE_PRECISION = 1000;
-    uint256 private constant DAYS_IN_A_YEAR = 365;
-    uint256 private constant WEEKS_IN_A_YEAR = 52;
-    uint256 private constant SEMI_MONTHS_IN_A_YEAR = 24;
-    uint256 private constant MONTHS_IN_A_YEAR = 12;
-    uint256 private constant YEAR_IN_A_YEAR = 1;
     uint256 private constant PRECISION = 8;
+    // EIP-712 type of the receipts of payInterestInCashBatch, bound to the payment period they are paid in
+    bytes32 private constant CASH_RECEIPT_TYPEHASH =
+        keccak256(
+            "CashReceipt(uint256 receiptNumber,uint256 date,address tokenHolder,uint256 amount,uint256 paymentPeriod)"
+        );
     ///////////////////
     // Mappings ///////
     ///////////////////
     mapping(address => uint256) public conversionRate;
-    mapping(PaymentFrequency => uint256) private paymentFrequencyToSeconds;
-    mapping(PaymentFrequency => uint256) private paymentFrequencyToLoanTerm;
-    mapping(address => mapping(uint256 => bool))
-        public investorToPaymentPeriodToStatus;
-    mapping(address => mapping(uint256 => CashReceipt))
-        public investorToPaymentPeriodToReceipt;
+    // Paid payment periods per investor, bit (period & 0xff) of word (period >> 8)
+    mapping(address => mapping(uint256 => uint256)) public paidPaymentPeriods;
+    // Hash of the cash receipt recorded for each investor and payment period, the receipt itself is
+    // only emitted in CashReceiptRecorded
+    mapping(address => mapping(uint256 => bytes32))
+        public investorToPaymentPeriodToReceiptHash;
     mapping(address => bool) public investorToMaturityPaymentStatus;
+    // Index of the first token holder not yet covered by the batched payouts of a payment period
+    mapping(uint256 => uint256) public paymentPeriodToCursor;
+    ///////////////////
+    // Events /////////
+    ///////////////////
+    // Cash payments are settled off-chain, so their InterestPaid events carry a zero payment token
+    event InterestPaid(
+        address indexed investor,
+        uint256 indexed paymentPeriod,
+        uint256 amount,
+        address indexed paymentToken
+    );
+    event CashReceiptRecorded(
+        address indexed tokenHolder,
+        uint256 indexed paymentPeriod,
+        uint256 receiptNumber,
+        uint256 date,
+        uint256 amount,
+        bytes signature
+    );
+    event MaturityPaymentPaid(
+        address indexed investor,
+        uint256 indexed paymentPeriod,
+        uint256 amount,
+        address indexed paymentToken
+    );
+    event AmortizedPaymentPaid(
+        address indexed investor,
+        uint256 indexed paymentPeriod,
+        uint256 amount,
+        address indexed paymentToken
+    );
+    event TokenCalled(
+        address indexed investor,
+        uint256 indexed paymentPeriod,
+        uint256 amount,
+        address indexed paymentToken
+    );
+    event TokenPut(
+        address indexed investor,
+        uint256 indexed paymentPeriod,
+        uint256 amount,
+        address indexed paymentToken
+    );
     ///////////////////
     // Modifiers //////
     ///////////////////
     modifier isExchangeable() {
         if (
-            (redemptionState != Redemption.EXCHANGEABLE &&
-                redemptionState != Redemption.REDEEMABLE_EXCHANGEABLE &&
-                redemptionState !=
+            (config.redemptionState != Redemption.EXCHANGEABLE &&
+                config.redemptionState != Redemption.REDEEMABLE_EXCHANGEABLE &&
+                config.redemptionState !=
                 Redemption.REDEEMABLE_EXCHANGEABLE_EXTENDIBLE) &&
-            (interestType != InterestType.PAYMENT_IN_KIND)
+            (config.interestType != InterestType.PAYMENT_IN_KIND)
         ) {
             revert Token__TokenIsNotOfExchangeableType();
         }
@@ -187,11 +254,11 @@ contract Token is Ownable {
 
     modifier isExtendible() {
         if (
-            (redemptionState != Redemption.EXTENDIBLE &&
-                redemptionState != Redemption.REDEEMABLE_EXTENDIBLE &&
-                redemptionState !=
+            (config.redemptionState != Redemption.EXTENDIBLE &&
+                config.redemptionState != Redemption.REDEEMABLE_EXTENDIBLE &&
+                config.redemptionState !=
                 Redemption.REDEEMABLE_EXCHANGEABLE_EXTENDIBLE) &&
-            (reimbursementState != Reimbursement.EXTENDIBLE)
+            (config.reimbursementState != Reimbursement.EXTENDIBLE)
         ) {
             revert Token__TokenIsNotOfExtendibleType();
         }
@@ -200,9 +267,10 @@ contract Token is Ownable {
 
     modifier isRedeemable() {
         if (
-            redemptionState != Redemption.REDEEMABLE &&
-            redemptionState != Redemption.REDEEMABLE_EXTENDIBLE &&
-            redemptionState != Redemption.REDEEMABLE_EXCHANGEABLE_EXTENDIBLE
+            config.redemptionState != Redemption.REDEEMABLE &&
+            config.redemptionState != Redemption.REDEEMABLE_EXTENDIBLE &&
+            config.redemptionState !=
+            Redemption.REDEEMABLE_EXCHANGEABLE_EXTENDIBLE
         ) {
             revert Token__TokenIsNotOfRedeemableType();
         }
@@ -252,21 +320,21 @@ contract Token is Ownable {
     }
 
     modifier isPayable() {
-        if (paymentFrequency == PaymentFrequency.NONE) {
+        if (config.paymentFrequency == PaymentFrequency.NONE) {
             revert Token__TokenIsNotOfPayableType();
         }
         _;
     }
 
     modifier isVariable() {
-        if (interestType != InterestType.VARIABLE) {
+        if (config.interestType != InterestType.VARIABLE) {
             revert Token__InterestRateIsNotOfVariableType();
         }
         _;
     }
 
     modifier isPaymentInKind() {
-        if (interestType != InterestType.PAYMENT_IN_KIND) {
+        if (config.interestType != InterestType.PAYMENT_IN_KIND) {
             revert Token__InterestTypeIsNotPaymentInKind();
         }
         _;
@@ -274,8 +342,8 @@ contract Token is Ownable {
 
     modifier isFixedOrVariableRate() {
         if (
-            interestType != InterestType.FIXED &&
-            interestType != InterestType.VARIABLE
+            config.interestType != InterestType.FIXED &&
+            config.interestType != InterestType.VARIABLE
         ) {
             revert Token__InterestTypeIsNotFixedOrVariableRate();
         }
@@ -283,7 +351,7 @@ contract Token is Ownable {
     }
 
     modifier isCashPayment() {
-        if (interestType != InterestType.CASH) {
+        if (config.interestType != InterestType.CASH) {
             revert Token__InterestTypeIsNotCashPayment();
         }
         _;
@@ -299,12 +367,14 @@ contract Token is Ownable {
 
     modifier hasMaturityPayment() {
         if (
-            reimbursementState != Reimbursement.FIXED_MATURITY &&
-            reimbursementState != Reimbursement.FIXED_MATURITY_WITH_CALL &&
-            reimbursementState != Reimbursement.FIXED_MATURITY_WITH_PUT &&
-            reimbursementState !=
+            config.reimbursementState != Reimbursement.FIXED_MATURITY &&
+            config.reimbursementState !=
+            Reimbursement.FIXED_MATURITY_WITH_CALL &&
+            config.reimbursementState !=
+            Reimbursement.FIXED_MATURITY_WITH_PUT &&
+            config.reimbursementState !=
             Reimbursement.FIXED_MATURITY_WITH_PUT_AND_CALL &&
-            reimbursementState != Reimbursement.EXTENDIBLE
+            config.reimbursementState != Reimbursement.EXTENDIBLE
         ) {
             revert Token__ReimbursementIsNotofMaturityType();
         }
@@ -313,10 +383,11 @@ contract Token is Ownable {
 
     modifier isAmortizable() {
         if (
-            reimbursementState != Reimbursement.AMORTIZATION &&
-            reimbursementState != Reimbursement.AMORTIZATION_WITH_CALL &&
-            reimbursementState != Reimbursement.AMORTIZATION_WITH_PUT &&
-            reimbursementState != Reimbursement.AMORTIZATION_WITH_PUT_AND_CALL
+            config.reimbursementState != Reimbursement.AMORTIZATION &&
+            config.reimbursementState != Reimbursement.AMORTIZATION_WITH_CALL &&
+            config.reimbursementState != Reimbursement.AMORTIZATION_WITH_PUT &&
+            config.reimbursementState !=
+            Reimbursement.AMORTIZATION_WITH_PUT_AND_CALL
         ) {
             revert Token__ReimbursementIsNOtOfAmortizableType();
         }
@@ -325,10 +396,11 @@ contract Token is Ownable {
 
     modifier isNotAmortizable() {
         if (
-            reimbursementState == Reimbursement.AMORTIZATION ||
-            reimbursementState == Reimbursement.AMORTIZATION_WITH_CALL ||
-            reimbursementState == Reimbursement.AMORTIZATION_WITH_PUT ||
-            reimbursementState == Reimbursement.AMORTIZATION_WITH_PUT_AND_CALL
+            config.reimbursementState == Reimbursement.AMORTIZATION ||
+            config.reimbursementState == Reimbursement.AMORTIZATION_WITH_CALL ||
+            config.reimbursementState == Reimbursement.AMORTIZATION_WITH_PUT ||
+            config.reimbursementState ==
+            Reimbursement.AMORTIZATION_WITH_PUT_AND_CALL
         ) {
             revert Token__ReimbursementIsOfAmortizableType();
         }
@@ -337,13 +409,14 @@ contract Token is Ownable {
 
     modifier isCallable() {
         if (
-            reimbursementState != Reimbursement.FIXED_MATURITY_WITH_CALL &&
-            reimbursementState !=
+            config.reimbursementState !=
+            Reimbursement.FIXED_MATURITY_WITH_CALL &&
+            config.reimbursementState !=
             Reimbursement.FIXED_MATURITY_WITH_PUT_AND_CALL &&
-            reimbursementState != Reimbursement.AMORTIZATION_WITH_CALL &&
-            reimbursementState !=
+            config.reimbursementState != Reimbursement.AMORTIZATION_WITH_CALL &&
+            config.reimbursementState !=
             Reimbursement.AMORTIZATION_WITH_PUT_AND_CALL &&
-            reimbursementState != Reimbursement.PERPETUAL_WITH_CALL
+            config.reimbursementState != Reimbursement.PERPETUAL_WITH_CALL
         ) {
             revert Token__TokenIsNotOfCallableType();
         }
@@ -352,13 +425,14 @@ contract Token is Ownable {
 
     modifier isPutable() {
         if (
-            reimbursementState != Reimbursement.FIXED_MATURITY_WITH_PUT &&
-            reimbursementState !=
+            config.reimbursementState !=
+            Reimbursement.FIXED_MATURITY_WITH_PUT &&
+            config.reimbursementState !=
             Reimbursement.FIXED_MATURITY_WITH_PUT_AND_CALL &&
-            reimbursementState != Reimbursement.AMORTIZATION_WITH_PUT &&
-            reimbursementState !=
+            config.reimbursementState != Reimbursement.AMORTIZATION_WITH_PUT &&
+            config.reimbursementState !=
             Reimbursement.AMORTIZATION_WITH_PUT_AND_CALL &&
-            reimbursementState != Reimbursement.PERPETUAL_WITH_PUT
+            config.reimbursementState != Reimbursement.PERPETUAL_WITH_PUT
         ) {
             revert Token__TokenIsNotOfPutType();
         }
@@ -382,18 +456,50 @@ contract Token is Ownable {
         uint256 _price,
         uint256 _faceValue,
         uint256 _interestRate
-    ) {
+    ) EIP712("GenericTokenization", "1") {
         // _mint(address(this), _initialSupply);
         asset = new Asset(_initialSupply, _name, _symbol, _identityRegistry);
-        redemptionState = options._redemptionState;
-        reimbursementState = options._reimbursementState;
-        paymentFrequency = options._paymentFrequency;
-        interestType = options._interestType;
-        paymentToken = _paymentToken;
-        identityRegistry = _identityRegistry;
-        price = _price;
-        faceValue = _faceValue;
-        interestRate = _interestRate;
+        setUp(
+            options,
+            TokenTerms(
+                _maturityDate,
+                _paymentToken,
+                _identityRegistry,
+                _price,
+                _faceValue,
+                _interestRate
+            )
+        );
+    }
+
+    // Initializer of minimal proxy clones, which never run the constructor. The asset clone must already be
+    // initialized with this contract as its owner
+    function initialize(
+        address _asset,
+        address _owner,
+        TokenOptions memory options,
+        TokenTerms memory terms
+    ) external {
+        asset = Asset(_asset);
+        _transferOwnership(_owner);
+        setUp(options, terms);
+    }
+
+    function setUp(
+        TokenOptions memory options,
+        TokenTerms memory terms
+    ) private {
+        require(!initialized, "Token already initialized");
+        initialized = true;
+        config.redemptionState = options._redemptionState;
+        config.reimbursementState = options._reimbursementState;
+        config.paymentFrequency = options._paymentFrequency;
+        config.interestType = options._interestType;
+        paymentToken = terms._paymentToken;
+        identityRegistry = terms._identityRegistry;
+        price = terms._price;
+        faceValue = terms._faceValue;
+        interestRate = terms._interestRate;
         if (
             (options._redemptionState != Redemption.EXCHANGEABLE &&
                 options._redemptionState != Redemption.PERPETUAL) &&
@@ -404,54 +510,45 @@ contract Token is Ownable {
                 options._reimbursementState != Reimbursement.PERPETUAL_WITH_PUT)
         ) {
             require(
-                _maturityDate > block.timestamp,
+                terms._maturityDate > block.timestamp,
                 "Maturity/Buyback date should be greater than current time"
             );
-            maturityDate = _maturityDate;
+            config.maturityDate = SafeCast.toUint64(terms._maturityDate);
+        }
+        config.contractDeploymentTime = SafeCast.toUint64(block.timestamp);
+        if (config.paymentFrequency != PaymentFrequency.NONE) {
+            asset.setCheckpointSchedule(
+                config.contractDeploymentTime,
+                PaymentPeriods.secondsPerPeriod(
+                    uint8(config.paymentFrequency)
+                )
+            );
         }
-        paymentFrequencyToSeconds[
-            PaymentFrequency.DAILY
-        ] = AVERAGE_SECONDS_IN_A_DAY;
-        paymentFrequencyToSeconds[
-            PaymentFrequency.SEMIMONTHLY
-        ] = AVERAGE_SECONDS_IN_SEMI_MONTH;
-        paymentFrequencyToSeconds[
-            PaymentFrequency.WEEKLY
-        ] = AVERAGE_SECONDS_IN_A_WEEK;
-        paymentFrequencyToSeconds[
-            PaymentFrequency.MONTHLY
-        ] = AVERAGE_SECONDS_IN_A_MONTH;
-        paymentFrequencyToSeconds[
-            PaymentFrequency.ANNUALY
-        ] = AVERAGE_SECONDS_IN_A_YEAR;
-        paymentFrequencyToLoanTerm[PaymentFrequency.DAILY] = DAYS_IN_A_YEAR;
-        paymentFrequencyToLoanTerm[PaymentFrequency.WEEKLY] = WEEKS_IN_A_YEAR;
-        paymentFrequencyToLoanTerm[
-            PaymentFrequency.SEMIMONTHLY
-        ] = SEMI_MONTHS_IN_A_YEAR;
-        paymentFrequencyToLoanTerm[PaymentFrequency.MONTHLY] = MONTHS_IN_A_YEAR;
-        paymentFrequencyToLoanTerm[PaymentFrequency.ANNUALY] = YEAR_IN_A_YEAR;
-        contractDeploymentTime = block.timestamp;
         if (
-            reimbursementState == Reimbursement.AMORTIZATION ||
-            reimbursementState == Reimbursement.AMORTIZATION_WITH_CALL ||
-            reimbursementState == Reimbursement.AMORTIZATION_WITH_PUT ||
-            reimbursementState == Reimbursement.AMORTIZATION_WITH_PUT_AND_CALL
+            config.reimbursementState == Reimbursement.AMORTIZATION ||
+            config.reimbursementState == Reimbursement.AMORTIZATION_WITH_CALL ||
+            config.reimbursementState == Reimbursement.AMORTIZATION_WITH_PUT ||
+            config.reimbursementState ==
+            Reimbursement.AMORTIZATION_WITH_PUT_AND_CALL
         ) {
             periodicInterestRate =
                 (interestRate * 10 ** PRECISION) /
-                (paymentFrequencyToLoanTerm[paymentFrequency] * 100);
+                (PaymentPeriods.periodsPerYear(
+                    uint8(config.paymentFrequency)
+                ) * 100);
             loanTerm =
-                (maturityDate *
+                (config.maturityDate *
                     10 ** PRECISION -
-                    contractDeploymentTime *
+                    config.contractDeploymentTime *
                     10 ** PRECISION) /
-                paymentFrequencyToSeconds[paymentFrequency];
+                PaymentPeriods.secondsPerPeriod(
+                    uint8(config.paymentFrequency)
+                );
         }
-        perpetualStatus =
-            reimbursementState == Reimbursement.PERPETUAL ||
-            reimbursementState == Reimbursement.PERPETUAL_WITH_CALL ||
-            reimbursementState == Reimbursement.PERPETUAL_WITH_PUT;
+        config.perpetualStatus =
+            config.reimbursementState == Reimbursement.PERPETUAL ||
+            config.reimbursementState == Reimbursement.PERPETUAL_WITH_CALL ||
+            config.reimbursementState == Reimbursement.PERPETUAL_WITH_PUT;
     }
 
     function addExchangeableToken(
@@ -505,7 +602,7 @@ contract Token is Ownable {
             _buybackDate > block.timestamp,
             "Buyback date should be greater than current time"
         );
-        maturityDate = _buybackDate;
+        config.maturityDate = SafeCast.toUint64(_buybackDate);
     }
 
     function redeemToken(
@@ -519,7 +616,7 @@ contract Token is Ownable {
         hasSufficientAllowance(_amount, msg.sender)
     {
         require(
-            maturityDate < block.timestamp,
+            config.maturityDate < block.timestamp,
             "Buyback date should be less than current time"
         );
         require(
@@ -547,7 +644,7 @@ contract Token is Ownable {
         isNotAmortizable
     {
         require(
-            block.timestamp < maturityDate || perpetualStatus,
+            block.timestamp < config.maturityDate || config.perpetualStatus,
             "Token has reached maturity"
         );
         uint256 payment = (interestRate * INTEREST_RATE_PRECISION * faceValue) /
@@ -556,17 +653,21 @@ contract Token is Ownable {
             IERC20(paymentToken).balanceOf(address(this)) >= payment,
             "You do not have sufficient balance to pay this investor!"
         );
-        uint256 duration = (block.timestamp - contractDeploymentTime) /
-            paymentFrequencyToSeconds[paymentFrequency];
+        uint256 duration = PaymentPeriods.periodAt(
+            config.contractDeploymentTime,
+            block.timestamp,
+            uint8(config.paymentFrequency)
+        );
         require(
-            !investorToPaymentPeriodToStatus[_investor][duration],
+            !investorToPaymentPeriodToStatus(_investor, duration),
             "The investor has already been paid for this payment period"
         );
         bool success = IERC20(paymentToken).transfer(_investor, payment);
         if (!success) {
             revert Token__ExchangeFailed();
         }
-        investorToPaymentPeriodToStatus[_investor][duration] = true;
+        markPaymentPeriodPaid(_investor, duration);
+        emit InterestPaid(_investor, duration, payment, paymentToken);
     }
 
     function payInterestToAll()
@@ -577,11 +678,14 @@ contract Token is Ownable {
         isNotAmortizable
     {
         require(
-            block.timestamp < maturityDate || perpetualStatus,
+            block.timestamp < config.maturityDate || config.perpetualStatus,
             "Token has reached maturity"
         );
-        uint256 duration = (block.timestamp - contractDeploymentTime) /
-            paymentFrequencyToSeconds[paymentFrequency];
+        uint256 duration = PaymentPeriods.periodAt(
+            config.contractDeploymentTime,
+            block.timestamp,
+            uint8(config.paymentFrequency)
+        );
         address[] memory tokenHolders = asset.getTokenHolders();
         uint256 payment = (interestRate * INTEREST_RATE_PRECISION * faceValue) /
             INTEREST_RATE_PRECISION;
@@ -591,13 +695,63 @@ contract Token is Ownable {
             "You do not have sufficient balance to pay all token holders!"
         );
         for (uint256 i = 0; i < tokenHolders.length; i++) {
-            if (!investorToPaymentPeriodToStatus[tokenHolders[i]][duration]) {
+            if (!investorToPaymentPeriodToStatus(tokenHolders[i], duration)) {
                 IERC20(paymentToken).transfer(tokenHolders[i], payment);
-                investorToPaymentPeriodToStatus[tokenHolders[i]][
-                    duration
-                ] = true;
+                markPaymentPeriodPaid(tokenHolders[i], duration);
+                emit InterestPaid(
+                    tokenHolders[i],
+                    duration,
+                    payment,
+                    paymentToken
+                );
+            }
+        }
+    }
+
+    function payInterestToRange(
+        uint256 _start,
+        uint256 _count
+    )
+        public
+        onlyOwner
+        isPayable
+        isFixedOrVariableRate
+        isNotAmortizable
+        isNonZero(_count)
+    {
+        require(
+            block.timestamp < config.maturityDate || config.perpetualStatus,
+            "Token has reached maturity"
+        );
+        uint256 duration = PaymentPeriods.periodAt(
+            config.contractDeploymentTime,
+            block.timestamp,
+            uint8(config.paymentFrequency)
+        );
+        address[] memory tokenHolders = asset.getTokenHoldersInRange(
+            _start,
+            _count
+        );
+        uint256 payment = (interestRate * INTEREST_RATE_PRECISION * faceValue) /
+            INTEREST_RATE_PRECISION;
+        require(
+            IERC20(paymentToken).balanceOf(address(this)) >=
+                payment * tokenHolders.length,
+            "You do not have sufficient balance to pay this range of token holders!"
+        );
+        for (uint256 i = 0; i < tokenHolders.length; i++) {
+            if (!investorToPaymentPeriodToStatus(tokenHolders[i], duration)) {
+                IERC20(paymentToken).transfer(tokenHolders[i], payment);
+                markPaymentPeriodPaid(tokenHolders[i], duration);
+                emit InterestPaid(
+                    tokenHolders[i],
+                    duration,
+                    payment,
+                    paymentToken
+                );
             }
         }
+        advancePaymentPeriodCursor(duration, _start, tokenHolders.length);
     }
 
     function payInterestInPaymentInKind(
@@ -614,13 +768,16 @@ contract Token is Ownable {
         isNotAmortizable
     {
         require(
-            block.timestamp < maturityDate || perpetualStatus,
+            block.timestamp < config.maturityDate || config.perpetualStatus,
             "Token has reached maturity"
         );
-        uint256 duration = (block.timestamp - contractDeploymentTime) /
-            paymentFrequencyToSeconds[paymentFrequency];
+        uint256 duration = PaymentPeriods.periodAt(
+            config.contractDeploymentTime,
+            block.timestamp,
+            uint8(config.paymentFrequency)
+        );
         require(
-            !investorToPaymentPeriodToStatus[_investor][duration],
+            !investorToPaymentPeriodToStatus(_investor, duration),
             "The investor has already been paid for this payment period"
         );
         require(
@@ -631,7 +788,8 @@ contract Token is Ownable {
         if (!success) {
             revert Token__ExchangeFailed();
         }
-        investorToPaymentPeriodToStatus[_investor][duration] = true;
+        markPaymentPeriodPaid(_investor, duration);
+        emit InterestPaid(_investor, duration, _tokenAmount, _tokenAddress);
     }
 
     function payInterestInPaymentInKindToAll(
@@ -646,54 +804,78 @@ contract Token is Ownable {
         isNotAmortizable
     {
         require(
-            block.timestamp < maturityDate || perpetualStatus,
+            block.timestamp < config.maturityDate || config.perpetualStatus,
             "Token has reached maturity"
         );
-        uint256 duration = (block.timestamp - contractDeploymentTime) /
-            paymentFrequencyToSeconds[paymentFrequency];
+        uint256 duration = PaymentPeriods.periodAt(
+            config.contractDeploymentTime,
+            block.timestamp,
+            uint8(config.paymentFrequency)
+        );
         address[] memory tokenHolders = asset.getTokenHolders();
         require(
             IERC20(_tokenAddress).balanceOf(address(this)) >= _tokenAmount,
             "You do not have sufficient balance to pay all token holders!"
         );
         for (uint256 i = 0; i < tokenHolders.length; i++) {
-            if (!investorToPaymentPeriodToStatus[tokenHolders[i]][duration]) {
+            if (!investorToPaymentPeriodToStatus(tokenHolders[i], duration)) {
                 IERC20(_tokenAddress).transfer(tokenHolders[i], _tokenAmount);
-                investorToPaymentPeriodToStatus[tokenHolders[i]][
-                    duration
-                ] = true;
+                markPaymentPeriodPaid(tokenHolders[i], duration);
+                emit InterestPaid(
+                    tokenHolders[i],
+                    duration,
+                    _tokenAmount,
+                    _tokenAddress
+                );
             }
         }
     }
 
-    function getRecoveredAddress(
-        bytes memory sig,
-        bytes32 dataHash
-    ) internal pure returns (address addr) {
-        bytes32 ra;
-        bytes32 sa;
-        uint8 va;
-
-        // Check the signature length
-        if (sig.length != 65) {
-            return address(0);
-        }
-
-        // Divide the signature in r, s and v variables
-        // solhint-disable-next-line no-inline-assembly
-        assembly {
-            ra := mload(add(sig, 32))
-            sa := mload(add(sig, 64))
-            va := byte(0, mload(add(sig, 96)))
-        }
-
-        if (va < 27) {
-            va += 27;
+    function payInterestInPaymentInKindToRange(
+        address _tokenAddress,
+        uint256 _tokenAmount,
+        uint256 _start,
+        uint256 _count
+    )
+        public
+        onlyOwner
+        isPaymentInKind
+        isPayable
+        isAllowedExchangeToken(_tokenAddress)
+        isNotAmortizable
+        isNonZero(_count)
+    {
+        require(
+            block.timestamp < config.maturityDate || config.perpetualStatus,
+            "Token has reached maturity"
+        );
+        uint256 duration = PaymentPeriods.periodAt(
+            config.contractDeploymentTime,
+            block.timestamp,
+            uint8(config.paymentFrequency)
+        );
+        address[] memory tokenHolders = asset.getTokenHoldersInRange(
+            _start,
+            _count
+        );
+        require(
+            IERC20(_tokenAddress).balanceOf(address(this)) >=
+                _tokenAmount * tokenHolders.length,
+            "You do not have sufficient balance to pay this range of token holders!"
+        );
+        for (uint256 i = 0; i < tokenHolders.length; i++) {
+            if (!investorToPaymentPeriodToStatus(tokenHolders[i], duration)) {
+                IERC20(_tokenAddress).transfer(tokenHolders[i], _tokenAmount);
+                markPaymentPeriodPaid(tokenHolders[i], duration);
+                emit InterestPaid(
+                    tokenHolders[i],
+                    duration,
+                    _tokenAmount,
+                    _tokenAddress
+                );
+            }
         }
-
-        address recoveredAddress = ecrecover(dataHash, va, ra, sa);
-
-        return (recoveredAddress);
+        advancePaymentPeriodCursor(duration, _start, tokenHolders.length);
     }
 
     function payInterestInCash(
@@ -711,38 +893,154 @@ contract Token is Ownable {
         isNotAmortizable
     {
         require(
-            block.timestamp < maturityDate || perpetualStatus,
+            block.timestamp < config.maturityDate || config.perpetualStatus,
             "Token has reached maturity"
         );
         bytes32 dataHash = keccak256(
             abi.encode(_receiptNumber, _date, _tokenHolder, _amount)
         );
-        bytes32 prefixedHash = keccak256(
-            abi.encodePacked("\x19Ethereum Signed Message:\n32", dataHash)
+        (address recovered, ) = ECDSA.tryRecover(
+            ECDSA.toEthSignedMessageHash(dataHash),
+            _signature
         );
-        address recovered = getRecoveredAddress(_signature, prefixedHash);
         require(recovered == owner(), "The signer is not the owner");
-        uint256 duration = (block.timestamp - contractDeploymentTime) /
-            paymentFrequencyToSeconds[paymentFrequency];
+        uint256 duration = PaymentPeriods.periodAt(
+            config.contractDeploymentTime,
+            block.timestamp,
+            uint8(config.paymentFrequency)
+        );
         require(
-            !investorToPaymentPeriodToStatus[_tokenHolder][duration],
+            !investorToPaymentPeriodToStatus(_tokenHolder, duration),
             "Investor already paid for this payment period"
         );
-        investorToPaymentPeriodToReceipt[_tokenHolder][duration] = CashReceipt(
+        bytes32 receiptHash = hashCashReceipt(
+            CashReceipt(
+                _receiptNumber,
+                _date,
+                _tokenHolder,
+                _amount,
+                _signature
+            )
+        );
+        investorToPaymentPeriodToReceiptHash[_tokenHolder][
+            duration
+        ] = receiptHash;
+        markPaymentPeriodPaid(_tokenHolder, duration);
+        emit CashReceiptRecorded(
+            _tokenHolder,
+            duration,
             _receiptNumber,
             _date,
-            _tokenHolder,
             _amount,
             _signature
         );
-        investorToPaymentPeriodToStatus[_tokenHolder][duration] = true;
+        emit InterestPaid(_tokenHolder, duration, _amount, address(0));
+    }
+
+    // Records the cash coupons of a whole payment period in one transaction. Each receipt is signed by the
+    // owner as EIP-712 typed data that includes the payment period, so it cannot be replayed in a later one
+    function payInterestInCashBatch(
+        CashReceipt[] calldata _receipts
+    ) public onlyOwner isCashPayment isPayable isNotAmortizable {
+        require(
+            block.timestamp < config.maturityDate || config.perpetualStatus,
+            "Token has reached maturity"
+        );
+        uint256 duration = PaymentPeriods.periodAt(
+            config.contractDeploymentTime,
+            block.timestamp,
+            uint8(config.paymentFrequency)
+        );
+        address signer = owner();
+        for (uint256 i = 0; i < _receipts.length; i++) {
+            CashReceipt calldata receipt = _receipts[i];
+            (bool status, ) = asset.tokenHolderExists(receipt.tokenHolder);
+            if (!status) {
+                revert Token__InvestorDoesNotExist();
+            }
+            require(
+                recoverCashReceiptSigner(receipt, duration) == signer,
+                "The signer is not the owner"
+            );
+            require(
+                !investorToPaymentPeriodToStatus(
+                    receipt.tokenHolder,
+                    duration
+                ),
+                "Investor already paid for this payment period"
+            );
+            investorToPaymentPeriodToReceiptHash[receipt.tokenHolder][
+                duration
+            ] = keccak256(abi.encode(receipt));
+            markPaymentPeriodPaid(receipt.tokenHolder, duration);
+            emit CashReceiptRecorded(
+                receipt.tokenHolder,
+                duration,
+                receipt.receiptNumber,
+                receipt.date,
+                receipt.amount,
+                receipt.signature
+            );
+            emit InterestPaid(
+                receipt.tokenHolder,
+                duration,
+                receipt.amount,
+                address(0)
+            );
+        }
+    }
+
+    // Signer of the EIP-712 digest of a receipt, the signature is read from calldata without being copied
+    function recoverCashReceiptSigner(
+        CashReceipt calldata _receipt,
+        uint256 _paymentPeriod
+    ) private view returns (address signer) {
+        bytes calldata signature = _receipt.signature;
+        if (signature.length != 65) {
+            return address(0);
+        }
+        bytes32 digest = _hashTypedDataV4(
+            keccak256(
+                abi.encode(
+                    CASH_RECEIPT_TYPEHASH,
+                    _receipt.receiptNumber,
+                    _receipt.date,
+                    _receipt.tokenHolder,
+                    _receipt.amount,
+                    _paymentPeriod
+                )
+            )
+        );
+        (signer, ) = ECDSA.tryRecover(
+            digest,
+            uint8(signature[64]),
+            bytes32(signature[0:32]),
+            bytes32(signature[32:64])
+        );
+    }
+
+    // Checks a receipt taken from a CashReceiptRecorded event against the hash stored for its payment period
+    function verifyCashReceipt(
+        uint256 _paymentPeriod,
+        CashReceipt memory _receipt
+    ) public view returns (bool) {
+        bytes32 receiptHash = investorToPaymentPeriodToReceiptHash[
+            _receipt.tokenHolder
+        ][_paymentPeriod];
+        return receiptHash != 0 && receiptHash == hashCashReceipt(_receipt);
+    }
+
+    function hashCashReceipt(
+        CashReceipt memory _receipt
+    ) private pure returns (bytes32) {
+        return keccak256(abi.encode(_receipt));
     }
 
     function payAtMaturity(
         address _investor
     ) public onlyOwner hasMaturityPayment investorExists(_investor) {
         require(
-            maturityDate <= block.timestamp,
+            config.maturityDate <= block.timestamp,
             "The token has not matured yet!"
         );
         require(
@@ -754,19 +1052,23 @@ contract Token is Ownable {
                 faceValue * asset.balanceOf(_investor),
             "You do not have sufficient balance to pay this token holder"
         );
-        bool success = IERC20(paymentToken).transfer(
-            _investor,
-            faceValue * asset.balanceOf(_investor)
-        );
+        uint256 payment = faceValue * asset.balanceOf(_investor);
+        bool success = IERC20(paymentToken).transfer(_investor, payment);
         if (!success) {
             revert Token__ExchangeFailed();
         }
         investorToMaturityPaymentStatus[_investor] = true;
+        emit MaturityPaymentPaid(
+            _investor,
+            getPaymentPeriod(),
+            payment,
+            paymentToken
+        );
     }
 
     function payAtMaturityToAll() public onlyOwner hasMaturityPayment {
         require(
-            maturityDate <= block.timestamp,
+            config.maturityDate <= block.timestamp,
             "The token has not matured yet!"
         );
         address[] memory tokenHolders = asset.getTokenHolders();
@@ -775,15 +1077,60 @@ contract Token is Ownable {
                 faceValue * asset.totalSupply(),
             "You do not have sufficient balance to pay this token holder"
         );
+        uint256 period = getPaymentPeriod();
+        for (uint256 i = 0; i < tokenHolders.length; i++) {
+            if (!investorToMaturityPaymentStatus[tokenHolders[i]]) {
+                uint256 payment = faceValue * asset.balanceOf(tokenHolders[i]);
+                IERC20(paymentToken).transfer(tokenHolders[i], payment);
+                investorToMaturityPaymentStatus[tokenHolders[i]] = true;
+                emit MaturityPaymentPaid(
+                    tokenHolders[i],
+                    period,
+                    payment,
+                    paymentToken
+                );
+            }
+        }
+    }
+
+    function payAtMaturityToRange(
+        uint256 _start,
+        uint256 _count
+    ) public onlyOwner hasMaturityPayment isNonZero(_count) {
+        require(
+            config.maturityDate <= block.timestamp,
+            "The token has not matured yet!"
+        );
+        address[] memory tokenHolders = asset.getTokenHoldersInRange(
+            _start,
+            _count
+        );
+        uint256 period = getPaymentPeriod();
         for (uint256 i = 0; i < tokenHolders.length; i++) {
             if (!investorToMaturityPaymentStatus[tokenHolders[i]]) {
-                IERC20(paymentToken).transfer(
+                uint256 payment = faceValue * asset.balanceOf(tokenHolders[i]);
+                bool success = IERC20(paymentToken).transfer(
                     tokenHolders[i],
-                    faceValue * asset.balanceOf(tokenHolders[i])
+                    payment
                 );
+                if (!success) {
+                    revert Token__ExchangeFailed();
+                }
                 investorToMaturityPaymentStatus[tokenHolders[i]] = true;
+                emit MaturityPaymentPaid(
+                    tokenHolders[i],
+                    period,
+                    payment,
+                    paymentToken
+                );
             }
         }
+        if (
+            _start <= maturityPaymentCursor &&
+            _start + tokenHolders.length > maturityPaymentCursor
+        ) {
+            maturityPaymentCursor = _start + tokenHolders.length;
+        }
     }
 
     function setAmortizationSchedule(
@@ -799,6 +1146,22 @@ contract Token is Ownable {
             denominator;
     }
 
+    // Sets the periodic payment to the annuity of the periodic interest rate over the loan term, computed
+    // on-chain instead of passing a precomputed numerator and denominator to setAmortizationSchedule.
+    // A loan term shorter than one payment period leaves nothing to amortize over and reverts
+    function computeAmortizationSchedule() public onlyOwner isAmortizable {
+        uint256 periods = loanTerm / 10 ** PRECISION;
+        if (periods == 0) {
+            revert Token__InputParameterIsZero();
+        }
+        (uint256 numerator, uint256 denominator) = FixedPointMath.annuity(
+            periodicInterestRate,
+            periods,
+            10 ** PRECISION
+        );
+        setAmortizationSchedule(numerator, denominator);
+    }
+
     function payAmortizedPayments(
         address _tokenHolder
     )
@@ -818,19 +1181,31 @@ contract Token is Ownable {
             IERC20(paymentToken).balanceOf(address(this)) >= payment,
             "You do not have sufficient balance to pay this investor!"
         );
-        uint256 duration = (block.timestamp - contractDeploymentTime) /
-            paymentFrequencyToSeconds[paymentFrequency];
+        uint256 duration = PaymentPeriods.periodAt(
+            config.contractDeploymentTime,
+            block.timestamp,
+            uint8(config.paymentFrequency)
+        );
         require(
-            !investorToPaymentPeriodToStatus[_tokenHolder][duration],
+            !investorToPaymentPeriodToStatus(_tokenHolder, duration),
             "The token holder has already been paid for this payment period"
         );
         bool success = IERC20(paymentToken).transfer(_tokenHolder, payment);
         if (!success) {
             revert Token__ExchangeFailed();
         }
-        investorToPaymentPeriodToStatus[_tokenHolder][duration] = true;
-        uint256 maxPeriod = (maturityDate - contractDeploymentTime) /
-            paymentFrequencyToSeconds[paymentFrequency];
+        markPaymentPeriodPaid(_tokenHolder, duration);
+        emit AmortizedPaymentPaid(
+            _tokenHolder,
+            duration,
+            payment,
+            paymentToken
+        );
+        uint256 maxPeriod = PaymentPeriods.periodAt(
+            config.contractDeploymentTime,
+            config.maturityDate,
+            uint8(config.paymentFrequency)
+        );
         if (duration >= maxPeriod) {
             investorToMaturityPaymentStatus[_tokenHolder] = true;
         }
@@ -848,28 +1223,134 @@ contract Token is Ownable {
                 (asset.totalSupply() * periodicPayment) / 10 ** PRECISION,
             "You do not have sufficient balance to pay all token holders!"
         );
-        uint256 duration = (block.timestamp - contractDeploymentTime) /
-            paymentFrequencyToSeconds[paymentFrequency];
-        uint256 maxPeriod = (maturityDate - contractDeploymentTime) /
-            paymentFrequencyToSeconds[paymentFrequency];
+        uint256 duration = PaymentPeriods.periodAt(
+            config.contractDeploymentTime,
+            block.timestamp,
+            uint8(config.paymentFrequency)
+        );
+        uint256 maxPeriod = PaymentPeriods.periodAt(
+            config.contractDeploymentTime,
+            config.maturityDate,
+            uint8(config.paymentFrequency)
+        );
         for (uint256 i = 0; i < tokenHolders.length; i++) {
             if (
-                !investorToPaymentPeriodToStatus[tokenHolders[i]][duration] &&
+                !investorToPaymentPeriodToStatus(tokenHolders[i], duration) &&
                 !investorToMaturityPaymentStatus[tokenHolders[i]]
             ) {
-                IERC20(paymentToken).transfer(
+                uint256 payment = (periodicPayment *
+                    asset.balanceOf(tokenHolders[i])) / 10 ** PRECISION;
+                IERC20(paymentToken).transfer(tokenHolders[i], payment);
+                markPaymentPeriodPaid(tokenHolders[i], duration);
+                emit AmortizedPaymentPaid(
                     tokenHolders[i],
-                    ((periodicPayment * asset.balanceOf(tokenHolders[i])) /
-                        10 ** PRECISION)
+                    duration,
+                    payment,
+                    paymentToken
+                );
+                if (duration >= maxPeriod) {
+                    investorToMaturityPaymentStatus[tokenHolders[i]] = true;
+                }
+            }
+        }
+    }
+
+    function payAmortizedPaymentsToRange(
+        uint256 _start,
+        uint256 _count
+    )
+        public
+        onlyOwner
+        isAmortizable
+        isNonZero(periodicPayment)
+        isNonZero(_count)
+    {
+        address[] memory tokenHolders = asset.getTokenHoldersInRange(
+            _start,
+            _count
+        );
+        uint256 duration = PaymentPeriods.periodAt(
+            config.contractDeploymentTime,
+            block.timestamp,
+            uint8(config.paymentFrequency)
+        );
+        uint256 maxPeriod = PaymentPeriods.periodAt(
+            config.contractDeploymentTime,
+            config.maturityDate,
+            uint8(config.paymentFrequency)
+        );
+        for (uint256 i = 0; i < tokenHolders.length; i++) {
+            if (
+                !investorToPaymentPeriodToStatus(tokenHolders[i], duration) &&
+                !investorToMaturityPaymentStatus[tokenHolders[i]]
+            ) {
+                uint256 payment = (periodicPayment *
+                    asset.balanceOf(tokenHolders[i])) / 10 ** PRECISION;
+                bool success = IERC20(paymentToken).transfer(
+                    tokenHolders[i],
+                    payment
+                );
+                if (!success) {
+                    revert Token__ExchangeFailed();
+                }
+                markPaymentPeriodPaid(tokenHolders[i], duration);
+                emit AmortizedPaymentPaid(
+                    tokenHolders[i],
+                    duration,
+                    payment,
+                    paymentToken
                 );
-                investorToPaymentPeriodToStatus[tokenHolders[i]][
-                    duration
-                ] = true;
                 if (duration >= maxPeriod) {
                     investorToMaturityPaymentStatus[tokenHolders[i]] = true;
                 }
             }
         }
+        advancePaymentPeriodCursor(duration, _start, tokenHolders.length);
+    }
+
+    function investorToPaymentPeriodToStatus(
+        address _investor,
+        uint256 _paymentPeriod
+    ) public view returns (bool) {
+        return
+            (paidPaymentPeriods[_investor][_paymentPeriod >> 8] &
+                (1 << (_paymentPeriod & 0xff))) != 0;
+    }
+
+    // Sets the bit of a payment period, consecutive periods of an investor update the same word
+    function markPaymentPeriodPaid(
+        address _investor,
+        uint256 _paymentPeriod
+    ) private {
+        paidPaymentPeriods[_investor][_paymentPeriod >> 8] |=
+            1 << (_paymentPeriod & 0xff);
+    }
+
+    // Moves the cursor of a payment period forward only when the processed range starts at or before it.
+    // The cursor is only a resume point: a holder that exits is replaced by the last holder, which can then
+    // sit below the cursor unpaid. Ranges skip paid holders, so scripts/pay_in_batches.py re-sends them
+    function advancePaymentPeriodCursor(
+        uint256 _duration,
+        uint256 _start,
+        uint256 _processed
+    ) private {
+        uint256 cursor = paymentPeriodToCursor[_duration];
+        if (_start <= cursor && _start + _processed > cursor) {
+            paymentPeriodToCursor[_duration] = _start + _processed;
+        }
+    }
+
+    // Payment period the current block falls in, used to tag the payout events. Tokens without periodic
+    // payments have a single payment period
+    function getPaymentPeriod() private view returns (uint256) {
+        if (config.paymentFrequency == PaymentFrequency.NONE) {
+            return 0;
+        }
+        return PaymentPeriods.periodAt(
+            config.contractDeploymentTime,
+            block.timestamp,
+            uint8(config.paymentFrequency)
+        );
     }
 
     function updatePrice(uint256 _price) public onlyOwner isNonZero(_price) {
@@ -900,36 +1381,50 @@ contract Token is Ownable {
         setAmortizationSchedule(numerator, denominator);
     }
 
+    // Rebalances the periodic payment to the new rate in the same transaction
+    function modifyAmortizedInterestRate(
+        uint256 _rate
+    ) public onlyOwner isVariable isNonZero(_rate) isAmortizable {
+        interestRate = _rate;
+        periodicInterestRate = calculatePeriodicInterestRate(_rate);
+        computeAmortizationSchedule();
+    }
+
     function calculatePeriodicInterestRate(
         uint256 _rate
     ) public view isNonZero(_rate) returns (uint256) {
         return
             (_rate * 10 ** PRECISION) /
-            (paymentFrequencyToLoanTerm[paymentFrequency] * 100);
+            (PaymentPeriods.periodsPerYear(uint8(config.paymentFrequency)) *
+                100);
     }
 
     function callToken(
         address _tokenHolder,
         uint256 _amount
     ) public onlyOwner isCallable investorExists(_tokenHolder) {
-        require(block.timestamp < maturityDate, "The token has matured");
+        require(block.timestamp < config.maturityDate, "The token has matured");
         uint256 balance = asset.balanceOf(_tokenHolder);
         require(
             IERC20(paymentToken).balanceOf(address(this)) >= balance + _amount,
             "You do not have sufficient funds to reimburse this token holder!"
         );
-        bool success = IERC20(paymentToken).transfer(
-            _tokenHolder,
-            balance * faceValue + _amount
-        );
+        uint256 payment = balance * faceValue + _amount;
+        bool success = IERC20(paymentToken).transfer(_tokenHolder, payment);
         if (!success) {
             revert Token__ExchangeFailed();
         }
         asset.burn(_tokenHolder, balance);
+        emit TokenCalled(
+            _tokenHolder,
+            getPaymentPeriod(),
+            payment,
+            paymentToken
+        );
     }
 
     function callTokenFromAll(uint256 _amount) public onlyOwner isCallable {
-        require(block.timestamp < maturityDate, "The token has matured");
+        require(block.timestamp < config.maturityDate, "The token has matured");
         address[] memory tokenHolders = asset.getTokenHolders();
         uint256 balance = asset.totalSupply();
         require(
@@ -937,12 +1432,43 @@ contract Token is Ownable {
                 balance * faceValue + _amount * tokenHolders.length,
             "You do not have sufficient funds to reimburse all token holders!"
         );
+        uint256 period = getPaymentPeriod();
         for (uint256 i = 0; i < tokenHolders.length; i++) {
-            IERC20(paymentToken).transfer(
+            uint256 payment = asset.balanceOf(tokenHolders[i]) *
+                faceValue +
+                _amount;
+            IERC20(paymentToken).transfer(tokenHolders[i], payment);
+            asset.burn(tokenHolders[i], asset.balanceOf(tokenHolders[i]));
+            emit TokenCalled(tokenHolders[i], period, payment, paymentToken);
+        }
+    }
+
+    // Calls the last _count token holders. Burning a called token holder only reorders the called tail of the
+    // token holder array, so repeated calls drain the array from the end without needing a cursor
+    function callTokenFromRange(
+        uint256 _amount,
+        uint256 _count
+    ) public onlyOwner isCallable isNonZero(_count) {
+        require(block.timestamp < config.maturityDate, "The token has matured");
+        uint256 holderCount = asset.getTokenHolderCount();
+        uint256 start = holderCount > _count ? holderCount - _count : 0;
+        address[] memory tokenHolders = asset.getTokenHoldersInRange(
+            start,
+            _count
+        );
+        uint256 period = getPaymentPeriod();
+        for (uint256 i = 0; i < tokenHolders.length; i++) {
+            uint256 balance = asset.balanceOf(tokenHolders[i]);
+            uint256 payment = balance * faceValue + _amount;
+            bool success = IERC20(paymentToken).transfer(
                 tokenHolders[i],
-                asset.balanceOf(tokenHolders[i]) * faceValue + _amount
+                payment
             );
-            asset.burn(tokenHolders[i], asset.balanceOf(tokenHolders[i]));
+            if (!success) {
+                revert Token__ExchangeFailed();
+            }
+            asset.burn(tokenHolders[i], balance);
+            emit TokenCalled(tokenHolders[i], period, payment, paymentToken);
         }
     }
 
@@ -951,16 +1477,18 @@ contract Token is Ownable {
         uint256 _endDate
     ) public onlyOwner isPutable isNonZero(_startDate) isNonZero(_endDate) {
         require(
-            (_endDate > _startDate) && (_endDate <= maturityDate),
+            (_endDate > _startDate) && (_endDate <= config.maturityDate),
             "The end date should be greater than start date and less than maturity"
         );
         require(
-            (contractDeploymentTime <= _startDate) &&
+            (config.contractDeploymentTime <= _startDate) &&
                 (block.timestamp <= _startDate),
             "The start date should be set between the contract deployment time and maturity"
         );
-        startDate = _startDate;
-        endDate = _endDate;
+        putPeriod = PutPeriod(
+            SafeCast.toUint64(_startDate),
+            SafeCast.toUint64(_endDate)
+        );
     }
 
     function putToken(
@@ -968,12 +1496,13 @@ contract Token is Ownable {
     )
         public
         isPutable
-        isNonZero(startDate)
+        isNonZero(putPeriod.startDate)
         investorExists(msg.sender)
         isNonZero(_amount)
     {
         require(
-            startDate <= block.timestamp && block.timestamp <= endDate,
+            putPeriod.startDate <= block.timestamp &&
+                block.timestamp <= putPeriod.endDate,
             "You cannot put the token outside of the put period"
         );
         require(
@@ -990,6 +1519,48 @@ contract Token is Ownable {
             revert Token__ExchangeFailed();
         }
         asset.burn(msg.sender, _amount);
+        emit TokenPut(
+            msg.sender,
+            getPaymentPeriod(),
+            _amount * faceValue,
+            paymentToken
+        );
+    }
+
+    function redemptionState() public view returns (Redemption) {
+        return config.redemptionState;
+    }
+
+    function paymentFrequency() public view returns (PaymentFrequency) {
+        return config.paymentFrequency;
+    }
+
+    function interestType() public view returns (InterestType) {
+        return config.interestType;
+    }
+
+    function reimbursementState() public view returns (Reimbursement) {
+        return config.reimbursementState;
+    }
+
+    function perpetualStatus() public view returns (bool) {
+        return config.perpetualStatus;
+    }
+
+    function maturityDate() public view returns (uint256) {
+        return config.maturityDate;
+    }
+
+    function contractDeploymentTime() public view returns (uint256) {
+        return config.contractDeploymentTime;
+    }
+
+    function startDate() public view returns (uint256) {
+        return putPeriod.startDate;
+    }
+
+    function endDate() public view returns (uint256) {
+        return putPeriod.endDate;
     }
 
     function getBalance(address _user) public view returns (uint256) {
@@ -1004,6 +1575,10 @@ contract Token is Ownable {
         return asset.getTokenHolders();
     }
 
+    function getTokenHolderCount() public view returns (uint256) {
+        return asset.getTokenHolderCount();
+    }
+
     function getAddress() public view returns (address) {
         return address(asset);
     }
@@ -1013,7 +1588,7 @@ contract Token is Ownable {
     }
 
     function getMaturity() public view returns (uint256) {
-        return maturityDate;
+        return config.maturityDate;
     }
 
     function getPeriodicPayment() public view returns (uint256) {
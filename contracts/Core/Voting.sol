@@ -3,8 +3,11 @@
 pragma solidity ^0.8.17;
 
 import "@openzeppelin/contracts/access/Ownable.sol";
+import {ECDSA} from "@openzeppelin/contracts/utils/cryptography/ECDSA.sol";
+import {EIP712} from "@openzeppelin/contracts/utils/cryptography/EIP712.sol";
+import {IAsset} from "./IAsset.sol";
 
-contract Voting is Ownable {
+contract Voting is Ownable, EIP712 {
     enum Vote_State {
         Ballot_Created,
         Voting_Started,
@@ -17,6 +20,10 @@ contract Voting is Ownable {
         uint256 duration;
         Vote_State state;
         uint256 winningOption;
+        // Maintained by castVote, so the result is known as soon as voting ends
+        uint256 leadingOption;
+        uint256 leadingTally;
+        bool tied;
     }
 
     struct Voter {
@@ -25,27 +32,79 @@ contract Voting is Ownable {
         bool registered;
     }
 
+    // A vote signed off-chain by the voter as EIP-712 typed data, see castVotesBySig
+    struct SignedVote {
+        uint256 ballot;
+        uint256 option;
+        address voter;
+        uint256 nonce;
+        bytes signature;
+    }
+
+    bytes32 private constant VOTE_TYPEHASH =
+        keccak256(
+            "Vote(uint256 ballot,uint256 option,address voter,uint256 nonce)"
+        );
+
     mapping(address => Voter) public voters;
     mapping(uint256 => Ballot) public ballots;
     mapping(uint256 => string[]) public options;
     mapping(address => mapping(uint256 => bool)) public voted;
     mapping(uint256 => mapping(uint256 => uint256)) public tally;
+    // Asset whose balances weigh the votes of a shareholder ballot, unset for ballots of registered voters
+    mapping(uint256 => IAsset) public ballotAsset;
+    // Payment period of the Asset checkpoint that the weights of a shareholder ballot are read from
+    mapping(uint256 => uint256) public ballotSnapshot;
+    // Weight delegated to a voter in a shareholder ballot
+    mapping(uint256 => mapping(address => uint256)) public delegatedWeight;
+    // Nonce the next signed vote of each voter has to carry
+    mapping(address => uint256) public nonces;
     uint256 private count;
 
+    constructor() EIP712("GenericTokenization", "1") {}
+
     function createBallot(
         string memory _proposal,
         string[] memory _options,
         uint256 _startTime,
         uint256 _duration
     ) external onlyOwner {
-        ballots[count] = Ballot(
+        addBallot(_proposal, _options, _startTime, _duration);
+    }
+
+    // Creates a ballot weighted by the balances of the asset at the start of the current payment period, so
+    // no voter has to be registered and tokens moved after the ballot is created carry no extra votes. The
+    // asset needs a checkpoint schedule
+    function createSnapshotBallot(
+        string memory _proposal,
+        string[] memory _options,
+        uint256 _startTime,
+        uint256 _duration,
+        address _asset
+    ) public onlyOwner {
+        uint256 ballot = addBallot(_proposal, _options, _startTime, _duration);
+        ballotAsset[ballot] = IAsset(_asset);
+        ballotSnapshot[ballot] = IAsset(_asset).currentPaymentPeriod();
+    }
+
+    function addBallot(
+        string memory _proposal,
+        string[] memory _options,
+        uint256 _startTime,
+        uint256 _duration
+    ) private returns (uint256 ballot) {
+        ballot = count;
+        ballots[ballot] = Ballot(
             _proposal,
             _startTime,
             _duration,
             Vote_State.Ballot_Created,
-            0
+            0,
+            0,
+            0,
+            false
         );
-        options[count] = _options;
+        options[ballot] = _options;
         count++;
     }
 
@@ -75,11 +134,22 @@ contract Voting is Ownable {
     }
 
     function delegateVote(address _delegatee, uint256 _ballot) public {
-        require(voters[msg.sender].weight != 0, "You have no right to vote");
+        uint256 weight = voteWeight(_ballot, msg.sender);
+        require(weight != 0, "You have no right to vote");
         require(
             voted[msg.sender][_ballot] != true,
             "You have already voted in this ballot"
         );
+        if (address(ballotAsset[_ballot]) != address(0)) {
+            // Shareholders may appoint any proxy, the weight only counts for this ballot
+            require(
+                voted[_delegatee][_ballot] != true,
+                "The delegatee already voted"
+            );
+            voted[msg.sender][_ballot] = true;
+            delegatedWeight[_ballot][_delegatee] += weight;
+            return;
+        }
         require(
             voters[_delegatee].registered == true,
             "The delegatee is not registered as a voter"
@@ -94,50 +164,140 @@ contract Voting is Ownable {
         );
         voters[msg.sender].delegate = _delegatee;
         voted[msg.sender][_ballot] = true;
-        voters[_delegatee].weight += voters[msg.sender].weight;
+        voters[_delegatee].weight += weight;
     }
 
     function castVote(uint256 _ballot, uint256 _option) public {
+        recordVote(_ballot, _option, msg.sender);
+    }
+
+    // Tallies votes that voters signed off-chain, so they pay no gas. Anyone may submit a batch. The votes of
+    // a voter have to come in nonce order and the whole batch reverts on any invalid vote
+    function castVotesBySig(SignedVote[] calldata _votes) external {
+        for (uint256 i = 0; i < _votes.length; i++) {
+            SignedVote calldata signedVote = _votes[i];
+            address voter = signedVote.voter;
+            require(signedVote.nonce == nonces[voter], "Invalid nonce");
+            require(
+                voter != address(0) && recoverVoteSigner(signedVote) == voter,
+                "The signer is not the voter"
+            );
+            nonces[voter] = signedVote.nonce + 1;
+            recordVote(signedVote.ballot, signedVote.option, voter);
+        }
+    }
+
+    // Signer of the EIP-712 digest of a vote, the signature is read from calldata without being copied
+    function recoverVoteSigner(
+        SignedVote calldata _vote
+    ) private view returns (address signer) {
+        bytes calldata signature = _vote.signature;
+        if (signature.length != 65) {
+            return address(0);
+        }
+        bytes32 digest = _hashTypedDataV4(
+            keccak256(
+                abi.encode(
+                    VOTE_TYPEHASH,
+                    _vote.ballot,
+                    _vote.option,
+                    _vote.voter,
+                    _vote.nonce
+                )
+            )
+        );
+        (signer, ) = ECDSA.tryRecover(
+            digest,
+            uint8(signature[64]),
+            bytes32(signature[0:32]),
+            bytes32(signature[32:64])
+        );
+    }
+
+    function recordVote(
+        uint256 _ballot,
+        uint256 _option,
+        address _voter
+    ) private {
         require(
             ballots[_ballot].state == Vote_State.Voting_Started,
             "You can only vote if the voting period has started"
         );
+        uint256 weight = voteWeight(_ballot, _voter);
         require(
-            voters[msg.sender].weight > 0,
+            weight > 0,
             "You don't have permission to vote in this ballot"
         );
         require(
-            voted[msg.sender][_ballot] != true,
+            voted[_voter][_ballot] != true,
             "You have already cast your vote for this ballot"
         );
-        tally[_ballot][_option] += voters[msg.sender].weight;
-        voted[msg.sender][_ballot] = true;
+        require(
+            _option < options[_ballot].length,
+            "This option does not exist in this ballot"
+        );
+        uint256 optionTally = tally[_ballot][_option] + weight;
+        tally[_ballot][_option] = optionTally;
+        voted[_voter][_ballot] = true;
+        updateLeadingOption(_ballot, _option, optionTally);
     }
 
+    // Resolved when the voter votes or delegates. Shareholder ballots read the asset checkpoint, other
+    // ballots the weight of the registered voter. The asset owner holds the unissued supply, which carries
+    // no votes
+    function voteWeight(
+        uint256 _ballot,
+        address _voter
+    ) public view returns (uint256) {
+        IAsset asset = ballotAsset[_ballot];
+        if (address(asset) == address(0)) {
+            return voters[_voter].weight;
+        }
+        uint256 weight = delegatedWeight[_ballot][_voter];
+        if (_voter != asset.owner()) {
+            weight += asset.balanceOfAt(_voter, ballotSnapshot[_ballot]);
+        }
+        return weight;
+    }
+
+    // Tallies only grow, so the option that was just voted for is the only one that can take the lead or
+    // draw level with the leading option
+    function updateLeadingOption(
+        uint256 _ballot,
+        uint256 _option,
+        uint256 _optionTally
+    ) private {
+        Ballot storage ballot = ballots[_ballot];
+        if (_optionTally > ballot.leadingTally) {
+            ballot.leadingOption = _option;
+            ballot.leadingTally = _optionTally;
+            ballot.tied = false;
+        } else if (
+            _optionTally == ballot.leadingTally &&
+            _option != ballot.leadingOption
+        ) {
+            ballot.tied = true;
+        }
+    }
+
+    // Kept for callers that finalize ballots explicitly, the result is already maintained by castVote
     function calculateWinningOption(uint256 _ballot) public {
         require(
             ballots[_ballot].state == Vote_State.Voting_Ended,
             "You can only count votes when the voting period has finished"
         );
-        uint256 winningVoteCount = 0;
-        uint256 winningOption = 0;
-        uint256 tiedOptionsCount = 0;
-        for (uint256 i = 0; i < options[_ballot].length; i++) {
-            if (tally[_ballot][i] > winningVoteCount) {
-                winningVoteCount = tally[_ballot][i];
-                winningOption = i;
-                tiedOptionsCount = 0;
-            } else if (tally[_ballot][i] == winningVoteCount) {
-                tiedOptionsCount++;
-            }
-        }
-        if (tiedOptionsCount > 0) {
+        if (isTied(_ballot)) {
             ballots[_ballot].winningOption = options[_ballot].length + 1;
         } else {
-            ballots[_ballot].winningOption = winningOption;
+            ballots[_ballot].winningOption = ballots[_ballot].leadingOption;
         }
     }
 
+    // A ballot without votes counts as tied, as every option has a tally of zero
+    function isTied(uint256 _ballot) private view returns (bool) {
+        return ballots[_ballot].tied || ballots[_ballot].leadingTally == 0;
+    }
+
     function viewBallotResult(
         uint256 _ballot
     ) public view returns (string memory) {
@@ -145,10 +305,10 @@ contract Voting is Ownable {
             ballots[_ballot].state == Vote_State.Voting_Ended,
             "You can only view results when the voting period has ended"
         );
-        if (ballots[_ballot].winningOption > options[_ballot].length) {
+        if (isTied(_ballot)) {
             return "Tied Vote";
         } else {
-            return options[_ballot][ballots[_ballot].winningOption];
+            return options[_ballot][ballots[_ballot].leadingOption];
         }
     }
 }
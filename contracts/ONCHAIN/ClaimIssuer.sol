@@ -3,9 +3,12 @@ pragma solidity 0.8.17;
 
 import "./interface/IClaimIssuer.sol";
 import "./Identity.sol";
+import "../registry/interface/IVerificationCache.sol";
 
 contract ClaimIssuer is IClaimIssuer, Identity {
     mapping(bytes => bool) public revokedClaims;
+    // Identity registries whose cached verification statuses are invalidated on revocation
+    address[] public identityRegistries;
 
     // solhint-disable-next-line no-empty-blocks
     constructor(
@@ -21,6 +24,7 @@ contract ClaimIssuer is IClaimIssuer, Identity {
         require(!revokedClaims[signature], "Conflict: Claim already revoked");
 
         revokedClaims[signature] = true;
+        invalidateVerificationCaches();
 
         emit ClaimRevoked(signature);
     }
@@ -44,10 +48,33 @@ contract ClaimIssuer is IClaimIssuer, Identity {
         require(!revokedClaims[sig], "Conflict: Claim already revoked");
 
         revokedClaims[sig] = true;
+        invalidateVerificationCaches();
         emit ClaimRevoked(sig);
         return true;
     }
 
+    /**
+     *  @dev Binds an identity registry whose verification cache is invalidated every time
+     *  this issuer revokes a claim. The issuer must be trusted by the registry's
+     *  TrustedIssuersRegistry for the invalidation to be accepted.
+     */
+    function bindIdentityRegistry(
+        address _identityRegistry
+    ) external delegatedOnly onlyManager {
+        require(_identityRegistry != address(0), "invalid argument - zero address");
+        identityRegistries.push(_identityRegistry);
+    }
+
+    function invalidateVerificationCaches() internal {
+        for (uint256 i = 0; i < identityRegistries.length; i++) {
+            // A registry that no longer trusts this issuer must not block the revocation
+            try
+                IVerificationCache(identityRegistries[i])
+                    .invalidateVerificationCache()
+            {} catch {}
+        }
+    }
+
     /**
      *  @dev See {IClaimIssuer-isClaimValid}.
      */
@@ -5,6 +5,7 @@ import "./interface/IIdentity.sol";
 import "./interface/IClaimIssuer.sol";
 import "./Version.sol";
 import "./Storage.sol";
+import "../registry/interface/IVerificationCache.sol";
 
 /**
  * @dev Implementation of the `IERC734` "KeyHolder" and the `IERC735` "ClaimHolder" interfaces
@@ -396,6 +397,7 @@ contract Identity is Storage, IIdentity, Version {
         _claims[claimId].signature = _signature;
         _claims[claimId].data = _data;
         _claims[claimId].uri = _uri;
+        clearVerificationCaches();
 
         if (_claims[claimId].issuer != _issuer) {
             _claimsByTopic[_topic].push(claimId);
@@ -469,10 +471,34 @@ contract Identity is Storage, IIdentity, Version {
         );
 
         delete _claims[_claimId];
+        clearVerificationCaches();
 
         return true;
     }
 
+    /**
+     * @notice Binds an identity registry caching the verification status of the user this identity
+     * is registered for. The cached status is dropped every time a claim is added to or removed
+     * from this identity. Binding the same registry again replaces the user.
+     * Require that the msg.sender has management key.
+     *
+     * @param _identityRegistry The identity registry the identity is registered with
+     * @param _userAddress The address of the user the identity is registered for
+     */
+    function bindVerificationCache(
+        address _identityRegistry,
+        address _userAddress
+    ) external delegatedOnly onlyManager {
+        require(
+            _identityRegistry != address(0) && _userAddress != address(0),
+            "invalid argument - zero address"
+        );
+        if (_verificationCacheUsers[_identityRegistry] == address(0)) {
+            _verificationCaches.push(_identityRegistry);
+        }
+        _verificationCacheUsers[_identityRegistry] = _userAddress;
+    }
+
     /**
      * @dev See {IERC735-getClaim}.
      * @notice Implementation of the getClaim function from the ERC-735 standard.
@@ -636,6 +662,21 @@ contract Identity is Storage, IIdentity, Version {
         emit KeyAdded(_key, 1, 1);
     }
 
+    /**
+     * @notice Drops the cached verification status of the user in every bound identity registry.
+     */
+    function clearVerificationCaches() internal {
+        for (uint256 i = 0; i < _verificationCaches.length; i++) {
+            address registry = _verificationCaches[i];
+            // A registry the identity is no longer registered with must not block the claim update
+            try
+                IVerificationCache(registry).clearVerification(
+                    _verificationCacheUsers[registry]
+                )
+            {} catch {}
+        }
+    }
+
     /**
      * @notice Computes if the context in which the function is called is a constructor or not.
      *
@@ -0,0 +1,123 @@
+// SPDX-License-Identifier: GPL-3.0
+pragma solidity 0.8.17;
+
+import {Clones} from "@openzeppelin/contracts/proxy/Clones.sol";
+import {Identity} from "./Identity.sol";
+import {IIdentity} from "@onchain-id/solidity/contracts/interface/IIdentity.sol";
+import {IIdentityRegistry} from "../registry/interface/IIdentityRegistry.sol";
+
+/**
+ * @dev Deploys Identity contracts as EIP-1167 minimal proxies of a single library implementation.
+ * Clones are created with CREATE2, so the address of an identity only depends on its management key
+ * and salt and can be known (and signed for) before the identity is deployed.
+ */
+contract IdentityFactory {
+    /**
+     * @dev Emitted when an identity clone is created and initialized.
+     */
+    event IdentityCreated(
+        address indexed identity,
+        address indexed managementKey,
+        bytes32 indexed salt
+    );
+
+    // Identity deployed as a library (`_isLibrary = true`) that every clone delegates to
+    address public immutable implementation;
+
+    constructor(address _implementation) {
+        require(
+            _implementation != address(0),
+            "invalid argument - zero address"
+        );
+        implementation = _implementation;
+    }
+
+    /**
+     * @notice Deploys and initializes an identity clone.
+     * @param _managementKey the address set as the management key of the identity
+     * @param _salt salt of the CREATE2 deployment, combined with the management key
+     * @return identity the address of the new identity
+     */
+    function createIdentity(
+        address _managementKey,
+        bytes32 _salt
+    ) public returns (address identity) {
+        require(
+            _managementKey != address(0),
+            "invalid argument - zero address"
+        );
+        identity = Clones.cloneDeterministic(
+            implementation,
+            deploymentSalt(_managementKey, _salt)
+        );
+        Identity(identity).initialize(_managementKey);
+        emit IdentityCreated(identity, _managementKey, _salt);
+    }
+
+    /**
+     * @notice Deploys and initializes identity clones in batch.
+     * IMPORTANT : THIS TRANSACTION COULD EXCEED GAS LIMIT IF `_managementKeys.length` IS TOO HIGH
+     * @param _managementKeys the management keys of the identities
+     * @param _salts the salts of the identities
+     * @return identities the addresses of the new identities
+     */
+    function createIdentities(
+        address[] calldata _managementKeys,
+        bytes32[] calldata _salts
+    ) external returns (address[] memory identities) {
+        require(
+            _managementKeys.length == _salts.length,
+            "invalid argument - length mismatch"
+        );
+        identities = new address[](_salts.length);
+        for (uint256 i = 0; i < _salts.length; i++) {
+            identities[i] = createIdentity(_managementKeys[i], _salts[i]);
+        }
+    }
+
+    /**
+     * @notice Deploys an identity clone managed by the user and registers it in the identity registry.
+     * @param _identityRegistry the identity registry the user is registered in
+     * @param _userAddress the wallet of the user, also the management key of the identity
+     * @param _salt salt of the CREATE2 deployment
+     * @param _country the country of the user
+     * @return identity the address of the new identity
+     */
+    function createAndRegisterIdentity(
+        address _identityRegistry,
+        address _userAddress,
+        bytes32 _salt,
+        uint16 _country
+    ) external returns (address identity) {
+        identity = createIdentity(_userAddress, _salt);
+        IIdentityRegistry(_identityRegistry).registerIdentity(
+            _userAddress,
+            IIdentity(identity),
+            _country
+        );
+    }
+
+    /**
+     * @notice Returns the address an identity will be deployed at.
+     * @param _managementKey the management key of the identity
+     * @param _salt the salt of the identity
+     */
+    function predictIdentity(
+        address _managementKey,
+        bytes32 _salt
+    ) external view returns (address) {
+        return
+            Clones.predictDeterministicAddress(
+                implementation,
+                deploymentSalt(_managementKey, _salt)
+            );
+    }
+
+    // Binding the salt to the management key stops anyone from squatting a predicted address
+    function deploymentSalt(
+        address _managementKey,
+        bytes32 _salt
+    ) internal pure returns (bytes32) {
+        return keccak256(abi.encode(_managementKey, _salt));
+    }
+}
@@ -31,9 +31,13 @@ contract Storage is Structs {
     // bool internal _canInteract = false;
     bool internal _canInteract = true;
 
+    // identity registries caching the verification status of the user this identity is registered for
+    address[] internal _verificationCaches;
+    mapping(address => address) internal _verificationCacheUsers;
+
     /**
      * @dev This empty reserved space is put in place to allow future versions to add new
      * variables without shifting down storage in the inheritance chain.
      */
-    uint256[49] private __gap;
+    uint256[47] private __gap;
 }
@@ -66,6 +66,7 @@ pragma solidity 0.8.17;
 import "@openzeppelin/contracts/access/Ownable.sol";
 import "../storage/CTRStorage.sol";
 import "../interface/IClaimTopicsRegistry.sol";
+import "../interface/IVerificationCache.sol";
 
 contract ClaimTopicsRegistry is IClaimTopicsRegistry, Ownable, CTRStorage {
 
@@ -83,6 +84,7 @@ contract ClaimTopicsRegistry is IClaimTopicsRegistry, Ownable, CTRStorage {
             require(_claimTopics[i] != _claimTopic, "claimTopic already exists");
         }
         _claimTopics.push(_claimTopic);
+        _invalidateVerificationCaches();
         emit ClaimTopicAdded(_claimTopic);
     }
 
@@ -95,6 +97,7 @@ contract ClaimTopicsRegistry is IClaimTopicsRegistry, Ownable, CTRStorage {
             if (_claimTopics[i] == _claimTopic) {
                 _claimTopics[i] = _claimTopics[length - 1];
                 _claimTopics.pop();
+                _invalidateVerificationCaches();
                 emit ClaimTopicRemoved(_claimTopic);
                 break;
             }
@@ -107,4 +110,48 @@ contract ClaimTopicsRegistry is IClaimTopicsRegistry, Ownable, CTRStorage {
     function getClaimTopics() external view override returns (uint256[] memory) {
         return _claimTopics;
     }
+
+    /**
+     *  @dev See {IClaimTopicsRegistry-bindIdentityRegistry}.
+     */
+    function bindIdentityRegistry(address _identityRegistry) external override onlyOwner {
+        require(_identityRegistry != address(0), "invalid argument - zero address");
+        require(_identityRegistries.length < 300, "cannot bind more than 300 IR to 1 CTR");
+        _identityRegistries.push(_identityRegistry);
+        emit IdentityRegistryBound(_identityRegistry);
+    }
+
+    /**
+     *  @dev See {IClaimTopicsRegistry-unbindIdentityRegistry}.
+     */
+    function unbindIdentityRegistry(address _identityRegistry) external override onlyOwner {
+        require(_identityRegistry != address(0), "invalid argument - zero address");
+        require(_identityRegistries.length > 0, "identity registry is not stored");
+        uint256 length = _identityRegistries.length;
+        for (uint256 i = 0; i < length; i++) {
+            if (_identityRegistries[i] == _identityRegistry) {
+                _identityRegistries[i] = _identityRegistries[length - 1];
+                _identityRegistries.pop();
+                break;
+            }
+        }
+        emit IdentityRegistryUnbound(_identityRegistry);
+    }
+
+    /**
+     *  @dev See {IClaimTopicsRegistry-linkedIdentityRegistries}.
+     */
+    function linkedIdentityRegistries() external view override returns (address[] memory) {
+        return _identityRegistries;
+    }
+
+    /**
+     *  @dev Invalidates the verification cache of every bound identity registry
+     */
+    function _invalidateVerificationCaches() internal {
+        uint256 length = _identityRegistries.length;
+        for (uint256 i = 0; i < length; i++) {
+            IVerificationCache(_identityRegistries[i]).invalidateVerificationCache();
+        }
+    }
 }
@@ -68,13 +68,14 @@ import "@onchain-id/solidity/contracts/interface/IIdentity.sol";
 import "../interface/IClaimTopicsRegistry.sol";
 import "../interface/ITrustedIssuersRegistry.sol";
 import "../interface/IIdentityRegistry.sol";
+import "../interface/IVerificationCache.sol";
 // import "../../roles/AgentRoleUpgradeable.sol";
 import "@openzeppelin/contracts/access/Ownable.sol";
 import "../interface/IIdentityRegistryStorage.sol";
 import "../storage/IRStorage.sol";
 
 
-contract IdentityRegistry is IIdentityRegistry, Ownable, IRStorage {
+contract IdentityRegistry is IIdentityRegistry, IVerificationCache, Ownable, IRStorage {
 
     /**
      *  @dev the constructor initiates the Identity Registry smart contract
@@ -101,6 +102,7 @@ contract IdentityRegistry is IIdentityRegistry, Ownable, IRStorage {
         emit ClaimTopicsRegistrySet(_claimTopicsRegistry);
         emit TrustedIssuersRegistrySet(_trustedIssuersRegistry);
         emit IdentityStorageSet(_identityStorage);
+        _verificationEpoch = 1;
         //__Ownable_init();
     }
 
@@ -123,6 +125,7 @@ contract IdentityRegistry is IIdentityRegistry, Ownable, IRStorage {
     function updateIdentity(address _userAddress, IIdentity _identity) external override {
         IIdentity oldIdentity = identity(_userAddress);
         _tokenIdentityStorage.modifyStoredIdentity(_userAddress, _identity);
+        delete _verificationCache[_userAddress];
         emit IdentityUpdated(oldIdentity, _identity);
     }
 
@@ -140,6 +143,7 @@ contract IdentityRegistry is IIdentityRegistry, Ownable, IRStorage {
     function deleteIdentity(address _userAddress) external override{
         IIdentity oldIdentity = identity(_userAddress);
         _tokenIdentityStorage.removeIdentityFromStorage(_userAddress);
+        delete _verificationCache[_userAddress];
         emit IdentityRemoved(_userAddress, oldIdentity);
     }
 
@@ -148,6 +152,7 @@ contract IdentityRegistry is IIdentityRegistry, Ownable, IRStorage {
      */
     function setIdentityRegistryStorage(address _identityRegistryStorage) external override onlyOwner {
         _tokenIdentityStorage = IIdentityRegistryStorage(_identityRegistryStorage);
+        _bumpVerificationEpoch();
         emit IdentityStorageSet(_identityRegistryStorage);
     }
 
@@ -156,6 +161,7 @@ contract IdentityRegistry is IIdentityRegistry, Ownable, IRStorage {
      */
     function setClaimTopicsRegistry(address _claimTopicsRegistry) external override onlyOwner {
         _tokenTopicsRegistry = IClaimTopicsRegistry(_claimTopicsRegistry);
+        _bumpVerificationEpoch();
         emit ClaimTopicsRegistrySet(_claimTopicsRegistry);
     }
 
@@ -164,63 +170,70 @@ contract IdentityRegistry is IIdentityRegistry, Ownable, IRStorage {
      */
     function setTrustedIssuersRegistry(address _trustedIssuersRegistry) external override onlyOwner {
         _tokenIssuersRegistry = ITrustedIssuersRegistry(_trustedIssuersRegistry);
+        _bumpVerificationEpoch();
         emit TrustedIssuersRegistrySet(_trustedIssuersRegistry);
     }
 
     /**
-     *  @dev See {IIdentityRegistry-isVerified}.
+     *  @dev See {IVerificationCache-invalidateVerificationCache}.
      */
-    // solhint-disable-next-line code-complexity
-    function isVerified(address _userAddress) external view override returns (bool) {
-        if (address(identity(_userAddress)) == address(0)) {return false;}
-        uint256[] memory requiredClaimTopics = _tokenTopicsRegistry.getClaimTopics();
-        if (requiredClaimTopics.length == 0) {
-            return true;
-        }
-
-        uint256 foundClaimTopic;
-        uint256 scheme;
-        address issuer;
-        bytes memory sig;
-        bytes memory data;
-        uint256 claimTopic;
-        for (claimTopic = 0; claimTopic < requiredClaimTopics.length; claimTopic++) {
-            IClaimIssuer[] memory trustedIssuers =
-            _tokenIssuersRegistry.getTrustedIssuersForClaimTopic(requiredClaimTopics[claimTopic]);
+    function invalidateVerificationCache() external override {
+        require(
+            msg.sender == owner()
+            || msg.sender == address(_tokenTopicsRegistry)
+            || msg.sender == address(_tokenIssuersRegistry)
+            || _tokenIssuersRegistry.isTrustedIssuer(msg.sender)
+        , "caller cannot invalidate the verification cache");
+        _bumpVerificationEpoch();
+    }
 
-            if (trustedIssuers.length == 0) {return false;}
+    /**
+     *  @dev See {IVerificationCache-refreshVerification}.
+     */
+    function refreshVerification(address _userAddress) external override returns (bool) {
+        bool verified = _computeVerification(_userAddress);
+        _verificationCache[_userAddress] = CachedVerification(uint64(_verificationEpoch), verified);
+        emit VerificationRefreshed(_userAddress, verified, _verificationEpoch);
+        return verified;
+    }
 
-            bytes32[] memory claimIds = new bytes32[](trustedIssuers.length);
-            for (uint256 i = 0; i < trustedIssuers.length; i++) {
-                claimIds[i] = keccak256(abi.encode(trustedIssuers[i], requiredClaimTopics[claimTopic]));
-            }
+    /**
+     *  @dev See {IVerificationCache-clearVerification}.
+     */
+    function clearVerification(address _userAddress) external override {
+        require(
+            msg.sender == owner()
+            || msg.sender == address(identity(_userAddress))
+        , "caller cannot clear the verification of this user");
+        delete _verificationCache[_userAddress];
+        emit VerificationCleared(_userAddress);
+    }
 
-            for (uint256 j = 0; j < claimIds.length; j++) {
-                (foundClaimTopic, scheme, issuer, sig, data, ) = identity(_userAddress).getClaim(claimIds[j]);
+    /**
+     *  @dev See {IIdentityRegistry-isVerified}.
+     *  Returns the cached status when it was computed in the current verification epoch,
+     *  otherwise falls back to checking the claims of the user's identity
+     */
+    function isVerified(address _userAddress) external view override returns (bool) {
+        CachedVerification memory cached = _verificationCache[_userAddress];
+        if (cached.epoch == _verificationEpoch) {
+            return cached.verified;
+        }
+        return _computeVerification(_userAddress);
+    }
 
-                if (foundClaimTopic == requiredClaimTopics[claimTopic]) {
-                    try IClaimIssuer(issuer).isClaimValid(identity(_userAddress), requiredClaimTopics[claimTopic], sig,
-                        data) returns(bool _validity) {
+    /**
+     *  @dev See {IVerificationCache-verificationEpoch}.
+     */
+    function verificationEpoch() external view override returns (uint256) {
+        return _verificationEpoch;
+    }
 
-                        if (
-                            _validity
-                        ) {
-                            j = claimIds.length;
-                        }
-                        if (!_validity && j == (claimIds.length - 1)) {
-                            return false;
-                        }
-                    } catch {
-                        if (j == (claimIds.length - 1)) {
-                            return false;
-                        }
-                    }
-                } else if (j == (claimIds.length - 1)) {
-                    return false;
-                }
-            }
-        }
-        return true;
+    /**
+     *  @dev See {IVerificationCache-isVerificationCached}.
+     */
+    function isVerificationCached(address _userAddress) external view override returns (bool) {
+        return _verificationCache[_userAddress].epoch == _verificationEpoch;
     }
 
     /**
@@ -270,6 +283,7 @@ contract IdentityRegistry is IIdentityRegistry, Ownable, IRStorage {
         uint16 _country
     ) public override {
         _tokenIdentityStorage.addIdentityToStorage(_userAddress, _identity, _country);
+        delete _verificationCache[_userAddress];
         emit IdentityRegistered(_userAddress, _identity);
     }
 
@@ -279,4 +293,71 @@ contract IdentityRegistry is IIdentityRegistry, Ownable, IRStorage {
     function identity(address _userAddress) public view override returns (IIdentity) {
         return _tokenIdentityStorage.storedIdentity(_userAddress);
     }
+
+    /**
+     *  @dev Increments the verification epoch, invalidating every cached verification status
+     *  emits `VerificationCacheInvalidated` event
+     */
+    function _bumpVerificationEpoch() internal {
+        _verificationEpoch++;
+        emit VerificationCacheInvalidated(_verificationEpoch);
+    }
+
+    /**
+     *  @dev Checks that the identity of the user holds a valid claim from a trusted issuer
+     *  for every required claim topic
+     *  @param _userAddress The address of the user
+     */
+    // solhint-disable-next-line code-complexity
+    function _computeVerification(address _userAddress) internal view returns (bool) {
+        if (address(identity(_userAddress)) == address(0)) {return false;}
+        uint256[] memory requiredClaimTopics = _tokenTopicsRegistry.getClaimTopics();
+        if (requiredClaimTopics.length == 0) {
+            return true;
+        }
+
+        uint256 foundClaimTopic;
+        uint256 scheme;
+        address issuer;
+        bytes memory sig;
+        bytes memory data;
+        uint256 claimTopic;
+        for (claimTopic = 0; claimTopic < requiredClaimTopics.length; claimTopic++) {
+            IClaimIssuer[] memory trustedIssuers =
+            _tokenIssuersRegistry.getTrustedIssuersForClaimTopic(requiredClaimTopics[claimTopic]);
+
+            if (trustedIssuers.length == 0) {return false;}
+
+            bytes32[] memory claimIds = new bytes32[](trustedIssuers.length);
+            for (uint256 i = 0; i < trustedIssuers.length; i++) {
+                claimIds[i] = keccak256(abi.encode(trustedIssuers[i], requiredClaimTopics[claimTopic]));
+            }
+
+            for (uint256 j = 0; j < claimIds.length; j++) {
+                (foundClaimTopic, scheme, issuer, sig, data, ) = identity(_userAddress).getClaim(claimIds[j]);
+
+                if (foundClaimTopic == requiredClaimTopics[claimTopic]) {
+                    try IClaimIssuer(issuer).isClaimValid(identity(_userAddress), requiredClaimTopics[claimTopic], sig,
+                        data) returns(bool _validity) {
+
+                        if (
+                            _validity
+                        ) {
+                            j = claimIds.length;
+                        }
+                        if (!_validity && j == (claimIds.length - 1)) {
+                            return false;
+                        }
+                    } catch {
+                        if (j == (claimIds.length - 1)) {
+                            return false;
+                        }
+                    }
+                } else if (j == (claimIds.length - 1)) {
+                    return false;
+                }
+            }
+        }
+        return true;
+    }
 }
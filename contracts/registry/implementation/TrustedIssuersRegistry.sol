@@ -67,6 +67,7 @@ import "@onchain-id/solidity/contracts/interface/IClaimIssuer.sol";
 // import "@openzeppelin/contracts-upgradeable/access/OwnableUpgradeable.sol";
 import "@openzeppelin/contracts/access/Ownable.sol";
 import "../interface/ITrustedIssuersRegistry.sol";
+import "../interface/IVerificationCache.sol";
 import "../storage/TIRStorage.sol";
 
 
@@ -81,15 +82,17 @@ contract TrustedIssuersRegistry is ITrustedIssuersRegistry, Ownable, TIRStorage
      */
     function addTrustedIssuer(IClaimIssuer _trustedIssuer, uint256[] calldata _claimTopics) external override onlyOwner {
         require(address(_trustedIssuer) != address(0), "invalid argument - zero address");
-        require(_trustedIssuerClaimTopics[address(_trustedIssuer)].length == 0, "trusted Issuer already exists");
+        require(_trustedIssuerIndex[address(_trustedIssuer)] == 0, "trusted Issuer already exists");
         require(_claimTopics.length > 0, "trusted claim topics cannot be empty");
         require(_claimTopics.length <= 15, "cannot have more than 15 claim topics");
         require(_trustedIssuers.length < 50, "cannot have more than 50 trusted issuers");
         _trustedIssuers.push(_trustedIssuer);
+        _trustedIssuerIndex[address(_trustedIssuer)] = _trustedIssuers.length;
         _trustedIssuerClaimTopics[address(_trustedIssuer)] = _claimTopics;
         for (uint256 i = 0; i < _claimTopics.length; i++) {
-            _claimTopicsToTrustedIssuers[_claimTopics[i]].push(_trustedIssuer);
+            _addIssuerToClaimTopic(_trustedIssuer, _claimTopics[i]);
         }
+        _invalidateVerificationCaches();
         emit TrustedIssuerAdded(_trustedIssuer, _claimTopics);
     }
 
@@ -98,31 +101,16 @@ contract TrustedIssuersRegistry is ITrustedIssuersRegistry, Ownable, TIRStorage
      */
     function removeTrustedIssuer(IClaimIssuer _trustedIssuer) external override onlyOwner {
         require(address(_trustedIssuer) != address(0), "invalid argument - zero address");
-        require(_trustedIssuerClaimTopics[address(_trustedIssuer)].length != 0, "NOT a trusted issuer");
-        uint256 length = _trustedIssuers.length;
-        for (uint256 i = 0; i < length; i++) {
-            if (_trustedIssuers[i] == _trustedIssuer) {
-                _trustedIssuers[i] = _trustedIssuers[length - 1];
-                _trustedIssuers.pop();
-                break;
-            }
-        }
-        for (
-            uint256 claimTopicIndex = 0;
-            claimTopicIndex < _trustedIssuerClaimTopics[address(_trustedIssuer)].length;
-            claimTopicIndex++) {
-            uint256 claimTopic = _trustedIssuerClaimTopics[address(_trustedIssuer)][claimTopicIndex];
-            uint256 topicsLength = _claimTopicsToTrustedIssuers[claimTopic].length;
-            for (uint256 i = 0; i < topicsLength; i++) {
-                if (_claimTopicsToTrustedIssuers[claimTopic][i] == _trustedIssuer) {
-                    _claimTopicsToTrustedIssuers[claimTopic][i] =
-                    _claimTopicsToTrustedIssuers[claimTopic][topicsLength - 1];
-                    _claimTopicsToTrustedIssuers[claimTopic].pop();
-                    break;
-                }
-            }
-        }
+        uint256 index = _trustedIssuerIndex[address(_trustedIssuer)];
+        require(index != 0, "NOT a trusted issuer");
+        IClaimIssuer lastIssuer = _trustedIssuers[_trustedIssuers.length - 1];
+        _trustedIssuers[index - 1] = lastIssuer;
+        _trustedIssuerIndex[address(lastIssuer)] = index;
+        _trustedIssuers.pop();
+        delete _trustedIssuerIndex[address(_trustedIssuer)];
+        _removeIssuerFromClaimTopics(_trustedIssuer);
         delete _trustedIssuerClaimTopics[address(_trustedIssuer)];
+        _invalidateVerificationCaches();
         emit TrustedIssuerRemoved(_trustedIssuer);
     }
 
@@ -131,26 +119,16 @@ contract TrustedIssuersRegistry is ITrustedIssuersRegistry, Ownable, TIRStorage
      */
     function updateIssuerClaimTopics(IClaimIssuer _trustedIssuer, uint256[] calldata _claimTopics) external override onlyOwner {
         require(address(_trustedIssuer) != address(0), "invalid argument - zero address");
-        require(_trustedIssuerClaimTopics[address(_trustedIssuer)].length != 0, "NOT a trusted issuer");
+        require(_trustedIssuerIndex[address(_trustedIssuer)] != 0, "NOT a trusted issuer");
         require(_claimTopics.length <= 15, "cannot have more than 15 claim topics");
         require(_claimTopics.length > 0, "claim topics cannot be empty");
 
-        for (uint256 i = 0; i < _trustedIssuerClaimTopics[address(_trustedIssuer)].length; i++) {
-            uint256 claimTopic = _trustedIssuerClaimTopics[address(_trustedIssuer)][i];
-            uint256 topicsLength = _claimTopicsToTrustedIssuers[claimTopic].length;
-            for (uint256 j = 0; j < topicsLength; j++) {
-                if (_claimTopicsToTrustedIssuers[claimTopic][j] == _trustedIssuer) {
-                    _claimTopicsToTrustedIssuers[claimTopic][j] =
-                    _claimTopicsToTrustedIssuers[claimTopic][topicsLength - 1];
-                    _claimTopicsToTrustedIssuers[claimTopic].pop();
-                    break;
-                }
-            }
-        }
+        _removeIssuerFromClaimTopics(_trustedIssuer);
         _trustedIssuerClaimTopics[address(_trustedIssuer)] = _claimTopics;
         for (uint256 i = 0; i < _claimTopics.length; i++) {
-            _claimTopicsToTrustedIssuers[_claimTopics[i]].push(_trustedIssuer);
+            _addIssuerToClaimTopic(_trustedIssuer, _claimTopics[i]);
         }
+        _invalidateVerificationCaches();
         emit ClaimTopicsUpdated(_trustedIssuer, _claimTopics);
     }
 
@@ -172,10 +150,7 @@ contract TrustedIssuersRegistry is ITrustedIssuersRegistry, Ownable, TIRStorage
      *  @dev See {ITrustedIssuersRegistry-isTrustedIssuer}.
      */
     function isTrustedIssuer(address _issuer) external view override returns (bool) {
-        if(_trustedIssuerClaimTopics[_issuer].length > 0) {
-            return true;
-        }
-        return false;
+        return _trustedIssuerIndex[_issuer] != 0;
     }
 
     /**
@@ -190,13 +165,84 @@ contract TrustedIssuersRegistry is ITrustedIssuersRegistry, Ownable, TIRStorage
      *  @dev See {ITrustedIssuersRegistry-hasClaimTopic}.
      */
     function hasClaimTopic(address _issuer, uint256 _claimTopic) external view override returns (bool) {
-        uint256 length = _trustedIssuerClaimTopics[_issuer].length;
-        uint256[] memory claimTopics = _trustedIssuerClaimTopics[_issuer];
+        return _claimTopicToTrustedIssuerIndex[_issuer][_claimTopic] != 0;
+    }
+
+    /**
+     *  @dev See {ITrustedIssuersRegistry-bindIdentityRegistry}.
+     */
+    function bindIdentityRegistry(address _identityRegistry) external override onlyOwner {
+        require(_identityRegistry != address(0), "invalid argument - zero address");
+        require(_identityRegistries.length < 300, "cannot bind more than 300 IR to 1 TIR");
+        _identityRegistries.push(_identityRegistry);
+        emit IdentityRegistryBound(_identityRegistry);
+    }
+
+    /**
+     *  @dev See {ITrustedIssuersRegistry-unbindIdentityRegistry}.
+     */
+    function unbindIdentityRegistry(address _identityRegistry) external override onlyOwner {
+        require(_identityRegistry != address(0), "invalid argument - zero address");
+        require(_identityRegistries.length > 0, "identity registry is not stored");
+        uint256 length = _identityRegistries.length;
         for (uint256 i = 0; i < length; i++) {
-            if (claimTopics[i] == _claimTopic) {
-                return true;
+            if (_identityRegistries[i] == _identityRegistry) {
+                _identityRegistries[i] = _identityRegistries[length - 1];
+                _identityRegistries.pop();
+                break;
+            }
+        }
+        emit IdentityRegistryUnbound(_identityRegistry);
+    }
+
+    /**
+     *  @dev See {ITrustedIssuersRegistry-linkedIdentityRegistries}.
+     */
+    function linkedIdentityRegistries() external view override returns (address[] memory) {
+        return _identityRegistries;
+    }
+
+    /**
+     *  @dev Invalidates the verification cache of every bound identity registry
+     */
+    function _invalidateVerificationCaches() internal {
+        uint256 length = _identityRegistries.length;
+        for (uint256 i = 0; i < length; i++) {
+            IVerificationCache(_identityRegistries[i]).invalidateVerificationCache();
+        }
+    }
+
+    /**
+     *  @dev Appends the issuer to the issuers allowed for the claim topic,
+     *  duplicated topics are skipped
+     */
+    function _addIssuerToClaimTopic(IClaimIssuer _trustedIssuer, uint256 _claimTopic) internal {
+        if (_claimTopicToTrustedIssuerIndex[address(_trustedIssuer)][_claimTopic] != 0) {
+            return;
+        }
+        _claimTopicsToTrustedIssuers[_claimTopic].push(_trustedIssuer);
+        _claimTopicToTrustedIssuerIndex[address(_trustedIssuer)][_claimTopic] =
+            _claimTopicsToTrustedIssuers[_claimTopic].length;
+    }
+
+    /**
+     *  @dev Removes the issuer from the issuers allowed for each of its current claim topics,
+     *  swapping the last issuer of each topic into the freed position
+     */
+    function _removeIssuerFromClaimTopics(IClaimIssuer _trustedIssuer) internal {
+        uint256[] storage claimTopics = _trustedIssuerClaimTopics[address(_trustedIssuer)];
+        for (uint256 i = 0; i < claimTopics.length; i++) {
+            uint256 claimTopic = claimTopics[i];
+            uint256 index = _claimTopicToTrustedIssuerIndex[address(_trustedIssuer)][claimTopic];
+            if (index == 0) {
+                continue;
             }
+            IClaimIssuer[] storage issuers = _claimTopicsToTrustedIssuers[claimTopic];
+            IClaimIssuer lastIssuer = issuers[issuers.length - 1];
+            issuers[index - 1] = lastIssuer;
+            _claimTopicToTrustedIssuerIndex[address(lastIssuer)][claimTopic] = index;
+            issuers.pop();
+            delete _claimTopicToTrustedIssuerIndex[address(_trustedIssuer)][claimTopic];
         }
-        return false;
     }
 }
@@ -77,6 +77,20 @@ interface IClaimTopicsRegistry {
      */
     event ClaimTopicRemoved(uint256 indexed claimTopic);
 
+    /**
+     *  this event is emitted when an Identity Registry is bound to the Claim Topics Registry
+     *  the event is emitted by the 'bindIdentityRegistry' function
+     *  `identityRegistry` is the address of the identity registry added
+     */
+    event IdentityRegistryBound(address indexed identityRegistry);
+
+    /**
+     *  this event is emitted when an Identity Registry is unbound from the Claim Topics Registry
+     *  the event is emitted by the 'unbindIdentityRegistry' function
+     *  `identityRegistry` is the address of the identity registry removed
+     */
+    event IdentityRegistryUnbound(address indexed identityRegistry);
+
     /**
      * @dev Add a trusted claim topic (For example: KYC=1, AML=2).
      * Only owner can call.
@@ -99,4 +113,26 @@ interface IClaimTopicsRegistry {
      *  @return Array of trusted claim topics
      */
     function getClaimTopics() external view returns (uint256[] memory);
+
+    /**
+     *  @dev Binds an identity registry to the Claim Topics Registry, the registry's verification cache
+     *  is invalidated every time the Claim Topics Registry is modified.
+     *  This function can only be called by the owner of the Claim Topics Registry contract
+     *  @param _identityRegistry The identity registry address to add.
+     *  emits `IdentityRegistryBound` event
+     */
+    function bindIdentityRegistry(address _identityRegistry) external;
+
+    /**
+     *  @dev Unbinds an identity registry from the Claim Topics Registry.
+     *  This function can only be called by the owner of the Claim Topics Registry contract
+     *  @param _identityRegistry The identity registry address to remove.
+     *  emits `IdentityRegistryUnbound` event
+     */
+    function unbindIdentityRegistry(address _identityRegistry) external;
+
+    /**
+     *  @dev Returns the identity registries bound to the Claim Topics Registry
+     */
+    function linkedIdentityRegistries() external view returns (address[] memory);
 }
@@ -89,6 +89,20 @@ interface ITrustedIssuersRegistry {
      */
     event ClaimTopicsUpdated(IClaimIssuer indexed trustedIssuer, uint256[] claimTopics);
 
+    /**
+     *  this event is emitted when an Identity Registry is bound to the Trusted Issuers Registry
+     *  the event is emitted by the 'bindIdentityRegistry' function
+     *  `identityRegistry` is the address of the identity registry added
+     */
+    event IdentityRegistryBound(address indexed identityRegistry);
+
+    /**
+     *  this event is emitted when an Identity Registry is unbound from the Trusted Issuers Registry
+     *  the event is emitted by the 'unbindIdentityRegistry' function
+     *  `identityRegistry` is the address of the identity registry removed
+     */
+    event IdentityRegistryUnbound(address indexed identityRegistry);
+
     /**
      *  @dev registers a ClaimIssuer contract as trusted claim issuer.
      *  Requires that a ClaimIssuer contract doesn't already exist
@@ -159,4 +173,26 @@ interface ITrustedIssuersRegistry {
      *  @return true if the issuer is trusted for this claim topic.
      */
     function hasClaimTopic(address _issuer, uint256 _claimTopic) external view returns (bool);
+
+    /**
+     *  @dev Binds an identity registry to the Trusted Issuers Registry, the registry's verification cache
+     *  is invalidated every time the Trusted Issuers Registry is modified.
+     *  This function can only be called by the owner of the Trusted Issuers Registry contract
+     *  @param _identityRegistry The identity registry address to add.
+     *  emits `IdentityRegistryBound` event
+     */
+    function bindIdentityRegistry(address _identityRegistry) external;
+
+    /**
+     *  @dev Unbinds an identity registry from the Trusted Issuers Registry.
+     *  This function can only be called by the owner of the Trusted Issuers Registry contract
+     *  @param _identityRegistry The identity registry address to remove.
+     *  emits `IdentityRegistryUnbound` event
+     */
+    function unbindIdentityRegistry(address _identityRegistry) external;
+
+    /**
+     *  @dev Returns the identity registries bound to the Trusted Issuers Registry
+     */
+    function linkedIdentityRegistries() external view returns (address[] memory);
 }
@@ -0,0 +1,65 @@
+// SPDX-License-Identifier: GPL-3.0
+
+pragma solidity 0.8.17;
+
+interface IVerificationCache {
+    /**
+     *  this event is emitted when every cached verification status has been invalidated
+     *  the event is emitted by the 'invalidateVerificationCache' function and by the registry setters
+     *  `epoch` is the new verification epoch
+     */
+    event VerificationCacheInvalidated(uint256 indexed epoch);
+
+    /**
+     *  this event is emitted when the verification status of a user has been recomputed and stored
+     *  the event is emitted by the 'refreshVerification' function
+     *  `userAddress` is the address of the user
+     *  `verified` is the recomputed verification status
+     *  `epoch` is the verification epoch the status is valid for
+     */
+    event VerificationRefreshed(address indexed userAddress, bool verified, uint256 indexed epoch);
+
+    /**
+     *  this event is emitted when the cached verification status of a user has been dropped
+     *  the event is emitted by the 'clearVerification' function
+     *  `userAddress` is the address of the user
+     */
+    event VerificationCleared(address indexed userAddress);
+
+    /**
+     *  @dev Invalidates every cached verification status by bumping the verification epoch.
+     *  Called by the bound ClaimTopicsRegistry and TrustedIssuersRegistry whenever they change,
+     *  and by trusted ClaimIssuers whenever they revoke a claim
+     *  This function can only be called by the owner, the linked registries or a trusted issuer
+     *  emits `VerificationCacheInvalidated` event
+     */
+    function invalidateVerificationCache() external;
+
+    /**
+     *  @dev Recomputes the verification status of a user and caches it for the current epoch.
+     *  Can be called by anyone, e.g. to cache the status again after it was cleared or invalidated
+     *  @param _userAddress The address of the user
+     *  emits `VerificationRefreshed` event
+     */
+    function refreshVerification(address _userAddress) external returns (bool);
+
+    /**
+     *  @dev Drops the cached verification status of a user, isVerified checks the claims again until
+     *  the status is refreshed. Called by the user's identity whenever a claim is added to or removed from it
+     *  This function can only be called by the owner or the identity of the user
+     *  @param _userAddress The address of the user
+     *  emits `VerificationCleared` event
+     */
+    function clearVerification(address _userAddress) external;
+
+    /**
+     *  @dev Returns the current verification epoch
+     */
+    function verificationEpoch() external view returns (uint256);
+
+    /**
+     *  @dev Returns true if the verification status of the user is cached for the current epoch
+     *  @param _userAddress The address of the user
+     */
+    function isVerificationCached(address _userAddress) external view returns (bool);
+}
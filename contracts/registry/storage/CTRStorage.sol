@@ -67,9 +67,12 @@ contract CTRStorage {
     /// @dev All required Claim Topics
     uint256[] internal _claimTopics;
 
+    /// @dev array of Identity Registries whose verification cache is invalidated on every change
+    address[] internal _identityRegistries;
+
     /**
      * @dev This empty reserved space is put in place to allow future versions to add new
      * variables without shifting down storage in the inheritance chain.
      */
-    uint256[49] private __gap;
+    uint256[48] private __gap;
 }
\ No newline at end of file
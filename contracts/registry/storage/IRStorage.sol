@@ -77,9 +77,21 @@ contract IRStorage {
     /// @dev Address of the IdentityRegistryStorage Contract
     IIdentityRegistryStorage internal _tokenIdentityStorage;
 
+    /// @dev struct containing a cached verification status and the epoch it was computed in
+    struct CachedVerification {
+        uint64 epoch;
+        bool verified;
+    }
+
+    /// @dev Current verification epoch, cached statuses of older epochs are ignored
+    uint256 internal _verificationEpoch;
+
+    /// @dev mapping between a user address and its cached verification status
+    mapping(address => CachedVerification) internal _verificationCache;
+
     /**
      * @dev This empty reserved space is put in place to allow future versions to add new
      * variables without shifting down storage in the inheritance chain.
      */
-    uint256[49] private __gap;
+    uint256[47] private __gap;
 }
\ No newline at end of file
@@ -75,9 +75,19 @@ contract TIRStorage {
     /// @dev Mapping between a claim topic and the allowed trusted issuers for it.
     mapping(uint256 => IClaimIssuer[]) internal _claimTopicsToTrustedIssuers;
 
+    /// @dev Mapping between a trusted issuer address and its 1-based position in _trustedIssuers, 0 if not trusted.
+    mapping(address => uint256) internal _trustedIssuerIndex;
+
+    /// @dev Mapping between a trusted issuer address, a claim topic and the 1-based position of the issuer
+    /// in _claimTopicsToTrustedIssuers for that topic, 0 if the issuer is not trusted for the topic.
+    mapping(address => mapping(uint256 => uint256)) internal _claimTopicToTrustedIssuerIndex;
+
+    /// @dev array of Identity Registries whose verification cache is invalidated on every change
+    address[] internal _identityRegistries;
+
     /**
      * @dev This empty reserved space is put in place to allow future versions to add new
      * variables without shifting down storage in the inheritance chain.
      */
-    uint256[49] private __gap;
+    uint256[46] private __gap;
 }
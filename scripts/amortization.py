@@ -0,0 +1,138 @@
+import numpy as np
+
+# Fixed-point precision of Token, Debts and REIMBURSEMENT (PRECISION = 8)
+PRECISION = 8
+SCALE = 10**PRECISION
+# Seconds per payment period and payment periods per year, indexed by the PaymentFrequency enum
+PAYMENT_FREQUENCY_TO_SECONDS = [0, 86400, 604800, 1209600, 2629800, 31556952]
+PAYMENT_FREQUENCY_TO_LOAN_TERM = [0, 365, 52, 24, 12, 1]
+# fixed_mul splits its left operand, so the right operand times SCALE must fit in an int64
+MAX_FIXED_OPERAND = np.iinfo(np.int64).max // SCALE
+
+
+def fixed_mul(a, b):
+    # Exact floor(a * b / SCALE) for int64 arrays and a non-negative b: with a = hi * SCALE + lo,
+    # a * b / SCALE = hi * b + lo * b / SCALE where only the second term is rounded
+    if np.any(b > MAX_FIXED_OPERAND):
+        raise OverflowError("Fixed-point operand exceeds {}".format(MAX_FIXED_OPERAND))
+    hi, lo = np.divmod(a, SCALE)
+    return hi * b + (lo * b) // SCALE
+
+
+def rpow(base, exponents):
+    # (base / SCALE) ** exponents by squaring, flooring after every multiplication like the
+    # scalar loop. Series with different exponents are computed in the same passes
+    base = np.asarray(base, dtype=np.int64).copy()
+    exponents = np.asarray(exponents, dtype=np.int64).copy()
+    result = np.where(exponents % 2 == 1, base, SCALE).astype(np.int64)
+    exponents //= 2
+    while np.any(exponents > 0):
+        active = exponents > 0
+        base = np.where(active, fixed_mul(base, base), base)
+        odd = exponents % 2 == 1
+        result = np.where(odd, fixed_mul(result, base), result)
+        exponents //= 2
+    return result
+
+
+def contract_terms(interest_rate, payment_frequency, duration):
+    # periodicInterestRate and loanTerm as set by the constructors of amortizable instruments.
+    # `duration` is maturityDate - contractDeploymentTime in seconds
+    interest_rate = np.asarray(interest_rate, dtype=np.int64)
+    payment_frequency = np.asarray(payment_frequency, dtype=np.int64)
+    periods_per_year = np.take(PAYMENT_FREQUENCY_TO_LOAN_TERM, payment_frequency)
+    seconds = np.take(PAYMENT_FREQUENCY_TO_SECONDS, payment_frequency)
+    periodic_rate = (interest_rate * SCALE) // (periods_per_year * 100)
+    loan_term = (np.asarray(duration, dtype=np.int64) * SCALE) // seconds
+    return periodic_rate, loan_term
+
+
+def annuity_factor(periodic_rate, periods):
+    # r * (1 + r) ** n / ((1 + r) ** n - 1), returned as the numerator and denominator
+    # expected by setAmortizationSchedule
+    periodic_rate = np.asarray(periodic_rate, dtype=np.int64)
+    growth = rpow(SCALE + periodic_rate, periods)
+    return fixed_mul(periodic_rate, growth), growth - SCALE
+
+
+# Computes the schedule of many series at once. Inputs hold one entry per series in the contract's units:
+# `periodic_rate` and `loan_term` are the periodicInterestRate and loanTerm of the instrument, both scaled
+# by 10 ** PRECISION. Per-period amounts are per token and scaled by 10 ** PRECISION, like periodicPayment.
+# Columns past the last period of a series are zero
+def amortization_schedule(face_value, periodic_rate, loan_term):
+    face_value = np.asarray(face_value, dtype=np.int64)
+    periodic_rate = np.asarray(periodic_rate, dtype=np.int64)
+    periods = np.asarray(loan_term, dtype=np.int64) // SCALE
+    numerator, denominator = annuity_factor(periodic_rate, periods)
+    if np.any(denominator <= 0):
+        raise ValueError("Every series needs a non-zero rate and at least one period")
+    # Same rounding as periodicPayment = faceValue * 10 ** PRECISION * numerator / denominator.
+    # The intermediate product can exceed an int64, so this one step runs on Python integers
+    periodic_payment = (
+        (face_value.astype(object) * SCALE * numerator.astype(object))
+        // denominator.astype(object)
+    ).astype(np.int64)
+    max_periods = int(periods.max()) if periods.size else 0
+    shape = (face_value.size, max_periods)
+    payment = np.zeros(shape, dtype=np.int64)
+    interest = np.zeros(shape, dtype=np.int64)
+    principal = np.zeros(shape, dtype=np.int64)
+    outstanding = np.zeros(shape, dtype=np.int64)
+    balance = face_value * SCALE
+    for period in range(max_periods):
+        active = period < periods
+        period_interest = fixed_mul(balance, periodic_rate)
+        period_principal = periodic_payment - period_interest
+        balance = np.where(active, balance - period_principal, balance)
+        payment[:, period] = np.where(active, periodic_payment, 0)
+        interest[:, period] = np.where(active, period_interest, 0)
+        principal[:, period] = np.where(active, period_principal, 0)
+        outstanding[:, period] = np.where(active, balance, 0)
+    return {
+        "numerator": numerator,
+        "denominator": denominator,
+        "periodic_payment": periodic_payment,
+        "payment": payment,
+        "interest": interest,
+        "principal": principal,
+        "outstanding": outstanding,
+    }
+
+
+def scalar_schedule(face_value, periodic_rate, loan_term):
+    # Reference implementation for a single series, one period at a time
+    periods = loan_term // SCALE
+    growth = SCALE
+    base = SCALE + periodic_rate
+    exponent = periods
+    if exponent % 2 == 1:
+        growth = base
+    exponent //= 2
+    while exponent > 0:
+        base = base * base // SCALE
+        if exponent % 2 == 1:
+            growth = growth * base // SCALE
+        exponent //= 2
+    numerator = periodic_rate * growth // SCALE
+    denominator = growth - SCALE
+    periodic_payment = face_value * SCALE * numerator // denominator
+    rows = []
+    balance = face_value * SCALE
+    for _ in range(periods):
+        interest = balance * periodic_rate // SCALE
+        principal = periodic_payment - interest
+        balance -= principal
+        rows.append((periodic_payment, interest, principal, balance))
+    return numerator, denominator, periodic_payment, rows
+
+
+def apply_schedule(token, account):
+    # Sets the periodic payment of a deployed amortizable instrument from its own terms
+    schedule = amortization_schedule(
+        [token.faceValue()], [token.periodicInterestRate()], [token.loanTerm()]
+    )
+    return token.setAmortizationSchedule(
+        int(schedule["numerator"][0]),
+        int(schedule["denominator"][0]),
+        {"from": account},
+    )
@@ -0,0 +1,55 @@
+import os
+import time
+import numpy as np
+from scripts.amortization import amortization_schedule, contract_terms, scalar_schedule
+
+# Usage: brownie run scripts/benchmarks/amortization.py
+# BENCHMARK_SERIES  number of series in the batch (default 5000)
+SERIES_COUNT = 5000
+SEED = 1947
+MONTHLY = 4
+WEEKLY = 2
+# Terms between one and ten years
+MIN_DURATION = 31556952
+MAX_DURATION = 10 * 31556952
+
+
+def random_series(count, seed=SEED):
+    rng = np.random.default_rng(seed)
+    face_value = rng.integers(100, 10**6, count)
+    interest_rate = rng.integers(1, 20, count)
+    payment_frequency = rng.choice([WEEKLY, MONTHLY], count)
+    duration = rng.integers(MIN_DURATION, MAX_DURATION, count)
+    periodic_rate, loan_term = contract_terms(
+        interest_rate, payment_frequency, duration
+    )
+    return face_value, periodic_rate, loan_term
+
+
+def benchmark(count):
+    face_value, periodic_rate, loan_term = random_series(count)
+    start = time.perf_counter()
+    schedule = amortization_schedule(face_value, periodic_rate, loan_term)
+    vectorized = time.perf_counter() - start
+    start = time.perf_counter()
+    scalar = [
+        scalar_schedule(int(face), int(rate), int(term))
+        for face, rate, term in zip(face_value, periodic_rate, loan_term)
+    ]
+    looped = time.perf_counter() - start
+    for i, (numerator, denominator, periodic_payment, rows) in enumerate(scalar):
+        assert schedule["numerator"][i] == numerator
+        assert schedule["denominator"][i] == denominator
+        assert schedule["periodic_payment"][i] == periodic_payment
+        assert schedule["outstanding"][i, len(rows) - 1] == rows[-1][3]
+    periods = int(sum(len(rows) for (_, _, _, rows) in scalar))
+    print(
+        "{} series ({} periods): vectorized {:.3f}s, scalar loop {:.3f}s ({:.1f}x)".format(
+            count, periods, vectorized, looped, looped / vectorized
+        )
+    )
+    return {"series": count, "vectorized": vectorized, "scalar": looped}
+
+
+def main():
+    benchmark(int(os.getenv("BENCHMARK_SERIES", SERIES_COUNT)))
@@ -0,0 +1,42 @@
+from scripts.helpfulscripts import get_account
+from scripts.onboarding import deploy_identity_factory
+from brownie import Identity, accounts
+from web3 import Web3
+
+# Usage: brownie run scripts/benchmarks/identities.py
+IDENTITY_COUNT = 20
+
+
+def average(gas):
+    return sum(gas) // len(gas)
+
+
+def benchmark(account, count=IDENTITY_COUNT):
+    factory = deploy_identity_factory(account)
+    investors = [accounts.add().address for _ in range(count)]
+    full_deployments = [
+        Identity.deploy(investor, False, {"from": account}).tx.gas_used
+        for investor in investors
+    ]
+    clones = [
+        factory.createIdentity(
+            investor, Web3.keccak(text=investor), {"from": account}
+        ).gas_used
+        for investor in investors
+    ]
+    results = {
+        "Identity.deploy": average(full_deployments),
+        "IdentityFactory.createIdentity": average(clones),
+    }
+    for label, gas in results.items():
+        print("{}: {} gas per identity".format(label, gas))
+    print(
+        "Clones use {:.1f}x less gas per identity".format(
+            results["Identity.deploy"] / results["IdentityFactory.createIdentity"]
+        )
+    )
+    return results
+
+
+def main():
+    benchmark(get_account())
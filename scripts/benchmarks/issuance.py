@@ -0,0 +1,74 @@
+from scripts.helpfulscripts import get_account
+from scripts.deploy import deploy, deploy_issuance_factory
+from brownie import Token, Debts, Equities, chain
+
+# Usage: brownie run scripts/benchmarks/issuance.py
+INITIAL_SUPPLY = 10000
+PRICE = 100
+FACE_VALUE = 100
+INTEREST_RATE = 10
+# Redeemable, fixed maturity, daily, fixed rate
+TOKEN_OPTIONS = (0, 1, 1, 1)
+# Redeemable, fixed rate, daily
+EQUITY_OPTIONS = (1, 1, 1)
+
+
+def benchmark(account):
+    payment_token, identity_registry = deploy()
+    factory = deploy_issuance_factory(account, payment_token, identity_registry)
+    maturity_date = chain.time() + 365 * 86400
+    config = ("Benchmark", "BMK", INITIAL_SUPPLY)
+    token_terms = (
+        maturity_date,
+        payment_token.address,
+        identity_registry.address,
+        PRICE,
+        FACE_VALUE,
+        INTEREST_RATE,
+    )
+    equity_terms = (
+        maturity_date,
+        payment_token.address,
+        identity_registry.address,
+        PRICE,
+        INTEREST_RATE,
+    )
+    results = {}
+    for name, contract in [("Token", Token), ("Debts", Debts)]:
+        results[name] = (
+            contract.deploy(
+                "Benchmark",
+                "BMK",
+                INITIAL_SUPPLY,
+                TOKEN_OPTIONS,
+                *token_terms,
+                {"from": account},
+            ).tx.gas_used,
+            getattr(factory, "issue" + name)(
+                config, TOKEN_OPTIONS, token_terms, {"from": account}
+            ).gas_used,
+        )
+    results["Equities"] = (
+        Equities.deploy(
+            "Benchmark",
+            "BMK",
+            INITIAL_SUPPLY,
+            *EQUITY_OPTIONS,
+            *equity_terms,
+            {"from": account},
+        ).tx.gas_used,
+        factory.issueEquities(
+            config, EQUITY_OPTIONS, equity_terms, {"from": account}
+        ).gas_used,
+    )
+    for name, (constructor_gas, clone_gas) in results.items():
+        print(
+            "{}: constructor {} gas, factory clone {} gas ({:.1f}x less)".format(
+                name, constructor_gas, clone_gas, constructor_gas / clone_gas
+            )
+        )
+    return results
+
+
+def main():
+    benchmark(get_account())
@@ -0,0 +1,380 @@
+import csv
+import json
+import os
+from scripts.helpfulscripts import get_account
+from scripts.deploy import deploy
+from brownie import (
+    Asset,
+    Token,
+    Debts,
+    Equities,
+    DEBTS,
+    Parameters,
+    accounts,
+    config,
+    chain,
+)
+from web3 import Web3
+
+# Usage: brownie run scripts/benchmarks/payouts.py
+# BENCHMARK_HOLDER_COUNTS  comma separated holder counts (default 1,10,100,500,1000)
+# BENCHMARK_OUTPUT_DIR     directory the CSV/JSON report is written to
+# BENCHMARK_BASELINE       stored baseline, written on the first run if it does not exist. The default
+#                          sits in the ignored results directory, next to the reports
+# BENCHMARK_THRESHOLD      allowed relative gas increase over the baseline (default 0.05)
+# BENCHMARK_UPDATE_BASELINE=1 overwrites the baseline with the current run
+HOLDER_COUNTS = [1, 10, 100, 500, 1000]
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUTPUT_DIR = os.path.join(BENCHMARK_DIR, "results")
+DEFAULT_BASELINE = os.path.join(DEFAULT_OUTPUT_DIR, "payouts_baseline.json")
+DEFAULT_THRESHOLD = 0.05
+
+INITIAL_SUPPLY = 10000
+PRICE = 100
+FACE_VALUE = 100
+INTEREST_RATE = 10
+PRECISION = 8
+FUNDING = 10**10
+COUNTRY = 586
+REGISTRATION_BATCH_SIZE = 200
+# Maturity is far enough out to pay several periods, the maturity payout sleeps past it
+MATURITY_OFFSET = 30 * 86400
+
+# Enum values of the instruments, see the contracts for the full lists
+REDEEMABLE = 0
+EQUITY_REDEEMABLE = 1
+FIXED_MATURITY_WITH_CALL = 2
+AMORTIZATION = 5
+DAILY = 1
+FIXED = 1
+FIXED_RATE = 1
+GOVERNMENT = 0
+BEARER = 0
+
+
+def holder_address(i):
+    return Web3.toChecksumAddress(
+        "0x" + bytes(Web3.keccak(text="benchmark-holder-{}".format(i)))[-20:].hex()
+    )
+
+
+def register_holders(identity_registry, account, count):
+    # Every benchmark holder shares the verified identity of the deployer
+    identity = identity_registry.identity(account)
+    holders = [holder_address(i) for i in range(count)]
+    for i in range(0, count, REGISTRATION_BATCH_SIZE):
+        batch = holders[i : i + REGISTRATION_BATCH_SIZE]
+        identity_registry.batchRegisterIdentity(
+            batch, [identity] * len(batch), [COUNTRY] * len(batch), {"from": account}
+        )
+    return holders
+
+
+def measure(call):
+    # Every measured call runs against the same state and is rolled back afterwards
+    chain.snapshot()
+    try:
+        return call().gas_used
+    finally:
+        chain.revert()
+
+
+def after_maturity(maturity_date, call):
+    def run():
+        chain.sleep(maturity_date - chain.time() + 1)
+        chain.mine(1)
+        return call()
+
+    return run
+
+
+def deploy_token(
+    contract, reimbursement, payment_token, identity_registry, account, account1
+):
+    maturity_date = chain.time() + MATURITY_OFFSET
+    token = contract.deploy(
+        "Benchmark",
+        "BMK",
+        INITIAL_SUPPLY,
+        (REDEEMABLE, reimbursement, DAILY, FIXED),
+        maturity_date,
+        payment_token,
+        identity_registry,
+        PRICE,
+        FACE_VALUE,
+        INTEREST_RATE,
+        {"from": account},
+    )
+    payment_token.transfer(token, FUNDING, {"from": account1})
+    asset = Asset.at(token.getAddress())
+
+    def issue(holder):
+        return token.issueToken(1, holder, {"from": account})
+
+    if reimbursement == AMORTIZATION:
+        token.setAmortizationSchedule(1, 10, {"from": account})
+        calls = {
+            "payAmortizedPaymentsToAll": lambda: token.payAmortizedPaymentsToAll(
+                {"from": account}
+            ),
+        }
+    else:
+        calls = {
+            "payInterestToAll": lambda: token.payInterestToAll({"from": account}),
+            "callTokenFromAll": lambda: token.callTokenFromAll(0, {"from": account}),
+            "payAtMaturityToAll": after_maturity(
+                maturity_date, lambda: token.payAtMaturityToAll({"from": account})
+            ),
+        }
+    return asset, issue, calls
+
+
+def deploy_equities(payment_token, identity_registry, account, account1):
+    maturity_date = chain.time() + MATURITY_OFFSET
+    equities = Equities.deploy(
+        "Benchmark",
+        "BMK",
+        INITIAL_SUPPLY,
+        EQUITY_REDEEMABLE,
+        FIXED_RATE,
+        DAILY,
+        maturity_date,
+        payment_token,
+        identity_registry,
+        PRICE,
+        INTEREST_RATE,
+        {"from": account},
+    )
+    payment_token.transfer(equities, FUNDING, {"from": account1})
+    asset = Asset.at(equities.getAddress())
+
+    def issue(holder):
+        return equities.issueToken(1, holder, {"from": account})
+
+    calls = {
+        "payIncomeToAll": lambda: equities.payIncomeToAll(0, {"from": account}),
+    }
+    return asset, issue, calls
+
+
+def deploy_debts(reimbursement, payment_token, identity_registry, account, account1):
+    maturity_date = chain.time() + MATURITY_OFFSET
+    asset = Asset.deploy(
+        INITIAL_SUPPLY, "Benchmark", "BMK", identity_registry, {"from": account1}
+    )
+    parameters = Parameters.deploy(
+        PRICE, PRECISION, asset, payment_token, identity_registry, {"from": account1}
+    )
+    debts = DEBTS.deploy(
+        parameters,
+        (DAILY, DAILY, FIXED, GOVERNMENT, reimbursement, BEARER),
+        (maturity_date, FACE_VALUE, INTEREST_RATE),
+        {"from": account},
+    )
+    payment_token.transfer(debts, FUNDING, {"from": account1})
+
+    def issue(holder):
+        return asset.transfer(holder, 1, {"from": account1})
+
+    def call_token_from_all():
+        # Burning called holders requires the instrument to own the asset
+        asset.transferOwnership(debts, {"from": account1})
+        return debts.callTokenFromAll(0, {"from": account})
+
+    if reimbursement == AMORTIZATION:
+        debts.setAmortizationSchedule(1, 10, {"from": account})
+        calls = {
+            "payAmortizedPaymentsToAll": lambda: debts.payAmortizedPaymentsToAll(
+                {"from": account}
+            ),
+        }
+    else:
+        calls = {
+            "payInterestToAll": lambda: debts.payInterestToAll({"from": account}),
+            "callTokenFromAll": call_token_from_all,
+            "payAtMaturityToAll": after_maturity(
+                maturity_date, lambda: debts.payAtMaturityToAll({"from": account})
+            ),
+        }
+    return asset, issue, calls
+
+
+def benchmark_instrument(name, deployed, holders, holder_counts, account1):
+    asset, issue, calls = deployed
+    results = []
+    issued = 0
+    for holder_count in holder_counts:
+        transfer_gas = None
+        for holder in holders[issued:holder_count]:
+            transfer_gas = issue(holder).gas_used
+        issued = holder_count
+        rows = {"issue to new holder": transfer_gas}
+        if name == "DEBTS (call)":
+            # The plain asset transfer is measured once, on the standalone asset
+            rows["Asset.transfer"] = measure(
+                lambda: asset.transfer(holders[0], 1, {"from": account1})
+            )
+        for function, call in calls.items():
+            rows[function] = measure(call)
+        for function, gas_used in rows.items():
+            if gas_used is None:
+                continue
+            results.append(
+                {
+                    "instrument": name,
+                    "function": function,
+                    "holders": holder_count,
+                    "gas_used": gas_used,
+                }
+            )
+            print(
+                "{} {} with {} holders: {} gas".format(
+                    name, function, holder_count, gas_used
+                )
+            )
+    return results
+
+
+def result_key(result):
+    return "{}/{}/{}".format(
+        result["instrument"], result["function"], result["holders"]
+    )
+
+
+def write_report(results, output_dir):
+    os.makedirs(output_dir, exist_ok=True)
+    csv_path = os.path.join(output_dir, "payouts.csv")
+    json_path = os.path.join(output_dir, "payouts.json")
+    with open(csv_path, "w", newline="") as f:
+        writer = csv.DictWriter(
+            f, fieldnames=["instrument", "function", "holders", "gas_used"]
+        )
+        writer.writeheader()
+        writer.writerows(results)
+    with open(json_path, "w") as f:
+        json.dump(results, f, indent=2)
+    print("Report written to {} and {}".format(csv_path, json_path))
+
+
+def check_regressions(results, baseline_path, threshold, update_baseline=False):
+    if update_baseline or not os.path.exists(baseline_path):
+        os.makedirs(os.path.dirname(os.path.abspath(baseline_path)), exist_ok=True)
+        with open(baseline_path, "w") as f:
+            json.dump({result_key(r): r["gas_used"] for r in results}, f, indent=2)
+        print("Baseline written to {}".format(baseline_path))
+        return []
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    regressions = []
+    for result in results:
+        key = result_key(result)
+        if key not in baseline:
+            continue
+        before, after = baseline[key], result["gas_used"]
+        if after > before * (1 + threshold):
+            regressions.append((key, before, after))
+        elif after < before:
+            # Savings are reported too, so an optimization can be measured against the baseline
+            print(
+                "Saving in {}: {} -> {} gas ({:.1%})".format(
+                    key, before, after, after / before - 1
+                )
+            )
+    for key, before, after in regressions:
+        print(
+            "Regression in {}: {} -> {} gas (+{:.1%})".format(
+                key, before, after, after / before - 1
+            )
+        )
+    return regressions
+
+
+def main():
+    holder_counts = [
+        int(count)
+        for count in os.getenv(
+            "BENCHMARK_HOLDER_COUNTS", ",".join(map(str, HOLDER_COUNTS))
+        ).split(",")
+    ]
+    output_dir = os.getenv("BENCHMARK_OUTPUT_DIR", DEFAULT_OUTPUT_DIR)
+    baseline_path = os.getenv("BENCHMARK_BASELINE", DEFAULT_BASELINE)
+    threshold = float(os.getenv("BENCHMARK_THRESHOLD", DEFAULT_THRESHOLD))
+    update_baseline = os.getenv("BENCHMARK_UPDATE_BASELINE") == "1"
+
+    account = get_account()
+    account1 = accounts.add(config["wallets"]["from_key"])
+    payment_token, identity_registry = deploy()
+    holders = register_holders(identity_registry, account, max(holder_counts))
+
+    instruments = [
+        (
+            "Token",
+            lambda: deploy_token(
+                Token,
+                FIXED_MATURITY_WITH_CALL,
+                payment_token,
+                identity_registry,
+                account,
+                account1,
+            ),
+        ),
+        (
+            "Token (amortized)",
+            lambda: deploy_token(
+                Token, AMORTIZATION, payment_token, identity_registry, account, account1
+            ),
+        ),
+        (
+            "Debts",
+            lambda: deploy_token(
+                Debts,
+                FIXED_MATURITY_WITH_CALL,
+                payment_token,
+                identity_registry,
+                account,
+                account1,
+            ),
+        ),
+        (
+            "Debts (amortized)",
+            lambda: deploy_token(
+                Debts, AMORTIZATION, payment_token, identity_registry, account, account1
+            ),
+        ),
+        (
+            "Equities",
+            lambda: deploy_equities(
+                payment_token, identity_registry, account, account1
+            ),
+        ),
+        (
+            "DEBTS (call)",
+            lambda: deploy_debts(
+                FIXED_MATURITY_WITH_CALL,
+                payment_token,
+                identity_registry,
+                account,
+                account1,
+            ),
+        ),
+        (
+            "DEBTS (amortized)",
+            lambda: deploy_debts(
+                AMORTIZATION, payment_token, identity_registry, account, account1
+            ),
+        ),
+    ]
+    results = []
+    for name, deploy_instrument in instruments:
+        results += benchmark_instrument(
+            name, deploy_instrument(), holders, holder_counts, account1
+        )
+
+    write_report(results, output_dir)
+    regressions = check_regressions(results, baseline_path, threshold, update_baseline)
+    if regressions:
+        raise RuntimeError(
+            "{} gas regressions above the {:.0%} threshold".format(
+                len(regressions), threshold
+            )
+        )
@@ -0,0 +1,80 @@
+from scripts.helpfulscripts import get_account
+from brownie import TrustedIssuersRegistry
+from web3 import Web3
+
+# Usage: brownie run scripts/benchmarks/trusted_issuers.py
+ISSUER_COUNT = 50
+TOPIC_COUNT = 20
+# The registry caps every issuer at 15 claim topics, so each issuer is trusted for a
+# rotating window of 15 out of the 20 topics
+TOPICS_PER_ISSUER = 15
+
+
+def issuer_address(i):
+    return Web3.toChecksumAddress(
+        "0x" + bytes(Web3.keccak(text="issuer-{}".format(i)))[-20:].hex()
+    )
+
+
+def issuer_topics(i):
+    return [(i + k) % TOPIC_COUNT + 1 for k in range(TOPICS_PER_ISSUER)]
+
+
+def report(label, gas):
+    print(
+        "{}: min {} / avg {} / max {} gas over {} calls".format(
+            label, min(gas), sum(gas) // len(gas), max(gas), len(gas)
+        )
+    )
+    return gas
+
+
+def benchmark(account):
+    registry = TrustedIssuersRegistry.deploy({"from": account})
+    issuers = [issuer_address(i) for i in range(ISSUER_COUNT)]
+    results = {}
+    results["addTrustedIssuer"] = report(
+        "addTrustedIssuer",
+        [
+            registry.addTrustedIssuer(
+                issuer, issuer_topics(i), {"from": account}
+            ).gas_used
+            for i, issuer in enumerate(issuers)
+        ],
+    )
+    results["hasClaimTopic"] = report(
+        "hasClaimTopic",
+        [
+            registry.hasClaimTopic.estimate_gas(issuer, topic)
+            for issuer in issuers
+            for topic in range(1, TOPIC_COUNT + 1)
+        ],
+    )
+    results["getTrustedIssuersForClaimTopic"] = report(
+        "getTrustedIssuersForClaimTopic",
+        [
+            registry.getTrustedIssuersForClaimTopic.estimate_gas(topic)
+            for topic in range(1, TOPIC_COUNT + 1)
+        ],
+    )
+    results["updateIssuerClaimTopics"] = report(
+        "updateIssuerClaimTopics",
+        [
+            registry.updateIssuerClaimTopics(
+                issuer, issuer_topics(i + 1), {"from": account}
+            ).gas_used
+            for i, issuer in enumerate(issuers)
+        ],
+    )
+    results["removeTrustedIssuer"] = report(
+        "removeTrustedIssuer",
+        [
+            registry.removeTrustedIssuer(issuer, {"from": account}).gas_used
+            for issuer in issuers
+        ],
+    )
+    return results
+
+
+def main():
+    benchmark(get_account())
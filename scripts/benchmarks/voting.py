@@ -0,0 +1,87 @@
+import os
+from scripts.helpfulscripts import get_account
+from scripts.vote_aggregator import sign_vote, vote_tuple
+from brownie import Voting, accounts, chain
+
+# Usage: brownie run scripts/benchmarks/voting.py
+# BENCHMARK_BATCH_SIZES  comma separated castVotesBySig batch sizes (default 1,10,50,100,200)
+BATCH_SIZES = [1, 10, 50, 100, 200]
+# Votes cast directly with castVote to measure the gas of a single vote
+DIRECT_VOTES = 10
+BLOCK_GAS_LIMIT = 30_000_000
+OPTIONS = ["Yes", "No"]
+
+
+def measure(call):
+    # Every measured call runs against the same state and is rolled back afterwards
+    chain.snapshot()
+    try:
+        return call().gas_used
+    finally:
+        chain.revert()
+
+
+def setup_ballot(account, voter_count):
+    voting = Voting.deploy({"from": account})
+    voting.createBallot("Benchmark", OPTIONS, chain.time(), 86400, {"from": account})
+    voters = [accounts.add() for _ in range(voter_count)]
+    for voter in voters:
+        voting.createVoter(1, voter, {"from": account})
+    voting.startVoting(0, {"from": account})
+    return voting, voters
+
+
+def direct_vote(voting, account, voter, option):
+    # The voter pays for its own vote, so it is funded first. Only the vote is measured
+    account.transfer(voter, "0.1 ether")
+    return voting.castVote(0, option, {"from": voter})
+
+
+def benchmark(account, batch_sizes):
+    voting, voters = setup_ballot(account, max(batch_sizes + [DIRECT_VOTES]))
+    direct = [
+        measure(lambda: direct_vote(voting, account, voter, i % 2))
+        for i, voter in enumerate(voters[:DIRECT_VOTES])
+    ]
+    direct_gas = sum(direct) // len(direct)
+    votes = [
+        vote_tuple(
+            sign_vote(
+                voter.private_key,
+                {"ballot": 0, "option": i % 2, "voter": voter.address, "nonce": 0},
+                voting.address,
+                chain.id,
+            )
+        )
+        for i, voter in enumerate(voters)
+    ]
+    print("castVote: {} gas per vote, paid by each voter".format(direct_gas))
+    results = [{"batch": 1, "gas_used": direct_gas, "per_vote": direct_gas}]
+    for batch_size in batch_sizes:
+        gas_used = measure(
+            lambda: voting.castVotesBySig(votes[:batch_size], {"from": account})
+        )
+        per_vote = gas_used // batch_size
+        print(
+            "castVotesBySig x{}: {} gas, {} gas per vote, {} votes per {} gas block".format(
+                batch_size,
+                gas_used,
+                per_vote,
+                BLOCK_GAS_LIMIT // per_vote,
+                BLOCK_GAS_LIMIT,
+            )
+        )
+        results.append(
+            {"batch": batch_size, "gas_used": gas_used, "per_vote": per_vote}
+        )
+    return results
+
+
+def main():
+    batch_sizes = [
+        int(size)
+        for size in os.getenv(
+            "BENCHMARK_BATCH_SIZES", ",".join(map(str, BATCH_SIZES))
+        ).split(",")
+    ]
+    benchmark(get_account(), batch_sizes)
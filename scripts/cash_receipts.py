@@ -0,0 +1,136 @@
+import os
+import json
+from concurrent.futures import ProcessPoolExecutor
+from eth_account import Account
+from eth_account.messages import encode_structured_data
+from scripts.helpfulscripts import get_account
+from scripts.pay_in_batches import current_payment_period
+from brownie import Token, Debts, chain
+
+# Usage: TOKEN_ADDRESS=0x... RECEIPTS_FILE=receipts.json brownie run scripts/cash_receipts.py
+# RECEIPTS_FILE holds a list of {"receiptNumber", "date", "tokenHolder", "amount"} objects for the
+# current payment period. The receipts are signed with the key of the token owner
+# EIP-712 domain of Token, Debts and INTEREST
+DOMAIN_NAME = "GenericTokenization"
+DOMAIN_VERSION = "1"
+CASH_RECEIPT_TYPES = {
+    "EIP712Domain": [
+        {"name": "name", "type": "string"},
+        {"name": "version", "type": "string"},
+        {"name": "chainId", "type": "uint256"},
+        {"name": "verifyingContract", "type": "address"},
+    ],
+    "CashReceipt": [
+        {"name": "receiptNumber", "type": "uint256"},
+        {"name": "date", "type": "uint256"},
+        {"name": "tokenHolder", "type": "address"},
+        {"name": "amount", "type": "uint256"},
+        {"name": "paymentPeriod", "type": "uint256"},
+    ],
+}
+# Receipts signed by one worker task and submitted in one payInterestInCashBatch transaction
+DEFAULT_CHUNK_SIZE = 250
+DEFAULT_BATCH_SIZE = 200
+
+
+def typed_receipt(receipt, payment_period, verifying_contract, chain_id):
+    return {
+        "types": CASH_RECEIPT_TYPES,
+        "primaryType": "CashReceipt",
+        "domain": {
+            "name": DOMAIN_NAME,
+            "version": DOMAIN_VERSION,
+            "chainId": chain_id,
+            "verifyingContract": verifying_contract,
+        },
+        "message": {
+            "receiptNumber": receipt["receiptNumber"],
+            "date": receipt["date"],
+            "tokenHolder": receipt["tokenHolder"],
+            "amount": receipt["amount"],
+            "paymentPeriod": payment_period,
+        },
+    }
+
+
+def sign_receipt(private_key, receipt, payment_period, verifying_contract, chain_id):
+    # Returns the receipt as the CashReceipt tuple expected by payInterestInCashBatch
+    message = encode_structured_data(
+        primitive=typed_receipt(receipt, payment_period, verifying_contract, chain_id)
+    )
+    signature = Account.sign_message(message, private_key).signature
+    return (
+        receipt["receiptNumber"],
+        receipt["date"],
+        receipt["tokenHolder"],
+        receipt["amount"],
+        bytes(signature),
+    )
+
+
+def sign_chunk(private_key, receipts, payment_period, verifying_contract, chain_id):
+    return [
+        sign_receipt(private_key, receipt, payment_period, verifying_contract, chain_id)
+        for receipt in receipts
+    ]
+
+
+def sign_receipts(
+    private_key,
+    receipts,
+    payment_period,
+    verifying_contract,
+    chain_id,
+    workers=None,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+):
+    # Signs the receipts in worker processes, signing is CPU bound. The order of the receipts is kept
+    chunks = [receipts[i : i + chunk_size] for i in range(0, len(receipts), chunk_size)]
+    if workers == 1 or len(chunks) <= 1:
+        return sign_chunk(
+            private_key, receipts, payment_period, verifying_contract, chain_id
+        )
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        signed = executor.map(
+            sign_chunk,
+            [private_key] * len(chunks),
+            chunks,
+            [payment_period] * len(chunks),
+            [verifying_contract] * len(chunks),
+            [chain_id] * len(chunks),
+        )
+        return [receipt for chunk in signed for receipt in chunk]
+
+
+def submit_receipts(token, account, signed, batch_size=DEFAULT_BATCH_SIZE):
+    transactions = []
+    for i in range(0, len(signed), batch_size):
+        batch = signed[i : i + batch_size]
+        tx = token.payInterestInCashBatch(batch, {"from": account})
+        tx.wait(1)
+        transactions.append(tx)
+        print(
+            "Receipts {}-{} recorded, {} gas".format(
+                i, i + len(batch) - 1, tx.gas_used
+            )
+        )
+    return transactions
+
+
+def main():
+    account = get_account()
+    instrument = Debts if os.getenv("INSTRUMENT", "Token") == "Debts" else Token
+    token = instrument.at(os.environ["TOKEN_ADDRESS"])
+    with open(os.environ["RECEIPTS_FILE"]) as receipts_file:
+        receipts = json.load(receipts_file)
+    signed = sign_receipts(
+        account.private_key,
+        receipts,
+        current_payment_period(token),
+        token.address,
+        chain.id,
+        workers=int(os.getenv("WORKERS", os.cpu_count() or 1)),
+    )
+    submit_receipts(
+        token, account, signed, int(os.getenv("BATCH_SIZE", DEFAULT_BATCH_SIZE))
+    )
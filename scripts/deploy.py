@@ -12,6 +12,10 @@ from brownie import (
     Identity,
     ClaimIssuer,
     Token,
+    Debts,
+    Equities,
+    Asset,
+    IssuanceFactory,
     ERC20Mock,
     PaymentToken,
     accounts,
@@ -139,6 +143,15 @@ def deploy():
     identity2 = Identity.deploy(account2, False, {"from": account2})
     claimIssuer = ClaimIssuer.deploy(account1, {"from": account})
 
+    # Binding the identity registry so registry changes invalidate its verification cache
+    trustedIssuersRegistry.bindIdentityRegistry(identityRegistry, {"from": account})
+    claimTopicsRegistry.bindIdentityRegistry(identityRegistry, {"from": account})
+    claimIssuer.bindIdentityRegistry(identityRegistry, {"from": account1})
+    # Binding the identity registry so claim updates drop the cached status of the identity's user
+    identity.bindVerificationCache(identityRegistry, account, {"from": account})
+    identity1.bindVerificationCache(identityRegistry, account1, {"from": account1})
+    identity2.bindVerificationCache(identityRegistry, account2, {"from": account2})
+
     # Registering the claim key with the identity contract
     encoded_data = encode_abi(["address"], [account1.address])
     account1_key = Web3.keccak(encoded_data)
@@ -207,6 +220,11 @@ def deploy():
     # Adding claim topic to Claim Topics Registry
     claimTopicsRegistry.addClaimTopic(1947, {"from": account})
 
+    # Caching the verification status of the registered accounts
+    identityRegistry.refreshVerification(account, {"from": account})
+    identityRegistry.refreshVerification(account1, {"from": account})
+    identityRegistry.refreshVerification(account2, {"from": account})
+
     # Deploying tokens
     # account3 = get_account(3)
     payment_token = PaymentToken.deploy(1e12, {"from": account1})
@@ -228,6 +246,53 @@ def deploy():
     return (payment_token, identityRegistry)
 
 
+def deploy_issuance_factory(account, payment_token, identityRegistry):
+    # The implementations are never used directly, they are set up without a payment
+    # schedule so that no maturity date or checkpoint schedule is needed
+    asset = Asset.deploy(0, "", "", identityRegistry, {"from": account})
+    token = Token.deploy(
+        "",
+        "",
+        0,
+        (0, 0, 0, 0),
+        0,
+        payment_token,
+        identityRegistry,
+        0,
+        0,
+        0,
+        {"from": account},
+    )
+    debts = Debts.deploy(
+        "",
+        "",
+        0,
+        (0, 0, 0, 0),
+        0,
+        payment_token,
+        identityRegistry,
+        0,
+        0,
+        0,
+        {"from": account},
+    )
+    equities = Equities.deploy(
+        "",
+        "",
+        0,
+        0,
+        0,
+        0,
+        0,
+        payment_token,
+        identityRegistry,
+        0,
+        0,
+        {"from": account},
+    )
+    return IssuanceFactory.deploy(asset, token, debts, equities, {"from": account})
+
+
 def main():
     (payment_token, identityRegistry) = deploy()
     # account = get_account()
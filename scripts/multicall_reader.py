@@ -0,0 +1,126 @@
+import os
+import time
+from dataclasses import dataclass
+from scripts.helpfulscripts import get_account
+from scripts.pay_in_batches import current_payment_period
+from brownie import Multicall3, Token
+
+# Usage: TOKEN_ADDRESS=0x... [MULTICALL_ADDRESS=0x...] brownie run scripts/multicall_reader.py
+# A Multicall3 contract is deployed when MULTICALL_ADDRESS is not set
+# Number of view calls packed into a single aggregate3 eth_call
+DEFAULT_BATCH_SIZE = 500
+
+
+@dataclass(frozen=True)
+class ViewCall:
+    contract: object
+    method: str
+    args: tuple = ()
+
+    def encode(self):
+        return getattr(self.contract, self.method).encode_input(*self.args)
+
+    def decode(self, data):
+        return getattr(self.contract, self.method).decode_output(data)
+
+
+@dataclass(frozen=True)
+class HolderStatus:
+    holder: str
+    balance: int
+    paid: bool
+    maturity_paid: bool
+
+
+@dataclass(frozen=True)
+class ExerciseStatus:
+    holder: str
+    exercised: bool
+
+
+@dataclass(frozen=True)
+class DeliveryStatus:
+    sender: str
+    receiver: str
+    delivered: bool
+
+
+def deploy_multicall(account):
+    return Multicall3.deploy({"from": account})
+
+
+def read_all(multicall, calls, batch_size=DEFAULT_BATCH_SIZE):
+    # A reverted call decodes to None instead of failing the whole batch
+    results = []
+    for i in range(0, len(calls), batch_size):
+        batch = calls[i : i + batch_size]
+        returned = multicall.aggregate3.call(
+            [(call.contract.address, True, call.encode()) for call in batch]
+        )
+        results += [
+            call.decode(data) if success else None
+            for call, (success, data) in zip(batch, returned)
+        ]
+    return results
+
+
+def holder_statuses(
+    multicall, token, holders, payment_period=None, batch_size=DEFAULT_BATCH_SIZE
+):
+    if payment_period is None:
+        payment_period = current_payment_period(token)
+    calls = []
+    for holder in holders:
+        calls += [
+            ViewCall(token, "getBalance", (holder,)),
+            ViewCall(
+                token, "investorToPaymentPeriodToStatus", (holder, payment_period)
+            ),
+            ViewCall(token, "investorToMaturityPaymentStatus", (holder,)),
+        ]
+    results = read_all(multicall, calls, batch_size)
+    return [
+        HolderStatus(holder, *results[3 * i : 3 * i + 3])
+        for i, holder in enumerate(holders)
+    ]
+
+
+def exercise_statuses(multicall, option, holders, batch_size=DEFAULT_BATCH_SIZE):
+    calls = [ViewCall(option, "investorToExerciseStatus", (h,)) for h in holders]
+    return [
+        ExerciseStatus(holder, exercised)
+        for holder, exercised in zip(holders, read_all(multicall, calls, batch_size))
+    ]
+
+
+def delivery_statuses(multicall, option, pairs, batch_size=DEFAULT_BATCH_SIZE):
+    calls = [
+        ViewCall(option, "senderToReceiverToDeliveryStatus", (sender, receiver))
+        for sender, receiver in pairs
+    ]
+    return [
+        DeliveryStatus(sender, receiver, delivered)
+        for (sender, receiver), delivered in zip(
+            pairs, read_all(multicall, calls, batch_size)
+        )
+    ]
+
+
+def main():
+    account = get_account()
+    token = Token.at(os.environ["TOKEN_ADDRESS"])
+    if os.getenv("MULTICALL_ADDRESS"):
+        multicall = Multicall3.at(os.environ["MULTICALL_ADDRESS"])
+    else:
+        multicall = deploy_multicall(account)
+    batch_size = int(os.getenv("BATCH_SIZE", DEFAULT_BATCH_SIZE))
+    start = time.time()
+    holders = token.getTokenHolders()
+    statuses = holder_statuses(multicall, token, holders, batch_size=batch_size)
+    elapsed = time.time() - start
+    paid = len([status for status in statuses if status.paid])
+    print(
+        "Read {} holders in {:.1f}s: {} paid for the current payment period".format(
+            len(statuses), elapsed, paid
+        )
+    )
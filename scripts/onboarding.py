@@ -0,0 +1,265 @@
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from scripts.helpfulscripts import get_account
+from brownie import Identity, IdentityFactory, IdentityRegistry, config, web3
+from eth_abi import encode_abi
+from eth_account import Account
+from eth_account.messages import encode_defunct
+from web3 import Web3
+
+# Usage: INVESTORS_CSV=investors.csv IDENTITY_REGISTRY_ADDRESS=0x... CLAIM_ISSUER_ADDRESS=0x...
+#        [IDENTITY_FACTORY_ADDRESS=0x...] brownie run scripts/onboarding.py
+# The CSV has an `address` column and an optional `country` column (ISO 3166-1 numeric code)
+DEFAULT_CHECKPOINT = "onboarding_checkpoint.json"
+DEFAULT_CLAIM_TOPIC = 1947
+DEFAULT_COUNTRY = 586
+DEFAULT_BATCH_SIZE = 100
+CLAIM_DATA = "CFI code test"
+CLAIM_URI = "Placeholder URI"
+# ECDSA claim scheme
+CLAIM_SCHEME = 1
+MANAGEMENT_PURPOSE = 1
+ECDSA_KEY_TYPE = 1
+
+
+def read_investors(csv_path):
+    with open(csv_path, newline="") as f:
+        return [
+            {
+                "address": Web3.toChecksumAddress(row["address"].strip()),
+                "country": int(row.get("country") or DEFAULT_COUNTRY),
+            }
+            for row in csv.DictReader(f)
+        ]
+
+
+def load_checkpoint(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_checkpoint(path, state):
+    # Written through a temporary file so an interrupted run never leaves a torn checkpoint
+    with open(path + ".tmp", "w") as f:
+        json.dump(state, f, indent=2)
+    os.replace(path + ".tmp", path)
+
+
+def sign_claim(job):
+    # Runs in a worker process, so it only receives plain values
+    identity_address, topic, data, private_key = job
+    encoded_message = encode_abi(
+        ["address", "uint256", "bytes"], [identity_address, topic, data]
+    )
+    hashed_message = Web3.keccak(encoded_message)
+    message = encode_defunct(hexstr=str(hashed_message.hex()))
+    return Account.sign_message(message, private_key).signature.hex()
+
+
+def deploy_identity_factory(account):
+    implementation = Identity.deploy(account, True, {"from": account})
+    return IdentityFactory.deploy(implementation, {"from": account})
+
+
+def identity_salt(address):
+    return Web3.keccak(encode_abi(["address"], [address]))
+
+
+def predict_identities(investors, state, operator, factory, checkpoint_path):
+    # Clone addresses are deterministic, so claims can be signed before any deployment.
+    # The operator is the initial management key so it can add the claims. Once the claim is
+    # stored the investor is added as a management key and the operator key is removed
+    for investor in investors:
+        entry = state.setdefault(investor["address"], {})
+        if "identity" not in entry:
+            entry["identity"] = factory.predictIdentity(
+                operator, identity_salt(investor["address"])
+            )
+    save_checkpoint(checkpoint_path, state)
+
+
+def deploy_identities(investors, state, operator, factory, batch_size, checkpoint_path):
+    pending = [
+        investor["address"]
+        for investor in investors
+        if not state[investor["address"]].get("deployed")
+        # A batch confirmed right before a crash is not replayed
+        and len(web3.eth.get_code(state[investor["address"]]["identity"])) == 0
+    ]
+    for i in range(0, len(pending), batch_size):
+        batch = pending[i : i + batch_size]
+        tx = factory.createIdentities(
+            [operator] * len(batch),
+            [identity_salt(address) for address in batch],
+            {"from": operator},
+        )
+        tx.wait(1)
+    for investor in investors:
+        state[investor["address"]]["deployed"] = True
+    save_checkpoint(checkpoint_path, state)
+
+
+def sign_claims(investors, state, private_key, topic, workers, checkpoint_path):
+    data = Web3.toBytes(text=CLAIM_DATA)
+    pending = [
+        investor["address"]
+        for investor in investors
+        if "signature" not in state[investor["address"]]
+    ]
+    jobs = [
+        (state[address]["identity"], topic, data, private_key) for address in pending
+    ]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        signatures = list(executor.map(sign_claim, jobs, chunksize=32))
+    for address, signature in zip(pending, signatures):
+        state[address]["signature"] = signature
+    save_checkpoint(checkpoint_path, state)
+
+
+def management_key(address):
+    return Web3.keccak(encode_abi(["address"], [address]))
+
+
+def add_claims(
+    investors,
+    state,
+    operator,
+    identity_registry,
+    claim_issuer,
+    topic,
+    checkpoint_path,
+):
+    data = Web3.toBytes(text=CLAIM_DATA)
+    operator_key = management_key(operator.address)
+    for investor in investors:
+        entry = state[investor["address"]]
+        if entry.get("claim_added"):
+            continue
+        identity = Identity.at(entry["identity"])
+        investor_key = management_key(investor["address"])
+        # Without the operator key the identity was handed over before the checkpoint was saved
+        if identity.keyHasPurpose(operator_key, MANAGEMENT_PURPOSE):
+            # Later claim updates drop the verification status cached by the registry
+            identity.bindVerificationCache(
+                identity_registry, investor["address"], {"from": operator}
+            )
+            identity.addClaim(
+                topic,
+                CLAIM_SCHEME,
+                claim_issuer,
+                entry["signature"],
+                data,
+                CLAIM_URI,
+                {"from": operator},
+            )
+            if not identity.keyHasPurpose(investor_key, MANAGEMENT_PURPOSE):
+                identity.addKey(
+                    investor_key, MANAGEMENT_PURPOSE, ECDSA_KEY_TYPE, {"from": operator}
+                )
+            # The investor alone manages its identity from here on
+            if investor_key != operator_key:
+                identity.removeKey(operator_key, MANAGEMENT_PURPOSE, {"from": operator})
+        entry["claim_added"] = True
+        save_checkpoint(checkpoint_path, state)
+
+
+def register_identities(
+    investors, state, operator, identity_registry, batch_size, checkpoint_path
+):
+    pending = [
+        investor
+        for investor in investors
+        if not state[investor["address"]].get("registered")
+    ]
+    for i in range(0, len(pending), batch_size):
+        batch = [
+            investor
+            for investor in pending[i : i + batch_size]
+            # A batch confirmed right before a crash is not replayed
+            if not identity_registry.contains(investor["address"])
+        ]
+        if batch:
+            tx = identity_registry.batchRegisterIdentity(
+                [investor["address"] for investor in batch],
+                [state[investor["address"]]["identity"] for investor in batch],
+                [investor["country"] for investor in batch],
+                {"from": operator},
+            )
+            tx.wait(1)
+        for investor in pending[i : i + batch_size]:
+            state[investor["address"]]["registered"] = True
+        save_checkpoint(checkpoint_path, state)
+
+
+def onboard(
+    investors,
+    operator,
+    identity_registry,
+    factory,
+    claim_issuer,
+    private_key,
+    checkpoint_path=DEFAULT_CHECKPOINT,
+    topic=DEFAULT_CLAIM_TOPIC,
+    batch_size=DEFAULT_BATCH_SIZE,
+    workers=None,
+):
+    state = load_checkpoint(checkpoint_path)
+    start = time.time()
+    remaining = len(
+        [i for i in investors if not state.get(i["address"], {}).get("registered")]
+    )
+    predict_identities(investors, state, operator, factory, checkpoint_path)
+    sign_claims(investors, state, private_key, topic, workers, checkpoint_path)
+    deploy_identities(investors, state, operator, factory, batch_size, checkpoint_path)
+    add_claims(
+        investors,
+        state,
+        operator,
+        identity_registry,
+        claim_issuer,
+        topic,
+        checkpoint_path,
+    )
+    register_identities(
+        investors, state, operator, identity_registry, batch_size, checkpoint_path
+    )
+    elapsed = time.time() - start
+    throughput = remaining / (elapsed / 60) if elapsed > 0 else 0
+    print(
+        "Onboarded {} investors in {:.1f}s ({:.1f} investors per minute)".format(
+            remaining, elapsed, throughput
+        )
+    )
+    return {
+        "investors": remaining,
+        "seconds": elapsed,
+        "investors_per_minute": throughput,
+    }
+
+
+def main():
+    operator = get_account()
+    investors = read_investors(os.environ["INVESTORS_CSV"])
+    identity_registry = IdentityRegistry.at(os.environ["IDENTITY_REGISTRY_ADDRESS"])
+    workers = os.getenv("WORKERS")
+    if os.getenv("IDENTITY_FACTORY_ADDRESS"):
+        factory = IdentityFactory.at(os.environ["IDENTITY_FACTORY_ADDRESS"])
+    else:
+        factory = deploy_identity_factory(operator)
+    onboard(
+        investors,
+        operator,
+        identity_registry,
+        factory,
+        os.environ["CLAIM_ISSUER_ADDRESS"],
+        config["wallets"]["from_key"],
+        checkpoint_path=os.getenv("CHECKPOINT", DEFAULT_CHECKPOINT),
+        topic=int(os.getenv("CLAIM_TOPIC", DEFAULT_CLAIM_TOPIC)),
+        batch_size=int(os.getenv("BATCH_SIZE", DEFAULT_BATCH_SIZE)),
+        workers=int(workers) if workers else None,
+    )
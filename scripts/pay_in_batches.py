@@ -0,0 +1,159 @@
+import os
+from scripts.helpfulscripts import get_account
+from brownie import Asset, Token, Debts, web3
+
+# Seconds per payment period, indexed by the PaymentFrequency enum of Token and Debts
+PAYMENT_FREQUENCY_TO_SECONDS = [0, 86400, 604800, 1209600, 2629800, 31556952]
+DEFAULT_BATCH_SIZE = 100
+
+
+def current_payment_period(token):
+    seconds = PAYMENT_FREQUENCY_TO_SECONDS[token.paymentFrequency()]
+    timestamp = web3.eth.get_block("latest").timestamp
+    return (timestamp - token.contractDeploymentTime()) // seconds
+
+
+def report(label, batches):
+    total_gas = sum(gas for (_, _, gas) in batches)
+    for start, processed, gas in batches:
+        print(
+            "{}: holders {}-{} ({} processed) used {} gas".format(
+                label, start, start + processed - 1, processed, gas
+            )
+        )
+    print(
+        "{}: {} batches, {} gas in total".format(label, len(batches), total_gas)
+    )
+    return batches
+
+
+def unpaid_ranges(token, is_paid, batch_size):
+    # Asset removes a holder by moving the last holder into its slot, which can be below the cursor.
+    # Returns the start of every range that still holds a holder for which is_paid is false
+    asset = Asset.at(token.getAddress())
+    starts = []
+    for start in range(0, token.getTokenHolderCount(), batch_size):
+        holders = asset.getTokenHoldersInRange(start, batch_size)
+        if not all(is_paid(holder) for holder in holders):
+            starts.append(start)
+    return starts
+
+
+def drain(token, pay, account, batch_size, read_cursor, is_paid, *args):
+    # The holder count is read again after every batch, holders can exit while payouts are drained
+    batches = []
+    cursor = read_cursor()
+    while cursor < token.getTokenHolderCount():
+        tx = pay(*args, cursor, batch_size, {"from": account})
+        tx.wait(1)
+        next_cursor = read_cursor()
+        if next_cursor <= cursor:
+            break
+        batches.append((cursor, next_cursor - cursor, tx.gas_used))
+        cursor = next_cursor
+    # Ranges with a holder that was moved below the cursor are paid again, paid holders are skipped
+    for start in unpaid_ranges(token, is_paid, batch_size):
+        tx = pay(*args, start, batch_size, {"from": account})
+        tx.wait(1)
+        processed = min(batch_size, token.getTokenHolderCount() - start)
+        batches.append((start, processed, tx.gas_used))
+    return batches
+
+
+def drain_payment_period(token, pay, account, batch_size=DEFAULT_BATCH_SIZE, *args):
+    # Resumes from the persisted cursor of the current payment period, so a run that
+    # was interrupted picks up where the last confirmed batch ended
+    period = current_payment_period(token)
+    batches = drain(
+        token,
+        pay,
+        account,
+        batch_size,
+        lambda: token.paymentPeriodToCursor(period),
+        lambda holder: token.investorToPaymentPeriodToStatus(holder, period),
+        *args,
+    )
+    return report("Payment period {}".format(period), batches)
+
+
+def pay_interest_in_batches(token, account, batch_size=DEFAULT_BATCH_SIZE):
+    return drain_payment_period(token, token.payInterestToRange, account, batch_size)
+
+
+def pay_interest_in_kind_in_batches(
+    token, account, token_address, token_amount, batch_size=DEFAULT_BATCH_SIZE
+):
+    return drain_payment_period(
+        token,
+        token.payInterestInPaymentInKindToRange,
+        account,
+        batch_size,
+        token_address,
+        token_amount,
+    )
+
+
+def pay_amortized_payments_in_batches(token, account, batch_size=DEFAULT_BATCH_SIZE):
+    return drain_payment_period(
+        token, token.payAmortizedPaymentsToRange, account, batch_size
+    )
+
+
+def drain_maturity(token, pay, account, batch_size=DEFAULT_BATCH_SIZE):
+    batches = drain(
+        token,
+        pay,
+        account,
+        batch_size,
+        token.maturityPaymentCursor,
+        token.investorToMaturityPaymentStatus,
+    )
+    return report("Maturity", batches)
+
+
+def pay_at_maturity_in_batches(token, account, batch_size=DEFAULT_BATCH_SIZE):
+    return drain_maturity(token, token.payAtMaturityToRange, account, batch_size)
+
+
+def call_token_in_batches(token, account, amount, batch_size=DEFAULT_BATCH_SIZE):
+    # Called token holders are burnt and removed, so the holder count is the cursor
+    batches = []
+    holder_count = token.getTokenHolderCount()
+    while holder_count > 0:
+        tx = token.callTokenFromRange(amount, batch_size, {"from": account})
+        tx.wait(1)
+        remaining = token.getTokenHolderCount()
+        if remaining >= holder_count:
+            break
+        batches.append((remaining, holder_count - remaining, tx.gas_used))
+        holder_count = remaining
+    return report("Call", batches)
+
+
+def main():
+    # Usage: TOKEN_ADDRESS=0x... PAYOUT=interest brownie run scripts/pay_in_batches.py
+    account = get_account()
+    instrument = Debts if os.getenv("INSTRUMENT", "Token") == "Debts" else Token
+    token = instrument.at(os.environ["TOKEN_ADDRESS"])
+    payout = os.getenv("PAYOUT", "interest")
+    batch_size = int(os.getenv("BATCH_SIZE", DEFAULT_BATCH_SIZE))
+    if payout == "interest":
+        pay_interest_in_batches(token, account, batch_size)
+    elif payout == "payment_in_kind":
+        pay_interest_in_kind_in_batches(
+            token,
+            account,
+            os.environ["PAYMENT_IN_KIND_TOKEN"],
+            int(os.environ["PAYMENT_IN_KIND_AMOUNT"]),
+            batch_size,
+        )
+    elif payout == "amortized":
+        pay_amortized_payments_in_batches(token, account, batch_size)
+    elif payout == "maturity":
+        pay_at_maturity_in_batches(token, account, batch_size)
+    elif payout == "call":
+        call_token_in_batches(
+            token, account, int(os.getenv("CALL_AMOUNT", 0)), batch_size
+        )
+    else:
+        raise ValueError("Unknown payout type: {}".format(payout))
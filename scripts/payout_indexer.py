@@ -0,0 +1,173 @@
+import os
+import sqlite3
+from brownie import web3
+from eth_abi import decode_abi
+from web3 import Web3
+
+# Usage: PAYOUT_CONTRACTS=0x...,0x... brownie run scripts/payout_indexer.py
+# PAYOUT_DB            SQLite database the payouts are stored in (default payouts.db)
+# START_BLOCK          first block indexed for contracts without a checkpoint (default 0)
+# BLOCK_RANGE          number of blocks requested per eth_getLogs call (default 2000)
+# CONFIRMATIONS        blocks behind the head that are left unindexed (default 0)
+DEFAULT_DB = "payouts.db"
+DEFAULT_BLOCK_RANGE = 2000
+# Every payout event shares the (investor, paymentPeriod, amount, paymentToken) layout
+PAYOUT_EVENTS = [
+    "InterestPaid",
+    "IncomePaid",
+    "MaturityPaymentPaid",
+    "AmortizedPaymentPaid",
+    "TokenCalled",
+    "TokenPut",
+]
+EVENT_TOPICS = {
+    Web3.toHex(
+        Web3.keccak(text="{}(address,uint256,uint256,address)".format(name))
+    ): name
+    for name in PAYOUT_EVENTS
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS payouts (
+    contract TEXT NOT NULL,
+    event TEXT NOT NULL,
+    investor TEXT NOT NULL,
+    payment_period INTEGER NOT NULL,
+    amount TEXT NOT NULL,
+    payment_token TEXT NOT NULL,
+    block_number INTEGER NOT NULL,
+    transaction_hash TEXT NOT NULL,
+    log_index INTEGER NOT NULL,
+    PRIMARY KEY (transaction_hash, log_index)
+);
+CREATE INDEX IF NOT EXISTS payouts_by_contract
+    ON payouts (contract, block_number, log_index);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    contract TEXT PRIMARY KEY,
+    last_block INTEGER NOT NULL
+);
+"""
+
+
+def connect(db_path):
+    connection = sqlite3.connect(db_path)
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def load_checkpoint(connection, contract):
+    row = connection.execute(
+        "SELECT last_block FROM checkpoints WHERE contract = ?", (contract,)
+    ).fetchone()
+    return row[0] if row else None
+
+
+def decode_payout(log):
+    # Amounts are stored as decimal strings, SQLite integers stop at 64 bits
+    (amount,) = decode_abi(["uint256"], bytes(log["data"]))
+    (investor,) = decode_abi(["address"], bytes(log["topics"][1]))
+    (payment_period,) = decode_abi(["uint256"], bytes(log["topics"][2]))
+    (payment_token,) = decode_abi(["address"], bytes(log["topics"][3]))
+    return (
+        Web3.toChecksumAddress(log["address"]),
+        EVENT_TOPICS[Web3.toHex(log["topics"][0])],
+        Web3.toChecksumAddress(investor),
+        payment_period,
+        str(amount),
+        Web3.toChecksumAddress(payment_token),
+        log["blockNumber"],
+        Web3.toHex(log["transactionHash"]),
+        log["logIndex"],
+    )
+
+
+def index_contract(
+    connection,
+    contract,
+    start_block=0,
+    to_block=None,
+    block_range=DEFAULT_BLOCK_RANGE,
+    confirmations=0,
+):
+    contract = Web3.toChecksumAddress(contract)
+    if to_block is None:
+        to_block = web3.eth.block_number - confirmations
+    last_block = load_checkpoint(connection, contract)
+    from_block = start_block if last_block is None else last_block + 1
+    indexed = 0
+    while from_block <= to_block:
+        range_end = min(from_block + block_range - 1, to_block)
+        logs = web3.eth.get_logs(
+            {
+                "address": contract,
+                "fromBlock": from_block,
+                "toBlock": range_end,
+                "topics": [list(EVENT_TOPICS)],
+            }
+        )
+        # The payouts of a range and its checkpoint are committed together, so an interrupted
+        # run resumes from the last complete range without duplicating or skipping payouts
+        with connection:
+            connection.executemany(
+                "INSERT OR IGNORE INTO payouts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [decode_payout(log) for log in logs],
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?)",
+                (contract, range_end),
+            )
+        indexed += len(logs)
+        from_block = range_end + 1
+    return indexed
+
+
+def index_payouts(
+    db_path,
+    contracts,
+    start_block=0,
+    to_block=None,
+    block_range=DEFAULT_BLOCK_RANGE,
+    confirmations=0,
+):
+    connection = connect(db_path)
+    try:
+        if to_block is None:
+            to_block = web3.eth.block_number - confirmations
+        return {
+            contract: index_contract(
+                connection, contract, start_block, to_block, block_range
+            )
+            for contract in contracts
+        }
+    finally:
+        connection.close()
+
+
+def load_payouts(db_path, contract):
+    connection = connect(db_path)
+    connection.row_factory = sqlite3.Row
+    try:
+        rows = connection.execute(
+            "SELECT * FROM payouts WHERE contract = ? ORDER BY block_number, log_index",
+            (Web3.toChecksumAddress(contract),),
+        ).fetchall()
+    finally:
+        connection.close()
+    return [dict(row, amount=int(row["amount"])) for row in rows]
+
+
+def main():
+    contracts = [
+        contract.strip()
+        for contract in os.environ["PAYOUT_CONTRACTS"].split(",")
+        if contract.strip()
+    ]
+    indexed = index_payouts(
+        os.getenv("PAYOUT_DB", DEFAULT_DB),
+        contracts,
+        start_block=int(os.getenv("START_BLOCK", 0)),
+        block_range=int(os.getenv("BLOCK_RANGE", DEFAULT_BLOCK_RANGE)),
+        confirmations=int(os.getenv("CONFIRMATIONS", 0)),
+    )
+    for contract, count in indexed.items():
+        print("Indexed {} payouts of {}".format(count, contract))
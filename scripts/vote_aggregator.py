@@ -0,0 +1,196 @@
+import os
+import json
+from concurrent.futures import ProcessPoolExecutor
+from eth_account import Account
+from eth_account.messages import encode_structured_data
+from scripts.helpfulscripts import get_account
+from brownie import Voting, chain
+from brownie.exceptions import VirtualMachineError
+
+# Usage: VOTING_ADDRESS=0x... VOTES_FILE=votes.json brownie run scripts/vote_aggregator.py
+# VOTES_FILE holds a list of {"ballot", "option", "voter", "nonce", "signature"} objects collected from the
+# voters, the signature being the hex encoded EIP-712 signature of the vote. The account submitting the
+# batches pays the gas of every vote
+# EIP-712 domain of Voting and PayingEquity
+DOMAIN_NAME = "GenericTokenization"
+DOMAIN_VERSION = "1"
+VOTE_TYPES = {
+    "EIP712Domain": [
+        {"name": "name", "type": "string"},
+        {"name": "version", "type": "string"},
+        {"name": "chainId", "type": "uint256"},
+        {"name": "verifyingContract", "type": "address"},
+    ],
+    "Vote": [
+        {"name": "ballot", "type": "uint256"},
+        {"name": "option", "type": "uint256"},
+        {"name": "voter", "type": "address"},
+        {"name": "nonce", "type": "uint256"},
+    ],
+}
+# Votes checked by one worker task and submitted in one castVotesBySig transaction
+DEFAULT_CHUNK_SIZE = 250
+DEFAULT_BATCH_SIZE = 200
+# Enum value of Vote_State
+VOTING_STARTED = 1
+
+
+def typed_vote(vote, verifying_contract, chain_id):
+    return {
+        "types": VOTE_TYPES,
+        "primaryType": "Vote",
+        "domain": {
+            "name": DOMAIN_NAME,
+            "version": DOMAIN_VERSION,
+            "chainId": chain_id,
+            "verifyingContract": verifying_contract,
+        },
+        "message": {
+            "ballot": vote["ballot"],
+            "option": vote["option"],
+            "voter": vote["voter"],
+            "nonce": vote["nonce"],
+        },
+    }
+
+
+def sign_vote(private_key, vote, verifying_contract, chain_id):
+    # Signs the vote on behalf of the voter and returns it with its hex encoded signature
+    message = encode_structured_data(
+        primitive=typed_vote(vote, verifying_contract, chain_id)
+    )
+    signature = Account.sign_message(message, private_key).signature
+    return dict(vote, signature=signature.hex())
+
+
+def vote_tuple(vote):
+    # The vote as the SignedVote tuple expected by castVotesBySig
+    return (
+        vote["ballot"],
+        vote["option"],
+        vote["voter"],
+        vote["nonce"],
+        bytes.fromhex(vote["signature"].replace("0x", "")),
+    )
+
+
+def signed_by_voter(vote, verifying_contract, chain_id):
+    message = encode_structured_data(
+        primitive=typed_vote(vote, verifying_contract, chain_id)
+    )
+    try:
+        signer = Account.recover_message(message, signature=vote["signature"])
+    except Exception:
+        return False
+    return signer.lower() == vote["voter"].lower()
+
+
+def check_chunk(votes, verifying_contract, chain_id):
+    return [signed_by_voter(vote, verifying_contract, chain_id) for vote in votes]
+
+
+def check_signatures(
+    votes, verifying_contract, chain_id, workers=None, chunk_size=DEFAULT_CHUNK_SIZE
+):
+    # Recovers the signers in worker processes, recovery is CPU bound
+    chunks = [votes[i : i + chunk_size] for i in range(0, len(votes), chunk_size)]
+    if workers == 1 or len(chunks) <= 1:
+        return check_chunk(votes, verifying_contract, chain_id)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        checked = executor.map(
+            check_chunk,
+            chunks,
+            [verifying_contract] * len(chunks),
+            [chain_id] * len(chunks),
+        )
+        return [valid for chunk in checked for valid in chunk]
+
+
+def dedupe(votes):
+    # A voter has one vote per ballot and one vote per nonce, the first one collected is kept
+    seen = set()
+    unique = []
+    for vote in votes:
+        voter = vote["voter"].lower()
+        keys = {("ballot", voter, vote["ballot"]), ("nonce", voter, vote["nonce"])}
+        if keys & seen:
+            continue
+        seen |= keys
+        unique.append(vote)
+    return unique
+
+
+def option_exists(voting, ballot, option):
+    # options is a public array getter, which reverts past the last option of the ballot
+    try:
+        voting.options(ballot, option)
+    except (VirtualMachineError, ValueError):
+        return False
+    return True
+
+
+def aggregate(voting, votes, chain_id, workers=None):
+    # Returns the votes castVotesBySig would accept, in an order it accepts them. Votes with a bad
+    # signature, a used nonce or a gap in the nonces of their voter, an option missing from the ballot, or
+    # that the ballot rejects are dropped, since any of them would revert the whole batch
+    # Signatures are checked first, so that a forged copy cannot displace the vote of a voter
+    valid = check_signatures(votes, voting.address, chain_id, workers)
+    votes = dedupe([vote for vote, ok in zip(votes, valid) if ok])
+    ballots = {}
+    options = {}
+    by_voter = {}
+    for vote in sorted(votes, key=lambda vote: vote["nonce"]):
+        by_voter.setdefault(vote["voter"].lower(), []).append(vote)
+    accepted = []
+    for voter_votes in by_voter.values():
+        voter = voter_votes[0]["voter"]
+        nonce = voting.nonces(voter)
+        for vote in voter_votes:
+            ballot = vote["ballot"]
+            if ballot not in ballots:
+                ballots[ballot] = voting.ballots(ballot)[3] == VOTING_STARTED
+            option = (ballot, vote["option"])
+            if option not in options:
+                options[option] = option_exists(voting, *option)
+            if vote["nonce"] != nonce:
+                # Later nonces of this voter cannot be used before the missing one
+                break
+            if (
+                not ballots[ballot]
+                or not options[option]
+                or voting.voted(voter, ballot)
+                or voting.voteWeight(ballot, voter) == 0
+            ):
+                break
+            accepted.append(vote)
+            nonce += 1
+    # Sorting by nonce keeps the votes of every voter in nonce order across batches
+    return sorted(accepted, key=lambda vote: vote["nonce"])
+
+
+def submit_votes(voting, account, votes, batch_size=DEFAULT_BATCH_SIZE):
+    transactions = []
+    for i in range(0, len(votes), batch_size):
+        batch = [vote_tuple(vote) for vote in votes[i : i + batch_size]]
+        tx = voting.castVotesBySig(batch, {"from": account})
+        tx.wait(1)
+        transactions.append(tx)
+        print("Votes {}-{} tallied, {} gas".format(i, i + len(batch) - 1, tx.gas_used))
+    return transactions
+
+
+def main():
+    account = get_account()
+    voting = Voting.at(os.environ["VOTING_ADDRESS"])
+    with open(os.environ["VOTES_FILE"]) as votes_file:
+        votes = json.load(votes_file)
+    accepted = aggregate(
+        voting,
+        votes,
+        chain.id,
+        workers=int(os.getenv("WORKERS", os.cpu_count() or 1)),
+    )
+    print("{} of {} votes accepted".format(len(accepted), len(votes)))
+    submit_votes(
+        voting, account, accepted, int(os.getenv("BATCH_SIZE", DEFAULT_BATCH_SIZE))
+    )
@@ -0,0 +1,62 @@
+import os
+import pytest
+from brownie import accounts, config, network
+from scripts.helpfulscripts import (
+    get_account,
+    LOCAL_BLOCKCHAIN_ENVIRONMENTS,
+    FORKED_LOCAL_ENVIRONMENTS,
+)
+from scripts.deploy import deploy
+
+
+@pytest.fixture(scope="session", autouse=True)
+def worker_chain():
+    # Under `brownie test -n <workers>` Brownie launches one local chain per xdist
+    # worker, offsetting the RPC port by the worker id, so deployments, accounts and
+    # chain.sleep stay isolated. A shared live network would break that isolation.
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    if worker and (
+        network.show_active()
+        not in LOCAL_BLOCKCHAIN_ENVIRONMENTS + FORKED_LOCAL_ENVIRONMENTS
+    ):
+        pytest.exit(
+            "Parallel test runs require a local network, {} is not one".format(
+                network.show_active()
+            )
+        )
+    return worker
+
+
+@pytest.fixture(scope="module")
+def deployment(module_isolation, worker_chain):
+    # Deploys the KYC world (registries, identities, claims) and the payment token once
+    # per test module. module_isolation resets the chain when a module starts and ends,
+    # so the deployment has to come after it; it then runs before fn_isolation takes the
+    # snapshot every test of the module is reverted to
+    return deploy()
+
+
+@pytest.fixture(autouse=True)
+def isolation(fn_isolation):
+    # Every test is reverted to the snapshot taken after the deployment of its module
+    pass
+
+
+@pytest.fixture(scope="module")
+def payment_token(deployment):
+    return deployment[0]
+
+
+@pytest.fixture(scope="module")
+def identity_registry(deployment):
+    return deployment[1]
+
+
+@pytest.fixture(scope="module")
+def verified_accounts(deployment):
+    # Accounts with a registered identity holding a valid KYC claim (topic 1947)
+    return [
+        get_account(),
+        accounts.add(config["wallets"]["from_key"]),
+        get_account(2),
+    ]
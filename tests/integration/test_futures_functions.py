@@ -1,5 +1,4 @@
 from scripts.helpfulscripts import get_account
-from scripts.deploy import deploy
 from brownie import (
     Parameters,
     FUTURES,
@@ -18,12 +17,12 @@ from eth_account import Account
 from web3 import Web3
 
 
-def test_can_physically_deliver_future():
+def test_can_physically_deliver_future(deployment):
     # Arrange
     account = get_account()
     account1 = accounts.add(config["wallets"]["from_key"])
     account2 = get_account(2)
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     token_name = "Test"
     token_symbol = "Test"
     initial_supply = 1000
@@ -112,12 +111,12 @@ def test_can_physically_deliver_future():
     # ---------------------------------------------
 
 
-def test_can_physically_deliver_tokenized_assets_for_future():
+def test_can_physically_deliver_tokenized_assets_for_future(deployment):
     # Arrange
     account = get_account()
     account1 = accounts.add(config["wallets"]["from_key"])
     account2 = get_account(2)
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     token_name = "Test"
     token_symbol = "Test"
     initial_supply = 1000
@@ -188,12 +187,12 @@ def test_can_physically_deliver_tokenized_assets_for_future():
     # ---------------------------------------------
 
 
-def test_can_cash_deliver_future():
+def test_can_cash_deliver_future(deployment):
     # Arrange
     account = get_account()
     account1 = accounts.add(config["wallets"]["from_key"])
     account2 = get_account(2)
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     token_name = "Test"
     token_symbol = "Test"
     initial_supply = 1000
@@ -262,11 +261,11 @@ def test_can_cash_deliver_future():
     # ---------------------------------------------
 
 
-def test_can_modify_strke_price():
+def test_can_modify_strke_price(deployment):
     account = get_account()
     account1 = accounts.add(config["wallets"]["from_key"])
     account2 = get_account(2)
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     token_name = "Test"
     token_symbol = "Test"
     initial_supply = 1000
@@ -1,5 +1,4 @@
 from scripts.helpfulscripts import get_account
-from scripts.deploy import deploy
 from brownie import (
     Parameters,
     OPTIONS,
@@ -18,12 +17,12 @@ from eth_account import Account
 from web3 import Web3
 
 
-def test_can_physically_deliver_call_option():
+def test_can_physically_deliver_call_option(deployment):
     # Arrange
     account = get_account()
     account1 = accounts.add(config["wallets"]["from_key"])
     account2 = get_account(2)
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     token_name = "Test"
     token_symbol = "Test"
     initial_supply = 1000
@@ -116,13 +115,13 @@ def test_can_physically_deliver_call_option():
     # ---------------------------------------------
 
 
-def test_can_physically_deliver_put_option():
+def test_can_physically_deliver_put_option(deployment):
     # Arrange
     account = get_account()
     account1 = accounts.add(config["wallets"]["from_key"])
     account2 = get_account(2)
     account3 = get_account(3)
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     token_name = "Test"
     token_symbol = "Test"
     initial_supply = 1000
@@ -209,13 +208,13 @@ def test_can_physically_deliver_put_option():
     # ---------------------------------------------
 
 
-def test_can_physically_deliver_tokenized_assets_for_call_option():
+def test_can_physically_deliver_tokenized_assets_for_call_option(deployment):
     # Arrange
     account = get_account()
     account1 = accounts.add(config["wallets"]["from_key"])
     account2 = get_account(2)
     account3 = get_account(3)
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     token_name = "Test"
     token_symbol = "Test"
     initial_supply = 1000
@@ -291,13 +290,13 @@ def test_can_physically_deliver_tokenized_assets_for_call_option():
     # ---------------------------------------------
 
 
-def test_can_physically_deliver_tokenized_assets_for_put_option():
+def test_can_physically_deliver_tokenized_assets_for_put_option(deployment):
     # Arrange
     account = get_account()
     account1 = accounts.add(config["wallets"]["from_key"])
     account2 = get_account(2)
     account3 = get_account(3)
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     token_name = "Test"
     token_symbol = "Test"
     initial_supply = 1000
@@ -368,13 +367,13 @@ def test_can_physically_deliver_tokenized_assets_for_put_option():
     # ---------------------------------------------
 
 
-def test_can_cash_deliver_call_option():
+def test_can_cash_deliver_call_option(deployment):
     # Arrange
     account = get_account()
     account1 = accounts.add(config["wallets"]["from_key"])
     account2 = get_account(2)
     account3 = get_account(3)
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     token_name = "Test"
     token_symbol = "Test"
     initial_supply = 1000
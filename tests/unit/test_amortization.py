@@ -0,0 +1,57 @@
+from scripts.helpfulscripts import get_account
+from scripts.amortization import (
+    amortization_schedule,
+    apply_schedule,
+    contract_terms,
+    scalar_schedule,
+)
+from brownie import Token, chain
+
+
+def test_schedule_matches_scalar_loop():
+    # Arrange
+    face_value = [100, 1000, 250000]
+    periodic_rate, loan_term = contract_terms(
+        [10, 5, 12], [4, 2, 4], [5 * 31556952, 31556952, 10 * 31556952]
+    )
+    # Act
+    schedule = amortization_schedule(face_value, periodic_rate, loan_term)
+    # Assert
+    for i in range(len(face_value)):
+        numerator, denominator, periodic_payment, rows = scalar_schedule(
+            face_value[i], int(periodic_rate[i]), int(loan_term[i])
+        )
+        assert schedule["numerator"][i] == numerator
+        assert schedule["denominator"][i] == denominator
+        assert schedule["periodic_payment"][i] == periodic_payment
+        for period, (payment, interest, principal, outstanding) in enumerate(rows):
+            assert schedule["payment"][i, period] == payment
+            assert schedule["interest"][i, period] == interest
+            assert schedule["principal"][i, period] == principal
+            assert schedule["outstanding"][i, period] == outstanding
+        assert not schedule["payment"][i, len(rows) :].any()
+
+
+def test_can_apply_schedule(payment_token, identity_registry):
+    # Arrange
+    account = get_account()
+    token = Token.deploy(
+        "Test",
+        "Test",
+        1000,
+        (0, 5, 4, 1),  # Redeemable, Amortization, Monthly, Fixed
+        chain.time() + 5 * 31556952,
+        payment_token.address,
+        identity_registry.address,
+        100,
+        100,
+        10,
+        {"from": account},
+    )
+    schedule = amortization_schedule(
+        [100], [token.periodicInterestRate()], [token.loanTerm()]
+    )
+    # Act
+    apply_schedule(token, account)
+    # Assert
+    assert token.getPeriodicPayment() == schedule["periodic_payment"][0]
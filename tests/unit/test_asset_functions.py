@@ -1,16 +1,16 @@
 from scripts.helpfulscripts import get_account
-from scripts.deploy import deploy
-from brownie import Asset, exceptions
+from brownie import Asset, exceptions, chain
+from web3 import Web3
 import pytest
 
 
-def test_can_transfer():
+def test_can_transfer(deployment):
     # Arrange
     account = get_account()
     account1 = get_account(1)
     account2 = get_account(2)
     account3 = get_account(3)
-    (_, identityRegistry) = deploy()
+    (_, identityRegistry) = deployment
     asset = Asset.deploy(
         100, "Token", "Symbol", identityRegistry.address, {"from": account1}
     )
@@ -28,13 +28,13 @@ def test_can_transfer():
         asset.transfer(account3, 25, {"from": account1})
 
 
-def test_can_transfer_from():
+def test_can_transfer_from(deployment):
     # Arrange
     account = get_account()
     account1 = get_account(1)
     account2 = get_account(2)
     account3 = get_account(3)
-    (_, identityRegistry) = deploy()
+    (_, identityRegistry) = deployment
     asset = Asset.deploy(
         100, "Token", "Symbol", identityRegistry.address, {"from": account1}
     )
@@ -52,3 +52,78 @@ def test_can_transfer_from():
         asset.transferFrom(account1, account, 100, {"from": account3})
     with pytest.raises(exceptions.VirtualMachineError):
         asset.transferFrom(account1, account3, 25, {"from": account3})
+
+
+def test_holder_lookup_gas_is_flat(deployment):
+    # Arrange
+    account = get_account()
+    account1 = get_account(1)
+    account2 = get_account(2)
+    (_, identityRegistry) = deployment
+    asset = Asset.deploy(
+        10**6, "Token", "Symbol", identityRegistry.address, {"from": account1}
+    )
+    identity = identityRegistry.identity(account)
+    asset.transfer(account, 1000, {"from": account1})
+    asset.transfer(account2, 1000, {"from": account1})
+    holder_counts = [10, 100, 1000, 10000]
+    transfer_gas = []
+    lookup_gas = []
+    holders = 2
+    # Act
+    for holder_count in holder_counts:
+        new_holders = [
+            Web3.toChecksumAddress(
+                "0x" + bytes(Web3.keccak(text="holder-{}".format(i)))[-20:].hex()
+            )
+            for i in range(holders, holder_count)
+        ]
+        for i in range(0, len(new_holders), 200):
+            batch = new_holders[i : i + 200]
+            identityRegistry.batchRegisterIdentity(
+                batch, [identity] * len(batch), [586] * len(batch), {"from": account}
+            )
+        for holder in new_holders:
+            asset.transfer(holder, 1, {"from": account1})
+        holders = holder_count
+        tx = asset.transfer(account2, 1, {"from": account})
+        transfer_gas.append(tx.gas_used)
+        lookup_gas.append(asset.tokenHolderExists.estimate_gas(new_holders[-1]))
+    # Assert
+    assert len(asset.getTokenHolders()) == holder_counts[-1]
+    assert asset.tokenHolderExists(new_holders[-1]) == (True, holder_counts[-1] - 1)
+    assert max(transfer_gas) - min(transfer_gas) <= transfer_gas[0] // 100
+    assert max(lookup_gas) - min(lookup_gas) <= lookup_gas[0] // 100
+
+
+def test_can_read_balances_at_payment_period(deployment):
+    # Arrange
+    account = get_account()
+    account1 = get_account(1)
+    account2 = get_account(2)
+    (_, identityRegistry) = deployment
+    asset = Asset.deploy(
+        1000, "Token", "Symbol", identityRegistry.address, {"from": account1}
+    )
+    # Checking 'Checkpoint Schedule Not Set' Condition
+    assert asset.balanceOfAt(account1, 5) == 1000
+    asset.setCheckpointSchedule(chain[-1].timestamp, 86400, {"from": account1})
+    # Act
+    asset.transfer(account, 100, {"from": account1})
+    chain.sleep(86400)
+    chain.mine(1)
+    asset.transfer(account, 50, {"from": account1})
+    asset.transfer(account2, 30, {"from": account})
+    # Assert
+    assert asset.currentPaymentPeriod() == 1
+    assert asset.balanceOfAt(account, 0) == 0
+    assert asset.balanceOfAt(account, 1) == 100
+    assert asset.balanceOfAt(account2, 1) == 0
+    assert asset.balanceOf(account) == 120
+    assert asset.totalSupplyAt(1) == 1000
+    # Checking 'Future Payment Period' Condition
+    with pytest.raises(exceptions.VirtualMachineError):
+        asset.balanceOfAt(account, 2)
+    # Checking 'Schedule Already Set' Condition
+    with pytest.raises(exceptions.VirtualMachineError):
+        asset.setCheckpointSchedule(chain[-1].timestamp, 86400, {"from": account1})
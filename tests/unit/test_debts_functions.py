@@ -1,4 +1,5 @@
 from scripts.helpfulscripts import get_account
+from scripts.amortization import amortization_schedule
 from scripts.deploy import deploy
 from brownie import (
     Debts,
@@ -101,3 +102,63 @@ import pytest
 #     with pytest.raises(exceptions.VirtualMachineError):
 #         debt.putToken(put_amount, {"from": account})
 #     # ---------------------------------------------
+
+
+def test_can_compute_amortization_schedule(payment_token, identity_registry):
+    # Arrange
+    account = get_account()
+    account2 = get_account(2)
+    face_value = 100
+    options = (0, 5, 4, 3)  # Redeemable, Amortization, Monthly, Variable
+    debt = Debts.deploy(
+        "Test",
+        "Test",
+        1e12,
+        options,
+        chain.time() + 5 * 31556952,
+        payment_token.address,
+        identity_registry.address,
+        100,
+        face_value,
+        10,
+        {"from": account},
+    )
+    schedule = amortization_schedule(
+        [face_value], [debt.periodicInterestRate()], [debt.loanTerm()]
+    )
+    # Act
+    debt.computeAmortizationSchedule({"from": account})
+    # Assert
+    assert debt.getPeriodicPayment() == schedule["periodic_payment"][0]
+    # Checking 'Rate Change Keeps Schedule' Condition
+    periodic_payment = debt.getPeriodicPayment()
+    debt.modifyInterestRate(15, {"from": account})
+    assert debt.interestRate() == 15
+    assert debt.getPeriodicPayment() == periodic_payment
+    # Checking 'Rate Change Rebalances Schedule' Condition
+    debt.modifyAmortizedInterestRate(15, {"from": account})
+    schedule = amortization_schedule(
+        [face_value], [debt.calculatePeriodicInterestRate(15)], [debt.loanTerm()]
+    )
+    assert debt.getPeriodicPayment() == schedule["periodic_payment"][0]
+    # Checking 'Only Owner' Condition
+    with pytest.raises(exceptions.VirtualMachineError):
+        debt.computeAmortizationSchedule({"from": account2})
+    with pytest.raises(exceptions.VirtualMachineError):
+        debt.modifyAmortizedInterestRate(15, {"from": account2})
+    # Checking 'Loan Term Shorter Than a Period' Condition
+    debt1 = Debts.deploy(
+        "Test",
+        "Test",
+        1e12,
+        options,
+        chain.time() + 10 * 86400,
+        payment_token.address,
+        identity_registry.address,
+        100,
+        face_value,
+        10,
+        {"from": account},
+    )
+    with pytest.raises(exceptions.VirtualMachineError):
+        debt1.computeAmortizationSchedule({"from": account})
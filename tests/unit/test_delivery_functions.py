@@ -1,5 +1,4 @@
 from scripts.helpfulscripts import get_account
-from scripts.deploy import deploy
 from brownie import (
     Parameters,
     DELIVERY,
@@ -17,11 +16,11 @@ from eth_account import Account
 from web3 import Web3
 
 
-def test_can_physically_deliver():
+def test_can_physically_deliver(deployment):
     # Arrange
     account = get_account()
     account1 = accounts.add(config["wallets"]["from_key"])
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     token_name = "Test"
     token_symbol = "Test"
     initial_supply = 1000
@@ -73,12 +72,12 @@ def test_can_physically_deliver():
     # ---------------------------------------------
 
 
-def test_can_physically_deliver_tokenized_assets():
+def test_can_physically_deliver_tokenized_assets(deployment):
     # Arrange
     account = get_account()
     account1 = accounts.add(config["wallets"]["from_key"])
     account2 = get_account(2)
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     token_name = "Test"
     token_symbol = "Test"
     initial_supply = 1000
@@ -167,11 +166,11 @@ def test_can_physically_deliver_tokenized_assets():
     # ---------------------------------------------
 
 
-def test_can_cash_deliver():
+def test_can_cash_deliver(deployment):
     # Arrange
     account1 = accounts.add(config["wallets"]["from_key"])
     account2 = get_account(2)
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     token_name = "Test"
     token_symbol = "Test"
     initial_supply = 1000
@@ -246,11 +245,11 @@ def test_can_cash_deliver():
     # ---------------------------------------------
 
 
-def test_can_elect_delivery_option():
+def test_can_elect_delivery_option(deployment):
     # Arrange
     account1 = accounts.add(config["wallets"]["from_key"])
     account2 = get_account(2)
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     token_name = "Test"
     token_symbol = "Test"
     initial_supply = 1000
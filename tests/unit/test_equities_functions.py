@@ -1,5 +1,4 @@
 from scripts.helpfulscripts import get_account
-from scripts.deploy import deploy
 from brownie import (
     Equities,
     Parameters,
@@ -112,12 +111,12 @@ import pytest
 #         equity1.payIncome(account, dividend, {"from": account1})
 
 
-def test_can_disburse_income_to_all():
+def test_can_disburse_income_to_all(deployment):
     # Arrange
     account = get_account()
     account1 = accounts.add(config["wallets"]["from_key"])
     account2 = get_account(2)
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     equity_name = "Test"
     equity_symbol = "Test"
     initial_supply = 100
@@ -195,12 +194,12 @@ def test_can_disburse_income_to_all():
         equity1.payIncomeToAll(dividend, {"from": account1})
 
 
-def test_can_pay_cumulative_income():
+def test_can_pay_cumulative_income(deployment):
     # Arrange
     account = get_account()
     account1 = accounts.add(config["wallets"]["from_key"])
     account2 = get_account(2)
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     equity_name = "Test"
     equity_symbol = "Test"
     initial_supply = 1000
@@ -323,11 +322,11 @@ def test_can_pay_cumulative_income():
     # ---------------------------------------------
 
 
-def test_prank():
+def test_prank(deployment):
     account = get_account()
     account1 = accounts.add(config["wallets"]["from_key"])
     account2 = get_account(2)
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     equity_name = "Test"
     equity_symbol = "Test"
     initial_supply = 1000
@@ -348,3 +347,97 @@ def test_prank():
     assert payment_token.balanceOf(account) == income_rate * amount
     with pytest.raises(exceptions.VirtualMachineError):
         equity.payIncome(account2, 1000, {"from": account1})
+
+
+def test_can_schedule_checkpoints_from_deployment(payment_token, identity_registry):
+    # Arrange
+    account = get_account()
+    account1 = accounts.add(config["wallets"]["from_key"])
+    payment_frequency = 1  # Daily
+    # Act
+    equity = Equities.deploy(
+        "Test",
+        "Test",
+        1000,
+        0,  # Redeemable
+        6,  # Normal Rate
+        payment_frequency,
+        chain.time() + 31556952,
+        payment_token,
+        identity_registry,
+        100,
+        10,
+        {"from": account1},
+    )
+    asset = Asset.at(equity.getAddress())
+    equity.issueToken(50, account, {"from": account1})
+    chain.sleep(86400)
+    chain.mine(1)
+    # Assert
+    assert equity.contractDeploymentTime() == equity.tx.timestamp
+    assert asset.checkpointStartTime() == equity.tx.timestamp
+    assert asset.checkpointPeriod() == 86400
+    assert asset.currentPaymentPeriod() == 1
+    assert asset.balanceOfAt(account, 1) == 50
+
+
+def test_can_fund_and_claim_equity_income(payment_token, identity_registry):
+    # Arrange
+    account = get_account()
+    account1 = accounts.add(config["wallets"]["from_key"])
+    account2 = get_account(2)
+    income_rate = 10
+    dividend = 5
+    equity = Equities.deploy(
+        "Test",
+        "Test",
+        1000,
+        0,  # Redeemable
+        3,  # Participating
+        1,  # Daily
+        chain.time() + 31556952,
+        payment_token,
+        identity_registry,
+        100,
+        income_rate,
+        {"from": account1},
+    )
+    asset = Asset.at(equity.getAddress())
+    equity.issueToken(100, account, {"from": account1})
+    equity.issueToken(50, account2, {"from": account1})
+    payout = income_rate + dividend
+    payment_token.transfer(equity, payout * 300, {"from": account1})
+    # Checking Only Owner Condition
+    with pytest.raises(exceptions.VirtualMachineError):
+        equity.enableClaimMode({"from": account})
+    # Act
+    equity.enableClaimMode({"from": account1})
+    chain.sleep(86400)
+    chain.mine(1)
+    tx = equity.fundIncomePayment(dividend, {"from": account1})
+    asset.transfer(account2, 50, {"from": account})
+    equity.claim({"from": account})
+    # Assert
+    assert asset.payoutLedger() == equity
+    assert equity.claimMode()
+    assert tx.events["PaymentPeriodFunded"]["totalPayout"] == payout * 150
+    assert payment_token.balanceOf(account) == payout * 100
+    assert equity.claimablePayout(account2) == payout * 50
+    assert equity.unclaimedPayouts() == payout * 50
+    # Checking 'Participating Income Needs a Dividend' Condition
+    chain.sleep(86400)
+    chain.mine(1)
+    with pytest.raises(exceptions.VirtualMachineError):
+        equity.fundIncomePayment(0, {"from": account1})
+    # Checking 'Push Payments Are Disabled in Claim Mode' Condition
+    with pytest.raises(exceptions.VirtualMachineError):
+        equity.payIncome(account2, dividend, {"from": account1})
+    with pytest.raises(exceptions.VirtualMachineError):
+        equity.payIncomeToAll(dividend, {"from": account1})
+    # Checking 'Accrual Follows the Transfer' Condition
+    equity.fundIncomePayment(dividend, {"from": account1})
+    assert equity.claimablePayout(account) == payout * 50
+    assert equity.claimablePayout(account2) == payout * 50 + payout * 100
+    # Checking 'Claim Mode Already Enabled' Condition
+    with pytest.raises(exceptions.VirtualMachineError):
+        equity.enableClaimMode({"from": account1})
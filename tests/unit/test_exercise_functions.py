@@ -1,5 +1,4 @@
 from scripts.helpfulscripts import get_account
-from scripts.deploy import deploy
 from brownie import (
     Parameters,
     EXERCISE,
@@ -13,10 +12,10 @@ import pytest
 from datetime import datetime
 
 
-def test_can_deploy_exercise():
+def test_can_deploy_exercise(deployment):
     # Arrange
     account1 = accounts.add(config["wallets"]["from_key"])
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     token_name = "Test"
     token_symbol = "Test"
     initial_supply = 1000
@@ -81,12 +80,12 @@ def test_can_deploy_exercise():
     # ---------------------------------------------
 
 
-def test_can_exercise_american_token():
+def test_can_exercise_american_token(deployment):
     # Arrange
     account = get_account()
     account1 = accounts.add(config["wallets"]["from_key"])
     account2 = get_account(2)
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     token_name = "Test"
     token_symbol = "Test"
     initial_supply = 1000
@@ -136,12 +135,12 @@ def test_can_exercise_american_token():
     # ---------------------------------------------
 
 
-def test_can_exercise_european_token():
+def test_can_exercise_european_token(deployment):
     # Arrange
     account = get_account()
     account1 = accounts.add(config["wallets"]["from_key"])
     account2 = get_account(2)
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     token_name = "Test"
     token_symbol = "Test"
     initial_supply = 1000
@@ -183,12 +182,12 @@ def test_can_exercise_european_token():
     # ---------------------------------------------
 
 
-def test_can_exercise_bermudan_token():
+def test_can_exercise_bermudan_token(deployment):
     # Arrange
     account = get_account()
     account1 = accounts.add(config["wallets"]["from_key"])
     account2 = get_account(2)
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     token_name = "Test"
     token_symbol = "Test"
     initial_supply = 1000
@@ -0,0 +1,33 @@
+from scripts.helpfulscripts import get_account
+from brownie import Identity, IdentityFactory, exceptions
+from eth_abi import encode_abi
+from web3 import Web3
+import pytest
+
+
+def test_can_create_and_register_identity(identity_registry):
+    # Arrange
+    account = get_account()
+    account4 = get_account(4)
+    implementation = Identity.deploy(account, True, {"from": account})
+    factory = IdentityFactory.deploy(implementation, {"from": account})
+    salt = Web3.keccak(text="investor-4")
+    predicted = factory.predictIdentity(account4, salt)
+    # Act
+    tx = factory.createAndRegisterIdentity(
+        identity_registry, account4, salt, 586, {"from": account}
+    )
+    # Assert
+    assert tx.events["IdentityCreated"]["identity"] == predicted
+    assert identity_registry.identity(account4) == predicted
+    assert identity_registry.investorCountry(account4) == 586
+    identity = Identity.at(predicted)
+    assert identity.keyHasPurpose(
+        Web3.keccak(encode_abi(["address"], [account4.address])), 1
+    )
+    # Checking 'Already Deployed' Condition
+    with pytest.raises(exceptions.VirtualMachineError):
+        factory.createIdentity(account4, salt, {"from": account})
+    # Checking 'Library Implementation' Condition
+    with pytest.raises(exceptions.VirtualMachineError):
+        implementation.addKey(salt, 3, 1, {"from": account})
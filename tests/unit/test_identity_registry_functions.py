@@ -0,0 +1,130 @@
+from scripts.helpfulscripts import get_account
+from brownie import (
+    ClaimIssuer,
+    ClaimTopicsRegistry,
+    Identity,
+    TrustedIssuersRegistry,
+    accounts,
+    exceptions,
+)
+import pytest
+
+
+def test_can_cache_verification_until_claim_is_revoked(deployment):
+    # Arrange
+    account = get_account()
+    account1 = get_account(1)
+    account2 = get_account(2)
+    account3 = get_account(3)
+    (_, identityRegistry) = deployment
+    trustedIssuersRegistry = TrustedIssuersRegistry.at(
+        identityRegistry.issuersRegistry()
+    )
+    claimIssuer = ClaimIssuer.at(trustedIssuersRegistry.getTrustedIssuers()[0])
+    identity2 = Identity.at(identityRegistry.identity(account2))
+    claimId = identity2.getClaimIdsByTopic(1947)[0]
+    epoch = identityRegistry.verificationEpoch()
+    assert identityRegistry.isVerificationCached(account2)
+    assert identityRegistry.isVerified(account2)
+    # Act
+    claimIssuer.revokeClaim(claimId, identity2.address, {"from": account1})
+    # Assert
+    assert identityRegistry.verificationEpoch() == epoch + 1
+    assert not identityRegistry.isVerificationCached(account2)
+    assert not identityRegistry.isVerified(account2)
+    assert identityRegistry.isVerified(account)
+    tx = identityRegistry.refreshVerification(account2, {"from": account3})
+    assert tx.events["VerificationRefreshed"]["verified"] == False
+    assert identityRegistry.isVerificationCached(account2)
+    assert not identityRegistry.isVerified(account2)
+    # Checking 'Unauthorized Invalidation' Condition
+    with pytest.raises(exceptions.VirtualMachineError):
+        identityRegistry.invalidateVerificationCache({"from": account3})
+
+
+def test_registration_clears_verification_cached_before_it(identity_registry):
+    # Arrange
+    account = get_account()
+    account3 = get_account(3)
+    investor = accounts.add()
+    investor1 = accounts.add()
+    # The identity of account already holds a valid claim
+    identity = identity_registry.identity(account)
+    identity_registry.refreshVerification(investor, {"from": account3})
+    identity_registry.refreshVerification(investor1, {"from": account3})
+    assert identity_registry.isVerificationCached(investor)
+    assert not identity_registry.isVerified(investor)
+    # Act
+    identity_registry.registerIdentity(investor, identity, 586, {"from": account})
+    identity_registry.batchRegisterIdentity(
+        [investor1], [identity], [586], {"from": account}
+    )
+    # Assert
+    assert not identity_registry.isVerificationCached(investor)
+    assert identity_registry.isVerified(investor)
+    assert not identity_registry.isVerificationCached(investor1)
+    assert identity_registry.isVerified(investor1)
+
+
+def test_claim_updates_clear_the_cached_verification(identity_registry):
+    # Arrange
+    account2 = get_account(2)
+    account3 = get_account(3)
+    identity2 = Identity.at(identity_registry.identity(account2))
+    claimId = identity2.getClaimIdsByTopic(1947)[0]
+    (topic, scheme, issuer, signature, data, uri) = identity2.getClaim(claimId)
+    epoch = identity_registry.verificationEpoch()
+    assert identity_registry.isVerificationCached(account2)
+    assert identity_registry.isVerified(account2)
+    # Act
+    tx = identity2.removeClaim(claimId, {"from": account2})
+    # Assert
+    assert tx.events["VerificationCleared"]["userAddress"] == account2
+    assert identity_registry.verificationEpoch() == epoch
+    assert not identity_registry.isVerificationCached(account2)
+    assert not identity_registry.isVerified(account2)
+    # Checking 'Claim Added Back' Condition
+    identity_registry.refreshVerification(account2, {"from": account3})
+    assert not identity_registry.isVerified(account2)
+    identity2.addClaim(topic, scheme, issuer, signature, data, uri, {"from": account2})
+    assert not identity_registry.isVerificationCached(account2)
+    assert identity_registry.isVerified(account2)
+    # Checking 'Unauthorized Clearing' Condition
+    with pytest.raises(exceptions.VirtualMachineError):
+        identity_registry.clearVerification(account2, {"from": account3})
+    # Checking 'Unauthorized Binding' Condition
+    with pytest.raises(exceptions.VirtualMachineError):
+        identity2.bindVerificationCache(identity_registry, account3, {"from": account3})
+
+
+def test_registry_changes_bump_the_verification_epoch(identity_registry):
+    # Arrange
+    account = get_account()
+    account2 = get_account(2)
+    account3 = get_account(3)
+    claimTopicsRegistry = ClaimTopicsRegistry.at(identity_registry.topicsRegistry())
+    trustedIssuersRegistry = TrustedIssuersRegistry.at(
+        identity_registry.issuersRegistry()
+    )
+    claimIssuer = ClaimIssuer.deploy(account3, {"from": account3})
+    epoch = identity_registry.verificationEpoch()
+    # Act
+    claimTopicsRegistry.addClaimTopic(7, {"from": account})
+    # Assert
+    assert identity_registry.verificationEpoch() == epoch + 1
+    assert not identity_registry.isVerificationCached(account2)
+    assert not identity_registry.isVerified(account2)
+    # Checking 'Claim Topic Removed' Condition
+    claimTopicsRegistry.removeClaimTopic(7, {"from": account})
+    assert identity_registry.verificationEpoch() == epoch + 2
+    assert identity_registry.isVerified(account2)
+    # Checking 'Trusted Issuer Changes' Condition
+    identity_registry.refreshVerification(account2, {"from": account3})
+    trustedIssuersRegistry.addTrustedIssuer(claimIssuer, [1947], {"from": account})
+    assert identity_registry.verificationEpoch() == epoch + 3
+    assert not identity_registry.isVerificationCached(account2)
+    trustedIssuersRegistry.updateIssuerClaimTopics(claimIssuer, [7], {"from": account})
+    assert identity_registry.verificationEpoch() == epoch + 4
+    trustedIssuersRegistry.removeTrustedIssuer(claimIssuer, {"from": account})
+    assert identity_registry.verificationEpoch() == epoch + 5
+    assert identity_registry.isVerified(account2)
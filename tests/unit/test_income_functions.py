@@ -1,5 +1,4 @@
 from scripts.helpfulscripts import get_account
-from scripts.deploy import deploy
 from brownie import (
     Parameters,
     INCOME,
@@ -12,12 +11,12 @@ from brownie import (
 import pytest
 
 
-def test_can_pay_income():
+def test_can_pay_income(deployment):
     # Arrange
     account = get_account()
     account1 = accounts.add(config["wallets"]["from_key"])
     account2 = get_account(2)
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     equity_name = "Test"
     equity_symbol = "Test"
     initial_supply = 1000
@@ -90,3 +89,63 @@ def test_can_pay_income():
     )
     with pytest.raises(exceptions.VirtualMachineError):
         equity1.payIncome(account, dividend, {"from": account1})
+
+
+def test_can_fund_and_claim_income(payment_token, identity_registry):
+    # Arrange
+    account = get_account()
+    account1 = accounts.add(config["wallets"]["from_key"])
+    account2 = get_account(2)
+    income_rate = 10
+    dividend = 5
+    asset = Asset.deploy(1e12, "Test", "Test", identity_registry, {"from": account1})
+    parameters = Parameters.deploy(
+        100, 1000, asset, payment_token, identity_registry, {"from": account1}
+    )
+    income = INCOME.deploy(
+        3,  # Participating
+        1,  # Daily
+        income_rate,
+        chain.time() + 31556952,
+        parameters,
+        {"from": account},
+    )
+    # Checking 'Payout Ledger Is Not Set' Condition
+    with pytest.raises(exceptions.VirtualMachineError):
+        income.enableClaimMode({"from": account})
+    asset.setPayoutLedger(income, {"from": account1})
+    income.enableClaimMode({"from": account})
+    asset.transfer(account, 100, {"from": account1})
+    asset.transfer(account2, 50, {"from": account1})
+    payout = income_rate + dividend
+    payment_token.transfer(income, payout * 300, {"from": account1})
+    chain.sleep(86400)
+    chain.mine(1)
+    # Checking 'Participating Income Needs a Dividend' Condition
+    with pytest.raises(exceptions.VirtualMachineError):
+        income.fundIncomePayment(0, {"from": account})
+    # Act
+    tx = income.fundIncomePayment(dividend, {"from": account})
+    asset.transfer(account2, 50, {"from": account})
+    income.claim({"from": account})
+    # Assert
+    assert tx.events["PaymentPeriodFunded"]["payoutPerToken"] == payout
+    assert tx.events["PaymentPeriodFunded"]["totalPayout"] == payout * 150
+    assert payment_token.balanceOf(account) == payout * 100
+    assert income.claimablePayout(account2) == payout * 50
+    assert income.claimablePayout(account1) == 0
+    assert income.unclaimedPayouts() == payout * 50
+    # Checking 'Push Payments Are Disabled in Claim Mode' Condition
+    with pytest.raises(exceptions.VirtualMachineError):
+        income.payIncome(account2, dividend, {"from": account})
+    with pytest.raises(exceptions.VirtualMachineError):
+        income.payIncomeToAll(dividend, {"from": account})
+    # Checking 'Payment Period Already Funded' Condition
+    with pytest.raises(exceptions.VirtualMachineError):
+        income.fundIncomePayment(dividend, {"from": account})
+    # Checking 'Accrual Follows the Transfer' Condition
+    chain.sleep(86400)
+    chain.mine(1)
+    income.fundIncomePayment(dividend, {"from": account})
+    assert income.claimablePayout(account) == payout * 50
+    assert income.claimablePayout(account2) == payout * 50 + payout * 100
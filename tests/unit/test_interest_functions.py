@@ -1,5 +1,5 @@
 from scripts.helpfulscripts import get_account
-from scripts.deploy import deploy
+from scripts.cash_receipts import sign_receipts
 from brownie import (
     Parameters,
     INTEREST,
@@ -18,11 +18,11 @@ from eth_account import Account
 from web3 import Web3
 
 
-def test_can_pay_interest_in_perpetuity():
+def test_can_pay_interest_in_perpetuity(deployment):
     # Arrange
     account = get_account()
     account1 = accounts.add(config["wallets"]["from_key"])
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     token_name = "Test"
     token_symbol = "Test"
     initial_supply = 1e12
@@ -62,12 +62,12 @@ def test_can_pay_interest_in_perpetuity():
     assert token.maturityDate() == maturity_date
 
 
-def test_can_pay_interest():
+def test_can_pay_interest(deployment):
     # Arrange
     account = get_account()
     account1 = accounts.add(config["wallets"]["from_key"])
     account2 = get_account(2)
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     token_name = "Test"
     token_symbol = "Test"
     initial_supply = 1e12
@@ -162,12 +162,12 @@ def test_can_pay_interest():
         token3.payInterest(account, {"from": account})
 
 
-def test_can_pay_interest_to_all_token_holders():
+def test_can_pay_interest_to_all_token_holders(deployment):
     # Arrange
     account = get_account()
     account1 = accounts.add(config["wallets"]["from_key"])
     account2 = get_account(2)
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     token_name = "Test"
     token_symbol = "Test"
     initial_supply = 200
@@ -271,11 +271,11 @@ def test_can_pay_interest_to_all_token_holders():
         token4.payInterestToAll({"from": account})
 
 
-def test_can_pay_interest_in_payment_in_kind():
+def test_can_pay_interest_in_payment_in_kind(deployment):
     # Arrange
     account = get_account()
     account1 = accounts.add(config["wallets"]["from_key"])
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     token_name = "Test"
     token_symbol = "Test"
     initial_supply = 1e12
@@ -390,12 +390,12 @@ def test_can_pay_interest_in_payment_in_kind():
         )
 
 
-def test_can_pay_interest_in_payment_in_kind_to_all():
+def test_can_pay_interest_in_payment_in_kind_to_all(deployment):
     # Arrange
     account = get_account()
     account1 = accounts.add(config["wallets"]["from_key"])
     account2 = get_account(2)
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     token_name = "Test"
     token_symbol = "Test"
     initial_supply = 1e12
@@ -490,12 +490,12 @@ def test_can_pay_interest_in_payment_in_kind_to_all():
         token4.payInterestInPaymentInKindToAll(eth.address, 100, {"from": account})
 
 
-def test_can_pay_interest_in_cash():
+def test_can_pay_interest_in_cash(deployment):
     # Arrange
     account = get_account()
     account1 = accounts.add(config["wallets"]["from_key"])
     account2 = get_account(2)
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     token_name = "Test"
     token_symbol = "Test"
     initial_supply = 1e12
@@ -545,7 +545,7 @@ def test_can_pay_interest_in_cash():
             signedObject.signature,
             {"from": account},
         )
-    token.payInterestInCash(
+    tx = token.payInterestInCash(
         receipt_number,
         date,
         account.address,
@@ -554,10 +554,15 @@ def test_can_pay_interest_in_cash():
         {"from": account1},
     )
     # Assert
-    assert token.investorToPaymentPeriodToReceipt(account, 1)[3] == amount
-    assert (
-        token.investorToPaymentPeriodToReceipt(account, 1)[4]
-        == signedObject.signature.hex()
+    receipt = (receipt_number, date, account.address, amount, signedObject.signature)
+    recorded = tx.events["CashReceiptRecorded"]
+    assert recorded["paymentPeriod"] == 1
+    assert recorded["amount"] == amount
+    assert recorded["signature"] == signedObject.signature.hex()
+    assert token.verifyCashReceipt(1, receipt)
+    assert not token.verifyCashReceipt(0, receipt)
+    assert not token.verifyCashReceipt(
+        1, (receipt_number, date, account.address, amount + 1, signedObject.signature)
     )
     # Checking 'Investor Already Paid for this Payment Period' Condition
     with pytest.raises(exceptions.VirtualMachineError):
@@ -671,3 +676,119 @@ def test_can_pay_interest_in_cash():
             signedObject.signature,
             {"from": account1},
         )
+
+
+def test_can_pay_interest_in_cash_in_batch(payment_token, identity_registry):
+    # Arrange
+    account = get_account()
+    account1 = accounts.add(config["wallets"]["from_key"])
+    account2 = get_account(2)
+    asset = Asset.deploy(1e12, "Test", "Test", identity_registry, {"from": account1})
+    parameters = Parameters.deploy(
+        100, 1000, asset, payment_token, identity_registry, {"from": account1}
+    )
+    token = INTEREST.deploy(
+        1,  # Daily
+        4,  # Cash
+        parameters,
+        chain.time() + 31556952,
+        100,
+        10,
+        {"from": account1},
+    )
+    asset.transfer(account, 100, {"from": account1})
+    asset.transfer(account2, 50, {"from": account1})
+    chain.sleep(86400)
+    chain.mine(1)
+    receipts = [
+        {
+            "receiptNumber": 0,
+            "date": chain.time(),
+            "tokenHolder": account.address,
+            "amount": 100,
+        },
+        {
+            "receiptNumber": 1,
+            "date": chain.time(),
+            "tokenHolder": account2.address,
+            "amount": 50,
+        },
+    ]
+    signed = sign_receipts(
+        config["wallets"]["from_key"], receipts, 1, token.address, chain.id
+    )
+    # Checking 'Only Owner' Condition
+    with pytest.raises(exceptions.VirtualMachineError):
+        token.payInterestInCashBatch(signed, {"from": account})
+    # Checking 'Signed for Another Payment Period' Condition
+    with pytest.raises(exceptions.VirtualMachineError):
+        token.payInterestInCashBatch(
+            sign_receipts(
+                config["wallets"]["from_key"], receipts, 2, token.address, chain.id
+            ),
+            {"from": account1},
+        )
+    # Act
+    tx = token.payInterestInCashBatch(signed, {"from": account1})
+    # Assert
+    assert [e["tokenHolder"] for e in tx.events["CashReceiptRecorded"]] == [
+        account,
+        account2,
+    ]
+    assert token.investorToPaymentPeriodToStatus(account, 1)
+    assert token.investorToPaymentPeriodToStatus(account2, 1)
+    assert token.verifyCashReceipt(1, signed[1])
+    # Checking 'Investor Already Paid for this Payment Period' Condition
+    with pytest.raises(exceptions.VirtualMachineError):
+        token.payInterestInCashBatch(signed[:1], {"from": account1})
+
+
+def test_can_fund_and_claim_interest(deployment):
+    # Arrange
+    account = get_account()
+    account1 = accounts.add(config["wallets"]["from_key"])
+    account2 = get_account(2)
+    (payment_token, identityRegistry) = deployment
+    asset = Asset.deploy(1e12, "Test", "Test", identityRegistry, {"from": account1})
+    parameters = Parameters.deploy(
+        100, 1000, asset, payment_token, identityRegistry, {"from": account1}
+    )
+    face_value = 100
+    interest_rate = 10
+    token = INTEREST.deploy(
+        1,  # Daily
+        1,  # Fixed
+        parameters,
+        chain.time() + 31556952,
+        face_value,
+        interest_rate,
+        {"from": account},
+    )
+    # Checking 'Payout Ledger Is Not Set' Condition
+    with pytest.raises(exceptions.VirtualMachineError):
+        token.enableClaimMode({"from": account})
+    asset.setPayoutLedger(token, {"from": account1})
+    token.enableClaimMode({"from": account})
+    asset.transfer(account, 100, {"from": account1})
+    asset.transfer(account2, 50, {"from": account1})
+    payout = face_value * interest_rate
+    payment_token.transfer(token, payout * 150, {"from": account1})
+    chain.sleep(86400)
+    chain.mine(1)
+    # Act
+    token.fundInterestPayment({"from": account})
+    asset.transfer(account2, 50, {"from": account})
+    token.claim({"from": account})
+    # Assert
+    assert payment_token.balanceOf(account) == payout * 100
+    assert token.claimablePayout(account2) == payout * 50
+    assert token.unclaimedPayouts() == payout * 50
+    # Checking 'Push Payments Are Disabled in Claim Mode' Condition
+    with pytest.raises(exceptions.VirtualMachineError):
+        token.payInterest(account2, {"from": account})
+    # Checking 'Payment Period Already Funded' Condition
+    with pytest.raises(exceptions.VirtualMachineError):
+        token.fundInterestPayment({"from": account})
+    # Checking 'Nothing to Claim' Condition
+    with pytest.raises(exceptions.VirtualMachineError):
+        token.claim({"from": account})
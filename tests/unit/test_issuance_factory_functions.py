@@ -0,0 +1,37 @@
+from scripts.helpfulscripts import get_account
+from scripts.deploy import deploy_issuance_factory
+from brownie import Token, Asset, exceptions, chain
+import pytest
+
+
+def test_can_issue_token_clone(payment_token, identity_registry):
+    # Arrange
+    account = get_account()
+    account2 = get_account(2)
+    factory = deploy_issuance_factory(account2, payment_token, identity_registry)
+    maturity_date = chain.time() + 31556952
+    terms = (maturity_date, payment_token, identity_registry, 100, 100, 10)
+    # Act
+    tx = factory.issueToken(
+        ("Clone", "CLN", 1000), (0, 1, 1, 1), terms, {"from": account}
+    )
+    # Assert
+    token = Token.at(tx.return_value)
+    asset = Asset.at(tx.events["InstrumentIssued"]["asset"])
+    assert factory.getIssuances() == [token.address]
+    assert token.owner() == account
+    assert token.getAddress() == asset.address
+    assert token.maturityDate() == maturity_date
+    assert asset.name() == "Clone"
+    assert asset.symbol() == "CLN"
+    assert asset.owner() == token.address
+    assert asset.balanceOf(token) == 1000
+    token.issueToken(100, account2, {"from": account})
+    assert asset.balanceOf(account2) == 100
+    # Checking 'Already Initialized' Condition
+    with pytest.raises(exceptions.VirtualMachineError):
+        token.initialize(asset, account2, (0, 1, 1, 1), terms, {"from": account2})
+    with pytest.raises(exceptions.VirtualMachineError):
+        asset.initialize(
+            1000, "X", "X", identity_registry, account2, {"from": account2}
+        )
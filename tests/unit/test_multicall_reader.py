@@ -0,0 +1,41 @@
+from scripts.helpfulscripts import get_account
+from scripts.multicall_reader import deploy_multicall, holder_statuses, HolderStatus
+from brownie import Token, accounts, config, chain
+
+
+def test_can_read_holder_statuses_in_batches(payment_token, identity_registry):
+    # Arrange
+    account = get_account()
+    account1 = accounts.add(config["wallets"]["from_key"])
+    account2 = get_account(2)
+    token = Token.deploy(
+        "Test",
+        "Test",
+        1e12,
+        (0, 1, 1, 1),  # Redeemable, Fixed Maturity, Daily, Fixed
+        chain.time() + 31556952,
+        payment_token.address,
+        identity_registry.address,
+        100,
+        100,
+        1000,
+        {"from": account},
+    )
+    payment_token.transfer(token, 100 * 1000, {"from": account1})
+    token.issueToken(100, account, {"from": account})
+    token.issueToken(50, account1, {"from": account})
+    token.issueToken(25, account2, {"from": account})
+    chain.sleep(86400 + 60 * 60 * 12)
+    chain.mine(1)
+    token.payInterest(account1, {"from": account})
+    multicall = deploy_multicall(account)
+    # Act
+    statuses = holder_statuses(
+        multicall, token, [account, account1, account2], batch_size=2
+    )
+    # Assert
+    assert statuses == [
+        HolderStatus(account, 100, False, False),
+        HolderStatus(account1, 50, True, False),
+        HolderStatus(account2, 25, False, False),
+    ]
@@ -0,0 +1,54 @@
+from scripts.helpfulscripts import get_account
+from scripts.onboarding import (
+    onboard,
+    load_checkpoint,
+    deploy_identity_factory,
+    management_key,
+)
+from brownie import Identity, TrustedIssuersRegistry, accounts, config
+
+
+def test_can_onboard_investors_in_bulk(identity_registry, tmp_path):
+    # Arrange
+    account = get_account()
+    claimIssuer = TrustedIssuersRegistry.at(
+        identity_registry.issuersRegistry()
+    ).getTrustedIssuers()[0]
+    investors = [{"address": accounts[i].address, "country": 586} for i in range(3, 8)]
+    checkpoint = str(tmp_path / "checkpoint.json")
+    factory = deploy_identity_factory(account)
+    # Act
+    report = onboard(
+        investors,
+        account,
+        identity_registry,
+        factory,
+        claimIssuer,
+        config["wallets"]["from_key"],
+        checkpoint_path=checkpoint,
+        batch_size=2,
+        workers=2,
+    )
+    # Assert
+    assert report["investors"] == 5
+    for investor in investors:
+        assert identity_registry.contains(investor["address"])
+        assert identity_registry.isVerified(investor["address"])
+        assert load_checkpoint(checkpoint)[investor["address"]]["registered"]
+        # The operator hands management of the identity over to the investor
+        identity = Identity.at(identity_registry.identity(investor["address"]))
+        assert identity.keyHasPurpose(management_key(investor["address"]), 1)
+        assert not identity.keyHasPurpose(management_key(account.address), 1)
+    # Checking 'Resume' Condition
+    assert (
+        onboard(
+            investors,
+            account,
+            identity_registry,
+            factory,
+            claimIssuer,
+            config["wallets"]["from_key"],
+            checkpoint_path=checkpoint,
+        )["investors"]
+        == 0
+    )
@@ -0,0 +1,70 @@
+from scripts.helpfulscripts import get_account
+from brownie import (
+    PayingEquity,
+    Parameters,
+    Asset,
+    exceptions,
+    chain,
+    accounts,
+    config,
+)
+import pytest
+
+
+def test_can_vote_on_shareholder_ballot(payment_token, identity_registry):
+    # Arrange
+    account = get_account()
+    account1 = accounts.add(config["wallets"]["from_key"])
+    account2 = get_account(2)
+    asset = Asset.deploy(
+        1000, "Token", "Symbol", identity_registry.address, {"from": account1}
+    )
+    parameters = Parameters.deploy(
+        100, 1000, asset, payment_token, identity_registry, {"from": account1}
+    )
+    equity = PayingEquity.deploy(
+        (
+            4,  # Perpetual
+            1,  # Fixed Rate
+            1,  # Daily
+            1,  # Registered
+            0,
+            0,
+            0,
+            10,
+        ),
+        parameters,
+        {"from": account1},
+    )
+    # Checking 'Checkpoint Schedule Not Set' Condition
+    with pytest.raises(exceptions.VirtualMachineError):
+        equity.createShareholderBallot(
+            "Yes or No?", ["Yes", "No"], 1709181605, 400, {"from": account1}
+        )
+    asset.setCheckpointSchedule(chain[-1].timestamp, 86400, {"from": account1})
+    asset.transfer(account, 400, {"from": account1})
+    asset.transfer(account2, 100, {"from": account1})
+    chain.sleep(86400)
+    chain.mine(1)
+    # Checking Only Owner Condition
+    with pytest.raises(exceptions.VirtualMachineError):
+        equity.createShareholderBallot(
+            "Yes or No?", ["Yes", "No"], 1709181605, 400, {"from": account}
+        )
+    # Act
+    equity.createShareholderBallot(
+        "Yes or No?", ["Yes", "No"], 1709181605, 400, {"from": account1}
+    )
+    equity.startVoting(0, {"from": account1})
+    equity.castVote(0, 0, {"from": account})
+    equity.castVote(0, 1, {"from": account2})
+    # Assert
+    assert equity.ballotAsset(0) == asset
+    assert equity.ballotSnapshot(0) == 1
+    assert equity.tally(0, 0) == 400
+    assert equity.tally(0, 1) == 100
+    # Checking 'Issuer Shares Carry No Votes' Condition
+    assert asset.balanceOfAt(account1, 1) == 500
+    assert equity.voteWeight(0, account1) == 0
+    with pytest.raises(exceptions.VirtualMachineError):
+        equity.castVote(0, 1, {"from": account1})
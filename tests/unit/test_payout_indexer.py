@@ -0,0 +1,56 @@
+from scripts.helpfulscripts import get_account
+from scripts.payout_indexer import index_payouts, load_payouts
+from brownie import Token, accounts, config, chain
+import sqlite3
+
+
+def test_can_index_payouts(payment_token, identity_registry, tmp_path):
+    # Arrange
+    account = get_account()
+    account1 = accounts.add(config["wallets"]["from_key"])
+    account2 = get_account(2)
+    face_value = 100
+    interest_rate = 1000
+    start_block = chain.height
+    token = Token.deploy(
+        "Test",
+        "Test",
+        1e12,
+        (0, 1, 1, 1),  # Redeemable, Fixed Maturity, Daily, Fixed
+        chain.time() + 31556952,
+        payment_token.address,
+        identity_registry.address,
+        100,
+        face_value,
+        interest_rate,
+        {"from": account},
+    )
+    payment = face_value * interest_rate
+    payment_token.transfer(token, payment * 4, {"from": account1})
+    token.issueToken(100, account, {"from": account})
+    token.issueToken(100, account2, {"from": account})
+    chain.sleep(86400 + 60 * 60 * 12)
+    chain.mine(1)
+    token.payInterestToAll({"from": account})
+    db_path = str(tmp_path / "payouts.db")
+    # Act
+    indexed = index_payouts(db_path, [token.address], start_block, block_range=3)
+    # Assert
+    assert indexed == {token.address: 2}
+    payouts = load_payouts(db_path, token.address)
+    assert [p["investor"] for p in payouts] == [account, account2]
+    assert all(p["event"] == "InterestPaid" for p in payouts)
+    assert all(p["payment_period"] == 1 for p in payouts)
+    assert all(p["amount"] == payment for p in payouts)
+    assert all(p["payment_token"] == payment_token.address for p in payouts)
+    # Checking 'Resume From Checkpoint' Condition
+    chain.sleep(86400)
+    chain.mine(1)
+    token.payInterest(account, {"from": account})
+    assert index_payouts(db_path, [token.address], start_block) == {token.address: 1}
+    assert len(load_payouts(db_path, token.address)) == 3
+    with sqlite3.connect(db_path) as connection:
+        (last_block,) = connection.execute(
+            "SELECT last_block FROM checkpoints WHERE contract = ?", (token.address,)
+        ).fetchone()
+    assert last_block == chain.height
@@ -1,5 +1,4 @@
 from scripts.helpfulscripts import get_account
-from scripts.deploy import deploy
 from brownie import (
     Token,
     ERC20Mock,
@@ -151,10 +150,10 @@ def test_can_extend_buyback_date():
         token1.extendBuybackDate(1772611174, {"from": account})
 
 
-def test_can_exchange_token():
+def test_can_exchange_token(deployment):
     # Arrange
     account = get_account()
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     token_name = "Test"
     token_symbol = "Test"
     initial_supply = 100
@@ -205,10 +204,10 @@ def test_can_exchange_token():
         token1.exchangeToken(eth, amount, {"from": account})
 
 
-def test_can_redeem_tokens():
+def test_can_redeem_tokens(deployment):
     # Arrange
     account = get_account()
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     token_name = "Test"
     token_symbol = "Test"
     initial_supply = 1e9
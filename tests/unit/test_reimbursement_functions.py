@@ -1,5 +1,5 @@
 from scripts.helpfulscripts import get_account
-from scripts.deploy import deploy
+from scripts.amortization import amortization_schedule
 from brownie import (
     Parameters,
     REIMBURSEMENT,
@@ -13,12 +13,12 @@ import pytest
 from datetime import datetime, timedelta
 
 
-def test_can_pay_at_maturity():
+def test_can_pay_at_maturity(deployment):
     # Arrange
     account = get_account()
     account1 = accounts.add(config["wallets"]["from_key"])
     account2 = get_account(2)
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     token_name = "Test"
     token_symbol = "Test"
     initial_supply = 1e12
@@ -109,12 +109,12 @@ def test_can_pay_at_maturity():
     # ---------------------------------------------
 
 
-def test_can_pay_at_maturity_to_all():
+def test_can_pay_at_maturity_to_all(deployment):
     # Arrange
     account = get_account()
     account1 = accounts.add(config["wallets"]["from_key"])
     account2 = get_account(2)
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     token_name = "Test"
     token_symbol = "Test"
     reimburse_state = 3  # Fixed Maturity with Put and Call
@@ -197,11 +197,11 @@ def test_can_pay_at_maturity_to_all():
     # ---------------------------------------------
 
 
-def test_can_set_amortization_schedule():
+def test_can_set_amortization_schedule(deployment):
     # Arrange
     account = get_account()
     account1 = accounts.add(config["wallets"]["from_key"])
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     token_name = "Test"
     token_symbol = "Test"
     reimburse_state = 5  # Amortization
@@ -267,11 +267,11 @@ def test_can_set_amortization_schedule():
     # ---------------------------------------------
 
 
-def test_can_modify_periodic_interest_rate():
+def test_can_modify_periodic_interest_rate(deployment):
     # Arrange
     account = get_account()
     account1 = accounts.add(config["wallets"]["from_key"])
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     token_name = "Test"
     token_symbol = "Test"
     reimburse_state = 5  # Amortization
@@ -346,12 +346,50 @@ def test_can_modify_periodic_interest_rate():
     # ---------------------------------------------
 
 
-def test_pay_amortized_payments():
+def test_can_compute_amortization_schedule(payment_token, identity_registry):
+    # Arrange
+    account = get_account()
+    account1 = accounts.add(config["wallets"]["from_key"])
+    face_value = 100
+    asset = Asset.deploy(1e6, "Test", "Test", identity_registry, {"from": account1})
+    parameters = Parameters.deploy(
+        100, 8, asset, payment_token, identity_registry, {"from": account1}
+    )
+    token = REIMBURSEMENT.deploy(
+        5,  # Amortization
+        4,  # Monthly
+        parameters,
+        chain.time() + 5 * 31556952,
+        face_value,
+        10,
+        {"from": account1},
+    )
+    schedule = amortization_schedule(
+        [face_value], [token.periodicInterestRate()], [token.loanTerm()]
+    )
+    # Act
+    token.computeAmortizationSchedule({"from": account1})
+    # Assert
+    assert token.getPeriodicPayment() == schedule["periodic_payment"][0]
+    # Checking 'Rate Change Rebalances Schedule' Condition
+    token.modifyAmortizedInterestRate(15, {"from": account1})
+    schedule = amortization_schedule(
+        [face_value], [token.calculatePeriodicInterestRate(15)], [token.loanTerm()]
+    )
+    assert token.getPeriodicPayment() == schedule["periodic_payment"][0]
+    # Checking 'Only Owner' Condition
+    with pytest.raises(exceptions.VirtualMachineError):
+        token.computeAmortizationSchedule({"from": account})
+    with pytest.raises(exceptions.VirtualMachineError):
+        token.modifyAmortizedInterestRate(15, {"from": account})
+
+
+def test_pay_amortized_payments(deployment):
     # Arrange
     account = get_account()
     account1 = accounts.add(config["wallets"]["from_key"])
     account2 = get_account(2)
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     token_name = "Test"
     token_symbol = "Test"
     reimburse_state = 5  # Amortization
@@ -421,12 +459,12 @@ def test_pay_amortized_payments():
     # ---------------------------------------------
 
 
-def test_can_pay_amortized_payments_to_all():
+def test_can_pay_amortized_payments_to_all(deployment):
     # Arrange
     account = get_account()
     account1 = accounts.add(config["wallets"]["from_key"])
     account2 = get_account(2)
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     token_name = "Test"
     token_symbol = "Test"
     reimburse_state = 5  # Amortization
@@ -497,11 +535,11 @@ def test_can_pay_amortized_payments_to_all():
     assert payment_token.balanceOf(account2) == amount * monthly * 2
 
 
-def test_cannot_pay_amortized_payments_after_maturity():
+def test_cannot_pay_amortized_payments_after_maturity(deployment):
     # Arrange
     account = get_account()
     account1 = accounts.add(config["wallets"]["from_key"])
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     token_name = "Test"
     token_symbol = "Test"
     reimburse_state = 5  # Amortization
@@ -546,12 +584,12 @@ def test_cannot_pay_amortized_payments_after_maturity():
         token.payAmortizedPayments(account, {"from": account1})
 
 
-def test_can_call_token():
+def test_can_call_token(deployment):
     # Arrange
     account = get_account()
     account1 = accounts.add(config["wallets"]["from_key"])
     account2 = get_account(2)
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     token_name = "Test"
     token_symbol = "Test"
     reimburse_state = 4  # Fixed maturity with put and call
@@ -631,12 +669,12 @@ def test_can_call_token():
     # ---------------------------------------------
 
 
-def test_can_call_token_from_all():
+def test_can_call_token_from_all(deployment):
     # Arrange
     account = get_account()
     account1 = accounts.add(config["wallets"]["from_key"])
     account2 = get_account(2)
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     token_name = "Test"
     token_symbol = "Test"
     reimburse_state = 4  # Fixed maturity with put and call
@@ -717,11 +755,11 @@ def test_can_call_token_from_all():
     # ---------------------------------------------
 
 
-def test_can_set_put_period():
+def test_can_set_put_period(deployment):
     # Arrange
     account = get_account()
     account1 = accounts.add(config["wallets"]["from_key"])
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     token_name = "Test"
     token_symbol = "Test"
     reimburse_state = 4  # Fixed maturity with put and call
@@ -820,12 +858,12 @@ def test_can_set_put_period():
     # ---------------------------------------------
 
 
-def test_can_put_debt():
+def test_can_put_debt(deployment):
     # Arrange
     account = get_account()
     account1 = accounts.add(config["wallets"]["from_key"])
     account2 = get_account(2)
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     debt_name = "Test"
     debt_symbol = "Test"
     reimburse_state = 4  # Fixed maturity with put and call
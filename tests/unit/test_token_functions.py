@@ -1,7 +1,9 @@
 from scripts.helpfulscripts import get_account
-from scripts.deploy import deploy
+from scripts.amortization import amortization_schedule
+from scripts.pay_in_batches import drain_payment_period, drain_maturity
 from brownie import (
     Token,
+    Asset,
     ERC20Mock,
     PaymentToken,
     exceptions,
@@ -308,11 +310,11 @@ import pytest
 #         token2.redeemToken(100, {"from": account})
 
 
-def test_cannot_pay_interest_if_amortized():
+def test_cannot_pay_interest_if_amortized(deployment):
     # Arrange
     account = get_account()
     account1 = accounts.add(config["wallets"]["from_key"])
-    (payment_token, identityRegistry) = deploy()
+    (payment_token, identityRegistry) = deployment
     token_name = "Test"
     token_symbol = "Test"
     initial_supply = 1e12
@@ -1968,3 +1970,248 @@ def test_cannot_pay_interest_if_amortized():
 #     with pytest.raises(exceptions.VirtualMachineError):
 #         token1.setPutPeriod(start_date, end_date, {"from": account1})
 #     # ---------------------------------------------
+
+
+def test_can_pay_interest_to_range_of_token_holders(deployment):
+    # Arrange
+    account = get_account()
+    account1 = accounts.add(config["wallets"]["from_key"])
+    account2 = get_account(2)
+    (payment_token, identityRegistry) = deployment
+    face_value = 100
+    interest_rate = 1000
+    token = Token.deploy(
+        "Test",
+        "Test",
+        1e12,
+        (0, 1, 1, 1),  # Redeemable, Fixed Maturity, Daily, Fixed
+        chain.time() + 31556952,
+        payment_token.address,
+        identityRegistry.address,
+        100,
+        face_value,
+        interest_rate,
+        {"from": account},
+    )
+    payment = face_value * interest_rate
+    payment_token.transfer(token, payment * 3, {"from": account1})
+    token.issueToken(100, account, {"from": account})
+    token.issueToken(100, account1, {"from": account})
+    token.issueToken(100, account2, {"from": account})
+    account1_balance = payment_token.balanceOf(account1)
+    chain.sleep(86400 + 60 * 60 * 12)
+    chain.mine(1)
+    # Act
+    tx = token.payInterestToRange(0, 2, {"from": account})
+    # Assert
+    assert token.paymentPeriodToCursor(1) == 2
+    assert [e["investor"] for e in tx.events["InterestPaid"]] == [account, account1]
+    assert tx.events["InterestPaid"][0]["paymentPeriod"] == 1
+    assert tx.events["InterestPaid"][0]["amount"] == payment
+    assert payment_token.balanceOf(account) == payment
+    assert payment_token.balanceOf(account1) == account1_balance + payment
+    assert payment_token.balanceOf(account2) == 0
+    token.payInterestToRange(0, 3, {"from": account})
+    assert token.paymentPeriodToCursor(1) == 3
+    assert payment_token.balanceOf(account) == payment
+    assert payment_token.balanceOf(account2) == payment
+    assert payment_token.balanceOf(token) == 0
+    with pytest.raises(exceptions.VirtualMachineError):
+        token.payInterestToRange(0, 0, {"from": account})
+    with pytest.raises(exceptions.VirtualMachineError):
+        token.payInterestToRange(0, 3, {"from": account2})
+
+
+def test_can_drain_payouts_when_holders_exit(payment_token, identity_registry):
+    # Arrange
+    account = get_account()
+    account1 = accounts.add(config["wallets"]["from_key"])
+    account2 = get_account(2)
+    face_value = 100
+    interest_rate = 1000
+    token = Token.deploy(
+        "Test",
+        "Test",
+        1e12,
+        (0, 1, 1, 1),  # Redeemable, Fixed Maturity, Daily, Fixed
+        chain.time() + 31556952,
+        payment_token.address,
+        identity_registry.address,
+        100,
+        face_value,
+        interest_rate,
+        {"from": account},
+    )
+    asset = Asset.at(token.getAddress())
+    payment = face_value * interest_rate
+    # payInterestToRange requires funds for every holder of the range, paid or not
+    payment_token.transfer(token, payment * 4, {"from": account1})
+    token.issueToken(100, account, {"from": account})
+    token.issueToken(100, account1, {"from": account})
+    token.issueToken(100, account2, {"from": account})
+    chain.sleep(86400 + 60 * 60 * 12)
+    chain.mine(1)
+    exited = []
+
+    def pay_then_exit(start, count, tx_params):
+        tx = token.payInterestToRange(start, count, tx_params)
+        if not exited:
+            # account leaves after being paid, account2 takes its slot below the cursor
+            asset.transfer(account1, 100, {"from": account})
+            exited.append(account)
+        return tx
+
+    # Act
+    batches = drain_payment_period(token, pay_then_exit, account, 2)
+    # Assert
+    assert [start for (start, _, _) in batches] == [0, 0]
+    assert asset.getTokenHolders() == [account2, account1]
+    assert token.investorToPaymentPeriodToStatus(account2, 1)
+    assert payment_token.balanceOf(account2) == payment
+    assert payment_token.balanceOf(token) == payment
+    # Checking 'Holder Exits During Maturity Payments' Condition
+    chain.sleep(31556952)
+    chain.mine(1)
+    maturity_exited = []
+
+    def pay_at_maturity_then_exit(start, count, tx_params):
+        tx = token.payAtMaturityToRange(start, count, tx_params)
+        if not maturity_exited:
+            # account2 leaves after being paid, account1 takes its slot below the cursor
+            asset.transfer(account1, 100, {"from": account2})
+            maturity_exited.append(account2)
+        return tx
+
+    account1_balance = payment_token.balanceOf(account1)
+    batches = drain_maturity(token, pay_at_maturity_then_exit, account, 1)
+    assert [start for (start, _, _) in batches] == [0, 0]
+    assert asset.getTokenHolders() == [account1]
+    assert token.investorToMaturityPaymentStatus(account2)
+    assert token.investorToMaturityPaymentStatus(account1)
+    assert payment_token.balanceOf(account2) == payment + face_value * 100
+    assert payment_token.balanceOf(account1) == account1_balance + face_value * 300
+
+
+def test_can_read_packed_configuration(payment_token, identity_registry):
+    # Arrange
+    account = get_account()
+    maturity_date = chain.time() + 31556952
+    # Act
+    token = Token.deploy(
+        "Test",
+        "Test",
+        1e12,
+        (0, 4, 1, 1),  # Redeemable, Fixed Maturity With Put And Call, Daily, Fixed
+        maturity_date,
+        payment_token.address,
+        identity_registry.address,
+        100,
+        100,
+        1000,
+        {"from": account},
+    )
+    start_date = chain.time() + 86400
+    token.setPutPeriod(start_date, start_date + 86400, {"from": account})
+    # Assert
+    assert token.redemptionState() == 0
+    assert token.reimbursementState() == 4
+    assert token.paymentFrequency() == 1
+    assert token.interestType() == 1
+    assert token.perpetualStatus() is False
+    assert token.maturityDate() == maturity_date
+    assert token.contractDeploymentTime() == token.tx.timestamp
+    assert token.startDate() == start_date
+    assert token.endDate() == start_date + 86400
+
+
+def test_can_read_paid_payment_periods_bitmap(payment_token, identity_registry):
+    # Arrange
+    account = get_account()
+    account1 = accounts.add(config["wallets"]["from_key"])
+    face_value = 100
+    interest_rate = 1000
+    token = Token.deploy(
+        "Test",
+        "Test",
+        1e12,
+        (0, 1, 1, 1),  # Redeemable, Fixed Maturity, Daily, Fixed
+        chain.time() + 31556952,
+        payment_token.address,
+        identity_registry.address,
+        100,
+        face_value,
+        interest_rate,
+        {"from": account},
+    )
+    payment_token.transfer(token, face_value * interest_rate * 3, {"from": account1})
+    token.issueToken(100, account, {"from": account})
+    # Act
+    for _ in range(3):
+        chain.sleep(86400)
+        chain.mine(1)
+        token.payInterest(account, {"from": account})
+    # Assert
+    assert token.paidPaymentPeriods(account, 0) == 0b1110
+    assert token.investorToPaymentPeriodToStatus(account, 0) is False
+    assert token.investorToPaymentPeriodToStatus(account, 3) is True
+    assert token.investorToPaymentPeriodToStatus(account, 256) is False
+
+
+def test_can_compute_amortization_schedule(payment_token, identity_registry):
+    # Arrange
+    account = get_account()
+    account2 = get_account(2)
+    face_value = 100
+    options = (0, 5, 4, 3)  # Redeemable, Amortization, Monthly, Variable
+    token = Token.deploy(
+        "Test",
+        "Test",
+        1e12,
+        options,
+        chain.time() + 5 * 31556952,
+        payment_token.address,
+        identity_registry.address,
+        100,
+        face_value,
+        10,
+        {"from": account},
+    )
+    schedule = amortization_schedule(
+        [face_value], [token.periodicInterestRate()], [token.loanTerm()]
+    )
+    # Act
+    token.computeAmortizationSchedule({"from": account})
+    # Assert
+    assert token.getPeriodicPayment() == schedule["periodic_payment"][0]
+    # Checking 'Rate Change Keeps Schedule' Condition
+    periodic_payment = token.getPeriodicPayment()
+    token.modifyInterestRate(15, {"from": account})
+    assert token.interestRate() == 15
+    assert token.getPeriodicPayment() == periodic_payment
+    # Checking 'Rate Change Rebalances Schedule' Condition
+    token.modifyAmortizedInterestRate(15, {"from": account})
+    schedule = amortization_schedule(
+        [face_value], [token.calculatePeriodicInterestRate(15)], [token.loanTerm()]
+    )
+    assert token.getPeriodicPayment() == schedule["periodic_payment"][0]
+    # Checking 'Only Owner' Condition
+    with pytest.raises(exceptions.VirtualMachineError):
+        token.computeAmortizationSchedule({"from": account2})
+    with pytest.raises(exceptions.VirtualMachineError):
+        token.modifyAmortizedInterestRate(15, {"from": account2})
+    # Checking 'Loan Term Shorter Than a Period' Condition
+    token1 = Token.deploy(
+        "Test",
+        "Test",
+        1e12,
+        options,
+        chain.time() + 10 * 86400,
+        payment_token.address,
+        identity_registry.address,
+        100,
+        face_value,
+        10,
+        {"from": account},
+    )
+    with pytest.raises(exceptions.VirtualMachineError):
+        token1.computeAmortizationSchedule({"from": account})
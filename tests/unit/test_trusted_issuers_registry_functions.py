@@ -0,0 +1,64 @@
+from scripts.helpfulscripts import get_account
+from brownie import TrustedIssuersRegistry, accounts, exceptions
+import pytest
+
+
+def test_can_remove_trusted_issuers_and_claim_topics():
+    # Arrange
+    account = get_account()
+    trustedIssuersRegistry = TrustedIssuersRegistry.deploy({"from": account})
+    (issuerA, issuerB, issuerC, issuerD) = [accounts.add().address for _ in range(4)]
+    trustedIssuersRegistry.addTrustedIssuer(issuerA, [1, 2], {"from": account})
+    trustedIssuersRegistry.addTrustedIssuer(issuerB, [1, 3], {"from": account})
+    trustedIssuersRegistry.addTrustedIssuer(issuerC, [1, 2], {"from": account})
+    trustedIssuersRegistry.addTrustedIssuer(issuerD, [2], {"from": account})
+    # Act
+    # Removing the middle issuer swaps the last issuer into its position
+    trustedIssuersRegistry.removeTrustedIssuer(issuerB, {"from": account})
+    # Assert
+    assert trustedIssuersRegistry.getTrustedIssuers() == [issuerA, issuerD, issuerC]
+    assert not trustedIssuersRegistry.isTrustedIssuer(issuerB)
+    assert not trustedIssuersRegistry.hasClaimTopic(issuerB, 1)
+    assert not trustedIssuersRegistry.hasClaimTopic(issuerB, 3)
+    assert trustedIssuersRegistry.getTrustedIssuersForClaimTopic(1) == [
+        issuerA,
+        issuerC,
+    ]
+    assert trustedIssuersRegistry.getTrustedIssuersForClaimTopic(3) == []
+    # Checking 'First Issuer Removed' Condition
+    trustedIssuersRegistry.removeTrustedIssuer(issuerA, {"from": account})
+    assert trustedIssuersRegistry.getTrustedIssuers() == [issuerC, issuerD]
+    assert not trustedIssuersRegistry.isTrustedIssuer(issuerA)
+    assert trustedIssuersRegistry.isTrustedIssuer(issuerC)
+    assert trustedIssuersRegistry.isTrustedIssuer(issuerD)
+    assert trustedIssuersRegistry.getTrustedIssuersForClaimTopic(1) == [issuerC]
+    assert trustedIssuersRegistry.getTrustedIssuersForClaimTopic(2) == [
+        issuerD,
+        issuerC,
+    ]
+    # Checking 'Last Issuer Removed' Condition
+    trustedIssuersRegistry.removeTrustedIssuer(issuerD, {"from": account})
+    assert trustedIssuersRegistry.getTrustedIssuers() == [issuerC]
+    assert not trustedIssuersRegistry.isTrustedIssuer(issuerD)
+    assert not trustedIssuersRegistry.hasClaimTopic(issuerD, 2)
+    assert trustedIssuersRegistry.getTrustedIssuersForClaimTopic(2) == [issuerC]
+    # Checking 'Claim Topics Shrunk' Condition
+    trustedIssuersRegistry.updateIssuerClaimTopics(issuerC, [2], {"from": account})
+    assert trustedIssuersRegistry.getTrustedIssuerClaimTopics(issuerC) == [2]
+    assert not trustedIssuersRegistry.hasClaimTopic(issuerC, 1)
+    assert trustedIssuersRegistry.hasClaimTopic(issuerC, 2)
+    assert trustedIssuersRegistry.getTrustedIssuersForClaimTopic(1) == []
+    assert trustedIssuersRegistry.getTrustedIssuersForClaimTopic(2) == [issuerC]
+    # Checking 'Issuer Added Back' Condition
+    trustedIssuersRegistry.addTrustedIssuer(issuerA, [1, 2], {"from": account})
+    trustedIssuersRegistry.removeTrustedIssuer(issuerC, {"from": account})
+    assert trustedIssuersRegistry.getTrustedIssuers() == [issuerA]
+    assert trustedIssuersRegistry.hasClaimTopic(issuerA, 1)
+    assert trustedIssuersRegistry.hasClaimTopic(issuerA, 2)
+    assert trustedIssuersRegistry.getTrustedIssuersForClaimTopic(1) == [issuerA]
+    assert trustedIssuersRegistry.getTrustedIssuersForClaimTopic(2) == [issuerA]
+    # Checking 'Not a Trusted Issuer' Condition
+    with pytest.raises(exceptions.VirtualMachineError):
+        trustedIssuersRegistry.removeTrustedIssuer(issuerC, {"from": account})
+    with pytest.raises(exceptions.VirtualMachineError):
+        trustedIssuersRegistry.getTrustedIssuerClaimTopics(issuerC)
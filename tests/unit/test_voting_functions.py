@@ -1,5 +1,6 @@
 from scripts.helpfulscripts import get_account
-from brownie import Voting, exceptions
+from scripts.vote_aggregator import aggregate, sign_vote, vote_tuple
+from brownie import Voting, Asset, exceptions, chain, accounts, config
 import pytest
 
 
@@ -250,3 +251,172 @@ def test_can_handle_tied_vote():
     voting.calculateWinningOption(0, {"from": account})
     # Assert
     assert voting.viewBallotResult(0) == "Tied Vote"
+
+
+def test_can_track_leading_option_while_voting():
+    # Arrange
+    account = get_account()
+    account1 = get_account(1)
+    account2 = get_account(2)
+    account3 = get_account(3)
+    voting = Voting.deploy({"from": account})
+    voting.createBallot(
+        "Which color is the best?",
+        ["Black", "Blue", "Orange"],
+        1709181605,
+        400,
+        {"from": account},
+    )
+    voting.createVoter(2, account1, {"from": account})
+    voting.createVoter(2, account2, {"from": account})
+    voting.createVoter(1, account3, {"from": account})
+    voting.startVoting(0, {"from": account})
+    # Act
+    with pytest.raises(exceptions.VirtualMachineError):
+        voting.castVote(0, 3, {"from": account1})
+    voting.castVote(0, 1, {"from": account1})
+    voting.castVote(0, 2, {"from": account2})
+    # Assert
+    assert voting.ballots(0)[5] == 1
+    assert voting.ballots(0)[6] == 2
+    assert voting.ballots(0)[7] == True
+    voting.castVote(0, 2, {"from": account3})
+    assert voting.ballots(0)[5] == 2
+    assert voting.ballots(0)[6] == 3
+    assert voting.ballots(0)[7] == False
+    voting.endVoting(0, {"from": account})
+    assert voting.viewBallotResult(0) == "Orange"
+
+
+def test_can_vote_with_asset_balance_snapshot(identity_registry):
+    # Arrange
+    account = get_account()
+    account1 = get_account(1)
+    account2 = get_account(2)
+    account3 = get_account(3)
+    holder = accounts.add(config["wallets"]["from_key"])
+    voting = Voting.deploy({"from": account})
+    asset = Asset.deploy(
+        1000, "Token", "Symbol", identity_registry.address, {"from": account1}
+    )
+    # Checking 'Checkpoint Schedule Not Set' Condition
+    with pytest.raises(exceptions.VirtualMachineError):
+        voting.createSnapshotBallot(
+            "Yes or No?", ["Yes", "No"], 1709181605, 400, asset, {"from": account}
+        )
+    asset.setCheckpointSchedule(chain[-1].timestamp, 86400, {"from": account1})
+    asset.transfer(account, 400, {"from": account1})
+    asset.transfer(account2, 300, {"from": account1})
+    chain.sleep(86400)
+    chain.mine(1)
+    voting.createSnapshotBallot(
+        "Yes or No?", ["Yes", "No"], 1709181605, 400, asset, {"from": account}
+    )
+    voting.startVoting(0, {"from": account})
+    # Shares issued after the snapshot carry no votes
+    asset.transfer(holder, 200, {"from": account1})
+    # Act
+    voting.delegateVote(account3, 0, {"from": account2})
+    voting.castVote(0, 1, {"from": account3})
+    voting.castVote(0, 0, {"from": account})
+    # Assert
+    assert voting.ballotSnapshot(0) == 1
+    assert voting.voteWeight(0, account3) == 300
+    assert voting.tally(0, 0) == 400
+    assert voting.tally(0, 1) == 300
+    assert voting.voteWeight(0, holder) == 0
+    with pytest.raises(exceptions.VirtualMachineError):
+        voting.castVote(0, 1, {"from": holder})
+    # Checking 'Unissued Supply' Condition
+    assert voting.voteWeight(0, account1) == 0
+    with pytest.raises(exceptions.VirtualMachineError):
+        voting.castVote(0, 1, {"from": account1})
+    with pytest.raises(exceptions.VirtualMachineError):
+        voting.castVote(0, 1, {"from": account2})
+    voting.endVoting(0, {"from": account})
+    assert voting.viewBallotResult(0) == "Yes"
+
+
+def test_can_cast_votes_by_signature():
+    # Arrange
+    account = get_account()
+    voter1 = accounts.add()
+    voter2 = accounts.add()
+    voter3 = accounts.add()
+    voting = Voting.deploy({"from": account})
+    for _ in range(2):
+        voting.createBallot(
+            "Yes or No?", ["Yes", "No"], 1709181605, 400, {"from": account}
+        )
+    voting.createVoter(2, voter1, {"from": account})
+    voting.createVoter(1, voter2, {"from": account})
+    voting.createVoter(1, voter3, {"from": account})
+    voting.startVoting(0, {"from": account})
+    voting.startVoting(1, {"from": account})
+    votes = [
+        sign_vote(
+            voter1.private_key,
+            {"ballot": 1, "option": 0, "voter": voter1.address, "nonce": 1},
+            voting.address,
+            chain.id,
+        ),
+        sign_vote(
+            voter1.private_key,
+            {"ballot": 0, "option": 1, "voter": voter1.address, "nonce": 0},
+            voting.address,
+            chain.id,
+        ),
+        sign_vote(
+            voter2.private_key,
+            {"ballot": 0, "option": 0, "voter": voter2.address, "nonce": 0},
+            voting.address,
+            chain.id,
+        ),
+    ]
+    # Signed by voter2 on behalf of voter1
+    forged = sign_vote(
+        voter2.private_key,
+        {"ballot": 0, "option": 0, "voter": voter1.address, "nonce": 0},
+        voting.address,
+        chain.id,
+    )
+    # Ballot 0 has no option 5, the later nonce of voter3 cannot be used without it
+    unknown_option = [
+        sign_vote(
+            voter3.private_key,
+            {"ballot": 0, "option": 5, "voter": voter3.address, "nonce": 0},
+            voting.address,
+            chain.id,
+        ),
+        sign_vote(
+            voter3.private_key,
+            {"ballot": 1, "option": 0, "voter": voter3.address, "nonce": 1},
+            voting.address,
+            chain.id,
+        ),
+    ]
+    # Checking 'Signer Is Not The Voter' Condition
+    with pytest.raises(exceptions.VirtualMachineError):
+        voting.castVotesBySig([vote_tuple(forged)], {"from": account})
+    # Checking 'Option Does Not Exist' Condition
+    with pytest.raises(exceptions.VirtualMachineError):
+        voting.castVotesBySig([vote_tuple(unknown_option[0])], {"from": account})
+    # Checking 'Nonce Out Of Order' Condition
+    with pytest.raises(exceptions.VirtualMachineError):
+        voting.castVotesBySig([vote_tuple(votes[0])], {"from": account})
+    # Act
+    accepted = aggregate(
+        voting, [forged] + votes + [votes[2]] + unknown_option, chain.id, workers=1
+    )
+    voting.castVotesBySig([vote_tuple(vote) for vote in accepted], {"from": account})
+    # Assert
+    assert [vote["nonce"] for vote in accepted] == [0, 0, 1]
+    assert voting.tally(0, 1) == 2
+    assert voting.tally(0, 0) == 1
+    assert voting.tally(1, 0) == 2
+    assert voting.nonces(voter1) == 2
+    assert voting.nonces(voter2) == 1
+    assert voting.nonces(voter3) == 0
+    # Checking 'Replayed Vote' Condition
+    with pytest.raises(exceptions.VirtualMachineError):
+        voting.castVotesBySig([vote_tuple(votes[2])], {"from": account})